@@ -8,8 +8,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .async_sampling import AsyncRiquSamplingBackend, AsyncRiquSamplingJob
+from .cache import RiquJobCache
+from .clients import RiquClientRegistry, default_client_registry
+from .polling import RiquJobPoller
+from .qasm import RiquQasmCache, RiquQasmTemplate
 from .sampling import (
+    RiquBatchSubmissionError,
+    RiquCompositeSamplingJob,
     RiquConfig,
+    RiquPollingStrategy,
     RiquSamplingBackend,
     RiquSamplingJob,
     RiquSamplingResult,
@@ -17,9 +25,20 @@ from .sampling import (
 from .sse import RiquSseJob
 
 __all__ = [
+    "AsyncRiquSamplingBackend",
+    "AsyncRiquSamplingJob",
+    "RiquBatchSubmissionError",
+    "RiquClientRegistry",
+    "RiquCompositeSamplingJob",
     "RiquConfig",
+    "RiquJobCache",
+    "RiquJobPoller",
+    "RiquPollingStrategy",
+    "RiquQasmCache",
+    "RiquQasmTemplate",
     "RiquSamplingBackend",
     "RiquSamplingJob",
     "RiquSamplingResult",
     "RiquSseJob",
+    "default_client_registry",
 ]
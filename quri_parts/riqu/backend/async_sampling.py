@@ -0,0 +1,367 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A module to perform sampling on riqu server from an asyncio event loop.
+
+Examples:
+    To submit many circuits concurrently and wait for all of them, run the
+    following code:
+
+    .. highlight:: python
+    .. code-block:: python
+
+        import asyncio
+
+        from quri_parts.circuit import QuantumCircuit
+        from quri_parts.riqu.backend import AsyncRiquSamplingBackend
+
+        circuit = QuantumCircuit(2)
+        circuit.add_H_gate(0)
+        circuit.add_CNOT_gate(0, 1)
+
+        async def main():
+            backend = AsyncRiquSamplingBackend()
+            jobs = await asyncio.gather(
+                *[backend.sample(circuit, n_shots=1000) for _ in range(100)]
+            )
+            results = await asyncio.gather(*[job.result() for job in jobs])
+            print([result.counts for result in results])
+
+        asyncio.run(main())
+"""
+
+import asyncio
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, Union
+
+from quri_parts.backend import BackendError
+from quri_parts.circuit import NonParametricQuantumCircuit
+
+from ..rest import AsyncJobApi, Job, JobsBody
+from .cache import RiquJobCache
+from .qasm import RiquQasmCache
+from .sampling import (
+    JOB_FINAL_STATUS,
+    RiquConfig,
+    RiquPollingStrategy,
+    RiquSamplingResult,
+    _circuit_to_qasm,
+    _create_job_api,
+    _create_job_cache,
+    _resolve_config,
+    _RiquJobProperties,
+    _select_polling_strategy,
+)
+
+
+async def _run_in_executor(
+    job_api: AsyncJobApi, func: Callable[..., Any], *args: Any
+) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(job_api.executor, functools.partial(func, *args))
+
+
+async def _get_cached_job(
+    job_api: AsyncJobApi, job_cache: Optional[RiquJobCache], job_id: str
+) -> Optional[Job]:
+    """Looks the job up in the job cache on the executor of ``job_api``, so
+    that the event loop is not blocked by the database."""
+    if job_cache is None:
+        return None
+    job: Optional[Job] = await _run_in_executor(job_api, job_cache.get, job_id)
+    return job
+
+
+async def _put_cached_job(
+    job_api: AsyncJobApi, job_cache: Optional[RiquJobCache], job: Job
+) -> None:
+    """Stores a finished job to the job cache on the executor of
+    ``job_api``."""
+    if job_cache is not None and job.status in JOB_FINAL_STATUS:
+        await _run_in_executor(job_api, job_cache.put, job)
+
+
+class AsyncRiquSamplingJob(_RiquJobProperties):
+    """An asyncio job for a riqu sampling measurement.
+
+    Args:
+        job: A :class:`Job` retrieved from riqu server.
+        job_api: An :class:`AsyncJobApi` to communicate with riqu server.
+        polling_strategy: The default :class:`RiquPollingStrategy` used by
+            :meth:`wait_for_completion` and :meth:`result`.
+        job_cache: A :class:`RiquJobCache` consulted by :meth:`refresh` before
+            querying riqu server.
+
+    Raises:
+        ValueError: If ``job`` or ``job_api`` is None.
+    """
+
+    def __init__(
+        self,
+        job: Job,
+        job_api: AsyncJobApi,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+        job_cache: Optional[RiquJobCache] = None,
+    ):
+        super().__init__()
+
+        if job is None:
+            raise ValueError("job should not be None.")
+        self._job: Job = job
+
+        if job_api is None:
+            raise ValueError("job_api should not be None.")
+        self._job_api: AsyncJobApi = job_api
+
+        self._polling_strategy = polling_strategy
+        self._poll_intervals: list[float] = []
+        self._job_cache = job_cache
+
+    @property
+    def poll_intervals(self) -> list[float]:
+        """Intervals in seconds slept between queries while waiting for the
+        job, in the order they were chosen."""
+        return list(self._poll_intervals)
+
+    async def refresh(self) -> None:
+        """Retrieves the latest job information from riqu server.
+
+        If the job is found in the job cache, riqu server is not queried.
+        """
+        try:
+            cached = await _get_cached_job(self._job_api, self._job_cache, self._job.id)
+            if cached is not None:
+                self._job = cached
+                return
+            self._job = await self._job_api.get_job(self._job.id)
+            await _put_cached_job(self._job_api, self._job_cache, self._job)
+        except Exception as e:
+            raise BackendError("To refresh job is failed.") from e
+
+    async def wait_for_completion(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+    ) -> Optional[Job]:
+        """Waits until the job progress to the end such as ``success`` or
+        ``failure``, ``cancelled``.
+
+        The event loop is released while waiting between queries.
+        See :meth:`RiquSamplingJob.wait_for_completion` for details.
+
+        Args:
+            timeout: The number of seconds to wait for job.
+            wait: Time in seconds between queries.
+            polling_strategy: The :class:`RiquPollingStrategy` to decide time
+                between queries.
+        """
+        schedule = _select_polling_strategy(
+            polling_strategy, wait, self._polling_strategy
+        ).schedule()
+        start_time = time.monotonic()
+        await self.refresh()
+        while self._job.status not in JOB_FINAL_STATUS:
+            # check timeout
+            elapsed_time = time.monotonic() - start_time
+            if timeout is not None and elapsed_time >= timeout:
+                return None
+
+            # sleep and get job
+            interval = schedule.next_interval(self._job.status)
+            if timeout is not None:
+                interval = min(interval, timeout - elapsed_time)
+            self._poll_intervals.append(interval)
+            await asyncio.sleep(interval)
+            await self.refresh()
+
+        return self._job
+
+    async def result(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+    ) -> RiquSamplingResult:
+        """Waits until the job progress to the end and returns the result of
+        the job.
+
+        See :meth:`RiquSamplingJob.result` for details.
+
+        Args:
+            timeout: The number of seconds to wait for job.
+            wait: Time in seconds between queries.
+            polling_strategy: The :class:`RiquPollingStrategy` to decide time
+                between queries.
+
+        Raises:
+            BackendError: If job cannot be found or if an authentication error occurred
+                or timeout occurs, etc.
+        """
+        if self._job.status not in JOB_FINAL_STATUS:
+            job = await self.wait_for_completion(timeout, wait, polling_strategy)
+            if job is None:
+                raise BackendError(f"Timeout occurred after {timeout} seconds.")
+            elif job.status in ["failure", "cancelled"]:
+                raise BackendError(f"Job ended with status {job.status}.")
+            else:
+                self._job = job
+
+        return self._sampling_result()
+
+    async def cancel(self) -> None:
+        """Cancels the job.
+
+        Raises:
+            BackendError: If job cannot be found or if an authentication error occurred
+                or if job cannot be cancelled, etc.
+        """
+        try:
+            await self._job_api.put_jobs_job_id_cancel(self._job.id)
+            await self.refresh()
+        except Exception as e:
+            raise BackendError("To cancel job is failed.") from e
+
+    def __repr__(self) -> str:
+        return self._job.to_str()
+
+
+class AsyncRiquSamplingBackend:
+    """An asyncio riqu backend for a sampling measurement.
+
+    HTTP requests are performed on a bounded executor through the urllib3
+    connection pool, so a single event loop can keep many submissions and
+    polls in flight while waiting between polls does not occupy any thread.
+
+    Args:
+        config: A :class:`RiquConfig` for circuit execution.
+            If this parameter is ``None``, the configuration is read in the same way
+            as :class:`RiquSamplingBackend`.
+        executor: An executor to perform HTTP requests on.
+            If this parameter is ``None``, a thread pool sized to the connection pool
+            is created on first use.
+        polling_strategy: The default :class:`RiquPollingStrategy` of the jobs
+            created by this backend.
+        qasm_cache: A :class:`RiquQasmCache` to reuse OpenQASM 3.0 programs of
+            circuits already submitted. If ``None``, a cache with the default
+            bounds is created for this backend.
+    """
+
+    def __init__(
+        self,
+        config: Optional[RiquConfig] = None,
+        executor: Optional[Executor] = None,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+        qasm_cache: Optional[RiquQasmCache] = None,
+    ):
+        super().__init__()
+
+        config = _resolve_config(config)
+        self._job_api: AsyncJobApi = AsyncJobApi(
+            _create_job_api(config), executor=executor
+        )
+        self._polling_strategy = polling_strategy
+        self._qasm_cache = RiquQasmCache() if qasm_cache is None else qasm_cache
+        self._job_cache = _create_job_cache(config)
+
+    def close(self) -> None:
+        """Shuts down the executor HTTP requests are performed on, if it was
+        created by this backend.
+
+        The backend can also be used as an asynchronous context manager, which
+        calls this method on exit.
+        """
+        self._job_api.close()
+
+    async def __aenter__(self) -> "AsyncRiquSamplingBackend":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def sample(
+        self,
+        circuit: Union[NonParametricQuantumCircuit, list[NonParametricQuantumCircuit]],
+        n_shots: int,
+        transpiler: Optional[str] = "normal",
+        remark: Optional[str] = None,
+    ) -> AsyncRiquSamplingJob:
+        """Perform a sampling measurement of a circuit.
+
+        See :meth:`RiquSamplingBackend.sample` for details.
+
+        Raises:
+            ValueError: If ``n_shots`` is not a positive integer.
+            BackendError: If job is wrong or if an authentication error occurred, etc.
+        """
+        qasm_str, job_type = _circuit_to_qasm(circuit, self._qasm_cache)
+        return await self.sample_qasm(qasm_str, n_shots, transpiler, remark, job_type)
+
+    async def sample_qasm(
+        self,
+        qasm: Union[str, list[str]],
+        n_shots: int,
+        transpiler: Optional[str] = "normal",
+        remark: Optional[str] = None,
+        job_type: Optional[str] = None,
+    ) -> AsyncRiquSamplingJob:
+        """Perform a sampling measurement of a OpenQASM 3.0 program.
+
+        See :meth:`RiquSamplingBackend.sample_qasm` for details.
+
+        Raises:
+            ValueError: If ``n_shots`` is not a positive integer.
+            BackendError: If job is wrong or if an authentication error occurred, etc.
+        """
+        if not n_shots >= 1:
+            raise ValueError("n_shots should be a positive integer.")
+
+        try:
+            body = JobsBody(
+                qasm=qasm,
+                shots=n_shots,
+                transpiler=transpiler,
+                remark=remark,
+                job_type=job_type,
+            )
+            response_post_job = await self._job_api.post_job(body=body)
+            response = await self._job_api.get_job(response_post_job.job_id)
+        except Exception as e:
+            raise BackendError("To perform sampling on riqu server is failed.") from e
+
+        return AsyncRiquSamplingJob(
+            response, self._job_api, self._polling_strategy, self._job_cache
+        )
+
+    async def retrieve_job(self, job_id: str) -> AsyncRiquSamplingJob:
+        """Retrieves the job with the given id from riqu server.
+
+        If the job is found in the job cache, riqu server is not queried.
+
+        Args:
+            job_id: The id of the job to retrieve.
+
+        Raises:
+            BackendError: If job cannot be found or if an authentication error occurred,
+                etc.
+        """
+        try:
+            response = await _get_cached_job(self._job_api, self._job_cache, job_id)
+            if response is None:
+                response = await self._job_api.get_job(job_id)
+                await _put_cached_job(self._job_api, self._job_cache, response)
+        except Exception as e:
+            raise BackendError("To retrieve_job from riqu server is failed.") from e
+
+        return AsyncRiquSamplingJob(
+            response, self._job_api, self._polling_strategy, self._job_cache
+        )
@@ -0,0 +1,236 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A module to keep finished riqu jobs on disk."""
+
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from ..rest import Job
+
+#: The file name of the job cache database in ``cache_dir``.
+JOB_CACHE_FILE_NAME = "jobs.sqlite3"
+
+
+def _encode_job(job: Job) -> str:
+    data: dict[str, Any] = {}
+    for attr in Job.swagger_types:
+        value = getattr(job, attr)
+        if isinstance(value, datetime.datetime):
+            value = value.isoformat()
+        data[attr] = value
+    return json.dumps(data)
+
+
+def _decode_job(text: str) -> Job:
+    data = json.loads(text)
+    for attr, swagger_type in Job.swagger_types.items():
+        value = data.get(attr)
+        if swagger_type == "datetime" and isinstance(value, str):
+            try:
+                data[attr] = datetime.datetime.fromisoformat(value)
+            except ValueError:
+                pass
+    return Job(**data)
+
+
+class RiquJobCache:
+    """A persistent cache of riqu jobs backed by an SQLite database.
+
+    Jobs are keyed by their id. Only jobs in a final status (``success``,
+    ``failure`` or ``cancelled``) should be stored, since a cached job is
+    returned as is without querying riqu server. The result of a job is kept
+    as the ``result`` field of the :class:`Job`, from which it is decoded on
+    demand. When the total size of the cached jobs exceeds ``max_bytes``, the
+    least recently used jobs are evicted.
+
+    The cache also records which job was submitted for each submission key
+    (see :meth:`put_submission`), so that identical submissions can reuse a
+    finished job.
+
+    Args:
+        path: The path of the database file. ``":memory:"`` keeps the cache in
+            memory.
+        max_bytes: The maximum total size of the cached jobs. If ``None``, jobs
+            are never evicted.
+
+    Raises:
+        ValueError: If ``max_bytes`` is negative.
+    """
+
+    def __init__(self, path: str, max_bytes: Optional[int] = 256 * 1024 * 1024):
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes should not be negative.")
+
+        if path != ":memory:":
+            path = os.path.expanduser(os.path.expandvars(path))
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._path = path
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, data TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_accessed ON jobs (accessed)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS submissions ("
+                "key TEXT PRIMARY KEY, job_id TEXT NOT NULL, submitted REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS submissions_submitted "
+                "ON submissions (submitted)"
+            )
+
+    @classmethod
+    def from_cache_dir(
+        cls, cache_dir: str, max_bytes: Optional[int] = 256 * 1024 * 1024
+    ) -> "RiquJobCache":
+        """Opens the job cache in ``cache_dir``, creating it if needed."""
+        return cls(os.path.join(cache_dir, JOB_CACHE_FILE_NAME), max_bytes)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the cached jobs."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM jobs"
+            ).fetchone()
+        return int(row[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM jobs").fetchone()
+        return int(row[0])
+
+    def __contains__(self, job_id: object) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return row is not None
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Returns the cached job with ``job_id``, or ``None`` if it is not
+        cached."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT data FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE jobs SET accessed = ? WHERE id = ?", (time.time(), job_id)
+            )
+        return _decode_job(row[0])
+
+    def put(self, job: Job) -> None:
+        """Stores ``job``, replacing the cached job with the same id."""
+        data = _encode_job(job)
+        size = len(data.encode("utf-8"))
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs (id, data, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (job.id, data, size, time.time()),
+            )
+            if self._max_bytes is not None:
+                self._evict(self._max_bytes)
+
+    def put_submission(
+        self, key: str, job_id: str, max_age: Optional[float] = None
+    ) -> None:
+        """Records that the job with ``job_id`` was submitted for ``key``.
+
+        If ``max_age`` is given, the submissions recorded more than ``max_age``
+        seconds ago are removed, since :meth:`get_submission` with the same
+        ``max_age`` never returns them.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            if max_age is not None:
+                self._connection.execute(
+                    "DELETE FROM submissions WHERE submitted < ?", (now - max_age,)
+                )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO submissions (key, job_id, submitted) "
+                "VALUES (?, ?, ?)",
+                (key, job_id, now),
+            )
+
+    def get_submission(
+        self, key: str, max_age: Optional[float] = None
+    ) -> Optional[str]:
+        """Returns the id of the job submitted for ``key``, or ``None`` if no
+        job was submitted for it within ``max_age`` seconds."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT job_id, submitted FROM submissions WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        job_id, submitted = row
+        if max_age is not None and time.time() - submitted > max_age:
+            return None
+        return str(job_id)
+
+    def remove(self, job_id: str) -> None:
+        """Removes the job with ``job_id`` if it is cached."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def clear(self) -> None:
+        """Removes all the cached jobs and submissions."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM jobs")
+            self._connection.execute("DELETE FROM submissions")
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self, max_bytes: int) -> None:
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM jobs"
+        ).fetchone()
+        if total <= max_bytes:
+            return
+        rows = self._connection.execute(
+            "SELECT id, size FROM jobs ORDER BY accessed"
+        ).fetchall()
+        evicted = []
+        for job_id, size in rows:
+            if total <= max_bytes:
+                break
+            evicted.append((job_id,))
+            total -= size
+        self._connection.executemany("DELETE FROM jobs WHERE id = ?", evicted)
@@ -0,0 +1,121 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A module to share api clients among the objects connecting to riqu
+server."""
+
+import threading
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+from ..rest import ApiClient, Configuration, RateLimit
+from ..rest.throttle import GET_JOB_ENDPOINT, SUBMIT_ENDPOINT
+
+if TYPE_CHECKING:
+    from .sampling import RiquConfig
+
+# the settings of RiquConfig which are passed to the api client
+_CLIENT_SETTINGS = (
+    "url",
+    "api_token",
+    "proxy",
+    "pool_size",
+    "pool_maxsize",
+    "pool_block",
+    "connect_timeout",
+    "read_timeout",
+    "retries",
+    "retry_backoff_factor",
+    "submit_rate",
+    "submit_concurrency",
+    "poll_rate",
+    "poll_concurrency",
+)
+
+
+def _client_key(config: "RiquConfig") -> Hashable:
+    return tuple(getattr(config, name) for name in _CLIENT_SETTINGS)
+
+
+def _create_api_client(config: "RiquConfig") -> ApiClient:
+    rest_config = Configuration()
+    rest_config.host = config.url
+    if config.proxy:
+        rest_config.proxy = config.proxy
+    if config.pool_size is not None:
+        rest_config.connection_pool_size = config.pool_size
+    if config.pool_maxsize is not None:
+        rest_config.connection_pool_maxsize = config.pool_maxsize
+    rest_config.connection_pool_block = config.pool_block
+    rest_config.connect_timeout = config.connect_timeout
+    rest_config.read_timeout = config.read_timeout
+    if config.retries is not None:
+        rest_config.retries = config.retries
+    if config.retry_backoff_factor is not None:
+        rest_config.retry_backoff_factor = config.retry_backoff_factor
+    # Configuration() is a shallow copy of a default instance, so the dict of
+    # the default must not be modified
+    rate_limits = {}
+    if config.submit_rate is not None or config.submit_concurrency is not None:
+        rate_limits[SUBMIT_ENDPOINT] = RateLimit(
+            rate=config.submit_rate, max_in_flight=config.submit_concurrency
+        )
+    if config.poll_rate is not None or config.poll_concurrency is not None:
+        rate_limits[GET_JOB_ENDPOINT] = RateLimit(
+            rate=config.poll_rate, max_in_flight=config.poll_concurrency
+        )
+    rest_config.rate_limits = rate_limits
+    return ApiClient(
+        configuration=rest_config,
+        header_name="q-api-token",
+        header_value=config.api_token,
+    )
+
+
+class RiquClientRegistry:
+    """A registry of :class:`ApiClient` keyed by the endpoint and the
+    credentials.
+
+    Backends and SSE jobs connecting to the same riqu server with the same
+    api token, proxy and connection settings get the same client from the
+    registry, so they share its connection pool (and the TLS sessions in it),
+    its thread pool and its rate limits instead of having their own. The
+    registry is safe to use from multiple threads.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[Hashable, ApiClient] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self, config: "RiquConfig") -> ApiClient:
+        """Returns the client for the riqu server, credentials and connection
+        settings of ``config``, creating it on the first call."""
+        key = _client_key(config)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = _create_api_client(config)
+                self._clients[key] = client
+            return client
+
+    def clear(self) -> None:
+        """Removes all the clients from the registry.
+
+        The clients already handed out stay usable; objects created after this
+        call get new clients.
+        """
+        with self._lock:
+            self._clients.clear()
+
+
+#: The registry used by the backends and SSE jobs of this package.
+default_client_registry = RiquClientRegistry()
@@ -0,0 +1,255 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A module to wait for many riqu jobs at once.
+
+Examples:
+    To wait for many jobs with a single polling thread, run the following code:
+
+    .. highlight:: python
+    .. code-block:: python
+
+        from concurrent.futures import wait
+
+        from quri_parts.riqu.backend import RiquJobPoller, RiquSamplingBackend
+
+        backend = RiquSamplingBackend()
+        jobs = [backend.sample(circuit, n_shots=1000) for circuit in circuits]
+
+        with RiquJobPoller(interval=5.0, max_requests_per_second=10.0) as poller:
+            futures = [poller.watch(job) for job in jobs]
+            wait(futures)
+
+        counts = [job.result().counts for job in jobs]
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+from quri_parts.backend import BackendError
+
+from .sampling import (
+    JOB_FINAL_STATUS,
+    RiquPollingStrategy,
+    RiquSamplingJob,
+    _PollingSchedule,
+)
+
+logger = logging.getLogger(__name__)
+
+#: A callback invoked with the job when it reaches a final status.
+JobCallback = Callable[[RiquSamplingJob], None]
+
+
+class _WatchedJob:
+    def __init__(
+        self,
+        job: RiquSamplingJob,
+        future: "Future[RiquSamplingJob]",
+        callback: Optional[JobCallback],
+        schedule: _PollingSchedule,
+    ) -> None:
+        self.job = job
+        self.future = future
+        self.callback = callback
+        self.schedule = schedule
+
+    def next_poll(self) -> float:
+        # a job which is not loaded yet is retrieved by the polling thread
+        status = self.job.status if self.job.loaded else None
+        return time.monotonic() + self.schedule.next_interval(status)
+
+
+class RiquJobPoller:
+    """Polls a set of riqu jobs from a single scheduler thread until they reach
+    a final status (``success``, ``failure`` or ``cancelled``).
+
+    Each watched job is refreshed every ``interval`` seconds, or at intervals
+    decided by ``polling_strategy``, and the requests to riqu server are spaced
+    so that at most ``max_requests_per_second`` are sent regardless of how many
+    jobs are watched. When a job reaches a final
+    status, the future returned by :meth:`watch` is resolved with the job and
+    the callback, if any, is invoked on the polling thread.
+
+    Args:
+        interval: Time in seconds between queries for the same job.
+        max_requests_per_second: The upper bound of the rate of queries to
+            riqu server. If ``None``, queries are not rate limited.
+        polling_strategy: The :class:`RiquPollingStrategy` to decide time
+            between queries for each job. If given, ``interval`` is ignored.
+        fields: The fields of the jobs to retrieve while they are not finished,
+            e.g. :data:`JOB_STATUS_FIELDS` (see :meth:`RiquSamplingJob.refresh`).
+            If ``None``, all the fields are retrieved at every query.
+
+    Raises:
+        ValueError: If ``interval`` is negative or ``max_requests_per_second``
+            is not positive.
+    """
+
+    def __init__(
+        self,
+        interval: float = 10.0,
+        max_requests_per_second: Optional[float] = 10.0,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        if interval < 0:
+            raise ValueError("interval should not be negative.")
+        if max_requests_per_second is not None and not max_requests_per_second > 0:
+            raise ValueError("max_requests_per_second should be positive.")
+
+        if polling_strategy is None:
+            polling_strategy = RiquPollingStrategy.fixed(interval)
+        self._polling_strategy = polling_strategy
+        self._fields = fields
+        self._min_spacing = (
+            0.0 if max_requests_per_second is None else 1.0 / max_requests_per_second
+        )
+
+        self._queue: list[tuple[float, int, _WatchedJob]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        # the job being refreshed by the polling thread, if any
+        self._in_flight: Optional[_WatchedJob] = None
+
+    @property
+    def pending(self) -> int:
+        """The number of jobs which have not reached a final status yet."""
+        with self._condition:
+            return len(self._queue)
+
+    def watch(
+        self, job: RiquSamplingJob, callback: Optional[JobCallback] = None
+    ) -> "Future[RiquSamplingJob]":
+        """Starts watching ``job``.
+
+        Args:
+            job: The job to watch.
+            callback: A function called with the job when it reaches a final
+                status.
+
+        Returns:
+            A future resolved with ``job`` when it reaches a final status. If
+            retrieving the job from riqu server fails, the future raises
+            :class:`BackendError`.
+
+        Raises:
+            RuntimeError: If the poller is already closed.
+        """
+        future: "Future[RiquSamplingJob]" = Future()
+        watched = _WatchedJob(job, future, callback, self._polling_strategy.schedule())
+        if job.loaded and job.status in JOB_FINAL_STATUS:
+            self._resolve(watched)
+            return future
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The poller is already closed.")
+            self._push(watched, watched.next_poll())
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="riqu-job-poller", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def close(self, cancel_pending: bool = True) -> list[RiquSamplingJob]:
+        """Stops the polling thread.
+
+        Args:
+            cancel_pending: If ``True``, futures of jobs which have not reached a
+                final status are cancelled. If ``False``, they are left pending
+                and are never resolved by this poller, so the returned jobs
+                should be watched by another poller to wait for them.
+
+        Returns:
+            The jobs which have not reached a final status.
+        """
+        with self._condition:
+            self._closed = True
+            pending = [watched for _, _, watched in self._queue]
+            self._queue.clear()
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._condition:
+            # a job being refreshed while closing is not pushed back to the queue
+            if self._in_flight is not None:
+                pending.append(self._in_flight)
+                self._in_flight = None
+        pending = [watched for watched in pending if not watched.future.done()]
+        if cancel_pending:
+            for watched in pending:
+                watched.future.cancel()
+        return [watched.job for watched in pending]
+
+    def __enter__(self) -> "RiquJobPoller":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _push(self, watched: _WatchedJob, when: float) -> None:
+        heapq.heappush(self._queue, (when, next(self._counter), watched))
+
+    def _run(self) -> None:
+        last_request = float("-inf")
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._queue:
+                        when = max(self._queue[0][0], last_request + self._min_spacing)
+                        delay = when - time.monotonic()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+                _, _, watched = heapq.heappop(self._queue)
+                self._in_flight = watched
+
+            last_request = time.monotonic()
+            if watched.future.cancelled():
+                continue
+            try:
+                watched.job.refresh(self._fields)
+            except BackendError as e:
+                if watched.future.set_running_or_notify_cancel():
+                    watched.future.set_exception(e)
+                continue
+
+            if watched.job.status in JOB_FINAL_STATUS:
+                self._resolve(watched)
+            else:
+                with self._condition:
+                    if not self._closed:
+                        self._push(watched, watched.next_poll())
+                        self._in_flight = None
+
+    def _resolve(self, watched: _WatchedJob) -> None:
+        if not watched.future.set_running_or_notify_cancel():
+            return
+        watched.future.set_result(watched.job)
+        if watched.callback is not None:
+            try:
+                watched.callback(watched.job)
+            except Exception:
+                logger.exception("Callback for job %s raised an error.", watched.job.id)
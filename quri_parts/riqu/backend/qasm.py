@@ -0,0 +1,239 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A module to convert circuits to OpenQASM 3.0 programs for riqu server."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Optional
+
+from quri_parts.circuit import (
+    NonParametricQuantumCircuit,
+    QuantumCircuit,
+    UnboundParametricQuantumCircuitBase,
+    UnboundParametricQuantumCircuitProtocol,
+    gate_names,
+)
+from quri_parts.openqasm.circuit import convert_gate_to_qasm_line, convert_to_qasm_str
+
+_parametric_gate_symbols = {
+    gate_names.ParametricRX: "rx",
+    gate_names.ParametricRY: "ry",
+    gate_names.ParametricRZ: "rz",
+}
+
+
+def _circuit_key(circuit: NonParametricQuantumCircuit) -> Hashable:
+    return (circuit.qubit_count, circuit.cbit_count, circuit.gates)
+
+
+def _template_key(circuit: UnboundParametricQuantumCircuitProtocol) -> Hashable:
+    return ("template", circuit.qubit_count, circuit.cbit_count, tuple(circuit.gates))
+
+
+class RiquQasmTemplate:
+    """An OpenQASM 3.0 program of a parametric circuit whose angles are left
+    as placeholders.
+
+    The program is generated once from the structure of the circuit, and
+    :meth:`bind` only substitutes the angle literals, which gives the same
+    program as binding the parameters and converting the bound circuit.
+    Circuits whose parameters are not directly the angles of their gates
+    (e.g. with a linear parameter mapping) are bound and converted on each
+    call of :meth:`bind` instead.
+
+    Args:
+        circuit: The parametric circuit.
+
+    Raises:
+        ValueError: If the circuit contains a parametric gate which cannot be
+            converted to OpenQASM 3.0.
+    """
+
+    def __init__(self, circuit: UnboundParametricQuantumCircuitProtocol) -> None:
+        self._parameter_count = circuit.parameter_count
+        self._circuit: Optional[UnboundParametricQuantumCircuitProtocol] = None
+        self._segments: list[str] = []
+
+        if not isinstance(circuit, UnboundParametricQuantumCircuitBase):
+            self._circuit = circuit.freeze()
+            return
+
+        text = convert_to_qasm_str(QuantumCircuit(circuit.qubit_count))
+        for gate, param in circuit.gates_and_params:
+            text += "\n"
+            if param is None:
+                text += convert_gate_to_qasm_line(gate)
+                continue
+            if gate.name not in _parametric_gate_symbols:
+                raise ValueError(f"{gate.name} gate is not supported.")
+            self._segments.append(text + f"{_parametric_gate_symbols[gate.name]}(")
+            text = f") q[{gate.target_indices[0]}];"
+        self._segments.append(text)
+
+    @property
+    def parameter_count(self) -> int:
+        """The number of parameters of the circuit."""
+        return self._parameter_count
+
+    @property
+    def nbytes(self) -> int:
+        """The total length of the fixed parts of the program."""
+        return sum(len(segment) for segment in self._segments)
+
+    def bind(self, params: Sequence[float]) -> str:
+        """Returns the OpenQASM 3.0 program with ``params`` as the angles.
+
+        Raises:
+            ValueError: If the number of ``params`` does not match the number of
+                parameters of the circuit.
+        """
+        if len(params) != self._parameter_count:
+            raise ValueError(
+                f"Passed value count ({len(params)}) does not match parameter count"
+                f"({self._parameter_count})."
+            )
+        if self._circuit is not None:
+            return convert_to_qasm_str(self._circuit.bind_parameters(params))
+
+        segments = self._segments
+        parts = [segments[0]]
+        for value, segment in zip(params, segments[1:]):
+            parts.append(f"{value}")
+            parts.append(segment)
+        return "".join(parts)
+
+
+class RiquQasmCache:
+    """A least-recently-used cache of circuits converted to OpenQASM 3.0.
+
+    Circuits are keyed on their qubit count, classical bit count and gates, so
+    equal circuits share an entry regardless of their identity. Templates of
+    parametric circuits (see :class:`RiquQasmTemplate`) are cached in the same
+    way, except those of circuits with a parameter mapping (e.g.
+    :class:`~quri_parts.circuit.LinearMappedUnboundParametricQuantumCircuit`),
+    which are generated on each call. The cache is bounded both by the number
+    of entries and by the total length of the cached programs, and is safe to
+    use from multiple threads.
+
+    Args:
+        max_entries: The maximum number of cached programs. ``0`` disables the
+            cache.
+        max_bytes: The maximum total length of the cached programs. If ``None``,
+            only ``max_entries`` bounds the cache.
+
+    Raises:
+        ValueError: If ``max_entries`` or ``max_bytes`` is negative.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: Optional[int] = 16 * 1024 * 1024
+    ) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries should not be negative.")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes should not be negative.")
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, tuple[object, int]]" = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def hits(self) -> int:
+        """The number of conversions served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of conversions not served from the cache."""
+        return self._misses
+
+    @property
+    def nbytes(self) -> int:
+        """The total length of the cached programs."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def convert(self, circuit: NonParametricQuantumCircuit) -> str:
+        """Returns ``circuit`` converted to an OpenQASM 3.0 program, converting
+        it only if an equal circuit is not cached."""
+        key = _circuit_key(circuit)
+        qasm = self._get(key)
+        if qasm is None:
+            qasm = convert_to_qasm_str(circuit)
+            self._put(key, qasm, len(qasm))
+        return qasm
+
+    def template(
+        self, circuit: UnboundParametricQuantumCircuitProtocol
+    ) -> RiquQasmTemplate:
+        """Returns the :class:`RiquQasmTemplate` of ``circuit``, generating it
+        only if a template of an equal circuit is not cached.
+
+        Templates of circuits whose parameters are not directly the angles of
+        their gates are not cached, since their gates do not determine the
+        program.
+        """
+        if not isinstance(circuit, UnboundParametricQuantumCircuitBase):
+            return RiquQasmTemplate(circuit)
+        key = _template_key(circuit)
+        template = self._get(key)
+        if template is None:
+            template = RiquQasmTemplate(circuit)
+            self._put(key, template, template.nbytes)
+        return template
+
+    def clear(self) -> None:
+        """Removes all the cached programs and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _get(self, key: Hashable) -> Optional[object]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def _put(self, key: Hashable, value: object, size: int) -> None:
+        if self._max_entries == 0 or (
+            self._max_bytes is not None and size > self._max_bytes
+        ):
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (value, size)
+            self._nbytes += size
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._nbytes > self._max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_size
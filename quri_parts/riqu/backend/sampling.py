@@ -87,13 +87,22 @@ Examples:
 """
 
 import configparser
+import copy
 import datetime
+import hashlib
 import json
+import logging
+import math
 import os
+import random
 import time
 from collections import Counter
-from typing import Any, Dict, Optional, Union
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, Optional, Union
 
+import numpy as np
+import numpy.typing as npt
 from quri_parts.backend import (
     BackendError,
     SamplingBackend,
@@ -101,13 +110,217 @@ from quri_parts.backend import (
     SamplingJob,
     SamplingResult,
 )
-from quri_parts.circuit import NonParametricQuantumCircuit
-from quri_parts.openqasm.circuit import convert_to_qasm_str
+from quri_parts.circuit import (
+    NonParametricQuantumCircuit,
+    UnboundParametricQuantumCircuitProtocol,
+)
+
+from ..rest import Job, JobApi, JobsBody
+from ..rest.rest import ApiException
+from .cache import RiquJobCache
+from .clients import default_client_registry
+from .qasm import RiquQasmCache
 
-from ..rest import ApiClient, Configuration, Job, JobApi, JobsBody
+logger = logging.getLogger(__name__)
 
 JOB_FINAL_STATUS = ["success", "failure", "cancelled"]
 
+#: The fields of a job enough to follow its progress. They can be passed to
+#: :meth:`RiquSamplingJob.refresh` to poll a job without downloading its
+#: programs and result.
+JOB_STATUS_FIELDS = ("id", "status", "created", "in_queue", "out_queue", "ended")
+
+#: Time in seconds between queries when neither ``wait`` nor a polling strategy
+#: is specified.
+DEFAULT_POLLING_INTERVAL = 10.0
+
+
+class RiquPollingStrategy:
+    """A strategy to decide the time between queries while waiting for a job.
+
+    The interval starts at ``initial_interval`` and is multiplied by
+    ``growth_factor`` after every query, up to ``max_interval``. The growth is
+    restarted whenever the status of the job changes, so that e.g. a job which
+    leaves the queue is polled quickly again. If ``status_intervals`` has an
+    entry for the current status of the job, that interval is used instead.
+    Finally, each interval is randomized by ``±jitter`` (relative) so that many
+    jobs do not query riqu server in lockstep.
+
+    Args:
+        initial_interval: Time in seconds before the first query.
+        growth_factor: The factor the interval is multiplied by after each query.
+        max_interval: The upper bound of the interval in seconds.
+        jitter: The relative amount of randomization, between 0 and 1.
+        status_intervals: Fixed intervals in seconds for specific job statuses,
+            e.g. ``{"queued": 30.0, "processing": 1.0}``.
+
+    Raises:
+        ValueError: If any of the arguments is out of range.
+
+    Examples:
+        To poll every second at first, backing off to once a minute while the
+        job is queued, run the following code:
+
+        .. code-block::
+
+            strategy = RiquPollingStrategy(
+                initial_interval=1.0,
+                growth_factor=2.0,
+                max_interval=60.0,
+                jitter=0.1,
+            )
+            backend = RiquSamplingBackend(polling_strategy=strategy)
+            job = backend.sample(circuit, n_shots=1000)
+            counts = job.result().counts
+            print(job.poll_intervals)
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 1.0,
+        growth_factor: float = 1.5,
+        max_interval: float = 30.0,
+        jitter: float = 0.0,
+        status_intervals: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        if initial_interval < 0:
+            raise ValueError("initial_interval should not be negative.")
+        if growth_factor < 1:
+            raise ValueError("growth_factor should be greater than or equal to 1.")
+        if max_interval < initial_interval:
+            raise ValueError(
+                "max_interval should be greater than or equal to initial_interval."
+            )
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter should be between 0 and 1.")
+
+        self._initial_interval = initial_interval
+        self._growth_factor = growth_factor
+        self._max_interval = max_interval
+        self._jitter = jitter
+        self._status_intervals: dict[str, float] = dict(status_intervals or {})
+        # the first attempt whose interval reaches max_interval, beyond which
+        # the interval does not grow anymore
+        if growth_factor > 1 and initial_interval > 0:
+            self._max_attempt = max(
+                math.ceil(
+                    math.log(max_interval / initial_interval) / math.log(growth_factor)
+                ),
+                0,
+            )
+        else:
+            self._max_attempt = 0
+
+    @staticmethod
+    def fixed(interval: float) -> "RiquPollingStrategy":
+        """Returns a strategy which always waits ``interval`` seconds."""
+        return RiquPollingStrategy(
+            initial_interval=interval, growth_factor=1.0, max_interval=interval
+        )
+
+    @property
+    def initial_interval(self) -> float:
+        return self._initial_interval
+
+    @property
+    def growth_factor(self) -> float:
+        return self._growth_factor
+
+    @property
+    def max_interval(self) -> float:
+        return self._max_interval
+
+    @property
+    def jitter(self) -> float:
+        return self._jitter
+
+    @property
+    def status_intervals(self) -> dict[str, float]:
+        return dict(self._status_intervals)
+
+    def interval(self, attempt: int, status: Optional[str] = None) -> float:
+        """Returns the time in seconds to wait before the next query.
+
+        Args:
+            attempt: The number of queries made since the job entered ``status``.
+            status: The current status of the job.
+        """
+        if status in self._status_intervals:
+            interval = self._status_intervals[status]
+        else:
+            attempt = min(attempt, self._max_attempt)
+            interval = min(
+                self._initial_interval * self._growth_factor**attempt,
+                self._max_interval,
+            )
+        if self._jitter:
+            interval *= 1.0 + random.uniform(-self._jitter, self._jitter)
+        return max(interval, 0.0)
+
+    def schedule(self) -> "_PollingSchedule":
+        """Returns a fresh schedule to wait for one job."""
+        return _PollingSchedule(self)
+
+
+class _PollingSchedule:
+    """Keeps track of the number of queries made while waiting for one job and
+    restarts the back-off when the status of the job changes."""
+
+    def __init__(self, strategy: RiquPollingStrategy) -> None:
+        self._strategy = strategy
+        self._status: Optional[str] = None
+        self._attempt = 0
+
+    def next_interval(self, status: Optional[str]) -> float:
+        if status != self._status:
+            self._status = status
+            self._attempt = 0
+        interval = self._strategy.interval(self._attempt, status)
+        if self._attempt < self._strategy._max_attempt:
+            self._attempt += 1
+        return interval
+
+
+def _select_polling_strategy(
+    polling_strategy: Optional[RiquPollingStrategy],
+    wait: Optional[float],
+    default: Optional[RiquPollingStrategy],
+) -> RiquPollingStrategy:
+    """Returns the polling strategy to use, in order of precedence: the
+    explicit strategy, the explicit ``wait``, the default of the job and the
+    fixed :data:`DEFAULT_POLLING_INTERVAL`."""
+    if polling_strategy is not None:
+        return polling_strategy
+    if wait is not None:
+        return RiquPollingStrategy.fixed(wait)
+    if default is not None:
+        return default
+    return RiquPollingStrategy.fixed(DEFAULT_POLLING_INTERVAL)
+
+
+class RiquBatchSubmissionError(BackendError):
+    """Raised when some of the jobs of a batch submission could not be
+    submitted to riqu server.
+
+    Args:
+        results: The outcome of each submission in input order, either a
+            :class:`RiquSamplingJob` or the :class:`BackendError` raised for it.
+    """
+
+    def __init__(self, results: list[Union["RiquSamplingJob", BackendError]]):
+        self.results = results
+        self.errors: dict[int, BackendError] = {
+            i: r for i, r in enumerate(results) if isinstance(r, BackendError)
+        }
+        super().__init__(
+            f"{len(self.errors)} of {len(results)} submissions to riqu server failed."
+        )
+
+    @property
+    def jobs(self) -> list[Optional["RiquSamplingJob"]]:
+        """Submitted jobs in input order, with ``None`` for failed submissions."""
+        return [None if isinstance(r, BackendError) else r for r in self.results]
+
 
 class RiquSamplingResult(SamplingResult):
     """A result of a riqu sampling job.
@@ -169,70 +382,241 @@ class RiquSamplingResult(SamplingResult):
     def __init__(self, result: dict[str, Any]) -> None:
         super().__init__()
 
-        if "counts" not in result:
-            raise ValueError("counts does not exist in result.")
-        if "properties" not in result:
-            raise ValueError("properties does not exist in result.")
-
+        _check_result(result)
         self._result = result
-        self._counts = result.get("counts")
-        self._properties = result.get("properties")
-        self._transpiler_info = result.get("transpiler_info")
-        self._message = result.get("message")
-        self._divided_result = (
-            result["divided_result"] if "divided_result" in result else None
-        )
+        self._raw_json: Optional[str] = None
+        self._raw: Optional[dict[str, Any]] = None
+        self._outcomes: Optional[npt.NDArray[Any]] = None
+        self._counts_array: Optional[npt.NDArray[np.int64]] = None
+        self._divided_result_values: Optional[list[dict[str, int]]] = None
+
+    @classmethod
+    def _from_json(cls, result_json: str) -> "RiquSamplingResult":
+        """Creates a result from the ``result`` field of a riqu job.
+
+        The JSON is parsed on first access to any field, and each field is
+        decoded and memoized on its own first access.
+        """
+        sampling_result = cls({"counts": None, "properties": None})
+        sampling_result._result = {}
+        sampling_result._raw_json = result_json
+        return sampling_result
+
+    def _load_raw(self) -> dict[str, Any]:
+        if self._raw is None:
+            assert self._raw_json is not None
+            raw = json.loads(self._raw_json)
+            _check_result(raw)
+            self._raw = raw
+        return self._raw
+
+    def _field(self, key: str) -> Any:
+        if key not in self._result and self._raw_json is not None:
+            raw = self._load_raw()
+            if key in raw:
+                decode = _field_decoders.get(key)
+                value = raw[key]
+                self._result[key] = value if decode is None else decode(value)
+        return self._result.get(key)
 
     @property
     def counts(self) -> SamplingCounts:
-        """Returns the dict input for the counts."""
-        return self._counts
+        """Returns the dict input for the counts.
+
+        For a result of a riqu job, the dict is built from :attr:`outcomes` and
+        :attr:`counts_array` on first access.
+        """
+        if "counts" not in self._result:
+            self._result["counts"] = Counter(
+                dict(zip(self.outcomes.tolist(), self.counts_array.tolist()))
+            )
+        return self._result["counts"]
+
+    @property
+    def outcomes(self) -> npt.NDArray[Any]:
+        """Returns the measured classical values as an array.
+
+        The dtype is ``uint64``, or ``object`` holding Python ints if a value
+        does not fit in 64 bits. The number of shots with each value is given
+        by :attr:`counts_array` at the same index.
+        """
+        if self._outcomes is None:
+            self._decode_arrays()
+        return self._outcomes
+
+    @property
+    def counts_array(self) -> npt.NDArray[np.int64]:
+        """Returns the number of shots with each of :attr:`outcomes`."""
+        if self._counts_array is None:
+            self._decode_arrays()
+        return self._counts_array
+
+    def _decode_arrays(self) -> None:
+        if "counts" in self._result:
+            self._outcomes, self._counts_array = _counts_to_arrays(
+                self._result["counts"]
+            )
+            return
+        raw_counts: dict[str, int] = self._load_raw()["counts"]
+        self._outcomes = _decode_bit_strings(list(raw_counts.keys()))
+        self._counts_array = np.fromiter(
+            raw_counts.values(), dtype=np.int64, count=len(raw_counts)
+        )
 
     @property
     def properties(self) -> dict:
         """Returns properties."""
-        return self._properties
+        return self._field("properties")
 
     @property
     def transpiler_info(self) -> dict:
         """Returns transpiler_info."""
-        return self._transpiler_info
+        return self._field("transpiler_info")
 
     @property
     def message(self) -> str:
         """Returns message."""
-        return self._message
+        return self._field("message")
 
     @property
     def divided_result(self) -> Dict:
         """Returns divided_result."""
-        return self._divided_result
+        return self._field("divided_result")
+
+    def iter_divided_results(self) -> Iterator[SamplingCounts]:
+        """Yields the counts of each circuit of a ``multi_manual`` job in
+        order.
+
+        Unlike :attr:`divided_result`, the counts of each circuit are decoded
+        only when yielded and are not kept by this result.
+        """
+        if "divided_result" in self._result or self._raw_json is None:
+            yield from self._field("divided_result") or []
+            return
+        divided_result = self._load_raw().get("divided_result")
+        if divided_result is None:
+            return
+        for counts in divided_result.values():
+            yield _decode_counts(counts)
+
+    def divided_result_at(self, index: int) -> SamplingCounts:
+        """Returns the counts of the ``index``-th circuit of a
+        ``multi_manual`` job, decoding only those counts.
+
+        Raises:
+            ValueError: If ``divided_result`` does not exist in result.
+            IndexError: If ``index`` is out of range.
+        """
+        if "divided_result" in self._result or self._raw_json is None:
+            divided_result = self._field("divided_result")
+            if divided_result is None:
+                raise ValueError("divided_result does not exist in result.")
+            return divided_result[index]
+
+        if self._divided_result_values is None:
+            divided_result = self._load_raw().get("divided_result")
+            if divided_result is None:
+                raise ValueError("divided_result does not exist in result.")
+            self._divided_result_values = list(divided_result.values())
+        return _decode_counts(self._divided_result_values[index])
 
     def __repr__(self) -> str:
-        return str(self._result)
+        if self._raw_json is None:
+            return str(self._result)
+        result = {
+            key: self.counts if key == "counts" else self._field(key)
+            for key in self._load_raw()
+        }
+        return str(result)
 
 
-class RiquSamplingJob(SamplingJob):
-    """A job for a riqu sampling measurement.
+def _check_result(result: dict[str, Any]) -> None:
+    if "counts" not in result:
+        raise ValueError("counts does not exist in result.")
+    if "properties" not in result:
+        raise ValueError("properties does not exist in result.")
 
-    Args:
-        Job: A result of dict type.
-        job_api: A result of dict type.
 
-    Raises:
-        ValueError: If ``job`` or ``job_api`` is None.
+def _counts_to_arrays(
+    counts: SamplingCounts,
+) -> tuple[npt.NDArray[Any], npt.NDArray[np.int64]]:
+    outcomes = np.array(list(counts.keys()))
+    if outcomes.dtype.kind in "iu" and (outcomes.size == 0 or outcomes.min() >= 0):
+        outcomes = outcomes.astype(np.uint64)
+    else:
+        outcomes = np.array(list(counts.keys()), dtype=object)
+    return outcomes, np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+
+
+def _decode_bit_strings(bit_strings: list[str]) -> npt.NDArray[Any]:
+    """Decodes bit strings to the measured classical values in bulk.
+
+    Bit strings of the same width up to 64 bits are decoded as one array
+    operation. Otherwise each bit string is decoded by :func:`int`.
     """
+    width = len(bit_strings[0]) if bit_strings else 0
+    if 0 < width <= 64 and all(len(bits) == width for bits in bit_strings):
+        try:
+            data = "".join(bit_strings).encode("ascii")
+        except UnicodeEncodeError:
+            data = b""
+        bits = np.frombuffer(data, dtype=np.uint8).reshape(-1, width) - ord("0")
+        if len(bits) == len(bit_strings) and not (bits > 1).any():
+            # pack each row into 8 bytes and read them as a big-endian integer
+            padded = np.zeros((len(bits), 64), dtype=np.uint8)
+            start = 64 - width
+            padded[:, start:] = bits
+            packed = np.packbits(padded, axis=1).view(">u8").ravel()
+            return packed.astype(np.uint64)
 
-    def __init__(self, job: Job, job_api: JobApi):
-        super().__init__()
+    values = [int(bits, 2) for bits in bit_strings]
+    if width <= 64 and all(len(bits) <= 64 for bits in bit_strings):
+        return np.array(values, dtype=np.uint64)
+    return np.array(values, dtype=object)
 
-        if job is None:
-            raise ValueError("job should not be None.")
-        self._job: Job = job
 
-        if job_api is None:
-            raise ValueError("job_api should not be None.")
-        self._job_api: JobApi = job_api
+def _decode_counts(counts: dict[str, int]) -> SamplingCounts:
+    return {int(bits, 2): count for bits, count in counts.items()}
+
+
+def _decode_properties(properties: dict[str, Any]) -> dict[int, Any]:
+    return {int(qubit_index): value for qubit_index, value in properties.items()}
+
+
+def _decode_divided_result(
+    divided_result: Optional[dict[str, dict[str, int]]]
+) -> Optional[list[SamplingCounts]]:
+    if divided_result is None:
+        return None
+    return [_decode_counts(counts) for counts in divided_result.values()]
+
+
+_field_decoders: dict[str, Callable[[Any], Any]] = {
+    "properties": _decode_properties,
+    "divided_result": _decode_divided_result,
+}
+
+
+def _to_sampling_result(job: Job) -> RiquSamplingResult:
+    """Converts the ``result`` field of a finished :class:`Job` to a
+    :class:`RiquSamplingResult` which decodes its fields on demand."""
+    return RiquSamplingResult._from_json(job.result)
+
+
+class _RiquJobProperties:
+    """Read-only accessors for the fields of the :class:`Job` held in
+    ``_job``, shared by the synchronous and asynchronous riqu jobs."""
+
+    _job: Job
+    _result_cache: Optional[tuple[Job, RiquSamplingResult]] = None
+
+    def _sampling_result(self) -> RiquSamplingResult:
+        """Returns the result of ``_job``, which is decoded only once for each
+        :class:`Job` retrieved from riqu server."""
+        job = self._job
+        if self._result_cache is None or self._result_cache[0] is not job:
+            self._result_cache = (job, _to_sampling_result(job))
+        return self._result_cache[1]
 
     @property
     def id(self) -> str:
@@ -294,25 +678,180 @@ class RiquSamplingJob(SamplingJob):
         """The remark to be assigned to the job."""
         return self._job.remark
 
-    def refresh(self) -> None:
-        """Retrieves the latest job information from riqu server."""
+
+class RiquSamplingJob(SamplingJob, _RiquJobProperties):
+    """A job for a riqu sampling measurement.
+
+    A job created by :meth:`from_job_id` is lazy: it knows only its id, and the
+    job information is retrieved from riqu server when a property other than
+    ``id`` is first accessed.
+
+    Args:
+        Job: A result of dict type.
+        job_api: A result of dict type.
+        polling_strategy: The default :class:`RiquPollingStrategy` used by
+            :meth:`wait_for_completion` and :meth:`result`.
+        job_cache: A :class:`RiquJobCache` consulted by :meth:`refresh` before
+            querying riqu server, and where the job is stored once it reaches a
+            final status.
+
+    Raises:
+        ValueError: If ``job`` or ``job_api`` is None.
+    """
+
+    def __init__(
+        self,
+        job: Job,
+        job_api: JobApi,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+        job_cache: Optional[RiquJobCache] = None,
+    ):
+        super().__init__()
+
+        if job is None:
+            raise ValueError("job should not be None.")
+        self._job_model: Optional[Job] = job
+        self._job_id: str = job.id
+
+        if job_api is None:
+            raise ValueError("job_api should not be None.")
+        self._job_api: JobApi = job_api
+
+        self._polling_strategy = polling_strategy
+        self._poll_intervals: list[float] = []
+        self._job_cache = job_cache
+
+    @classmethod
+    def from_job_id(
+        cls,
+        job_id: str,
+        job_api: JobApi,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+        job_cache: Optional[RiquJobCache] = None,
+    ) -> "RiquSamplingJob":
+        """Creates a lazy job which retrieves the job information from riqu
+        server on first access.
+
+        Args:
+            job_id: The id of the job.
+            job_api: A :class:`JobApi` to retrieve the job with.
+            polling_strategy: The default :class:`RiquPollingStrategy` of the job.
+            job_cache: A :class:`RiquJobCache` to look the job up in first.
+
+        Raises:
+            ValueError: If ``job_id`` or ``job_api`` is None.
+        """
+        if job_id is None:
+            raise ValueError("job_id should not be None.")
+        job = cls(Job(id=job_id), job_api, polling_strategy, job_cache)
+        job._job_model = None
+        return job
+
+    @property
+    def _job(self) -> Job:
+        if self._job_model is None:
+            self.refresh()
+        return self._job_model
+
+    @_job.setter
+    def _job(self, job: Job) -> None:
+        self._job_model = job
+
+    @property
+    def id(self) -> str:
+        """The id of the job."""
+        return self._job_id
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the job information has been retrieved from riqu server.
+
+        Accessing any property other than ``id`` of a job which is not loaded
+        retrieves it, and raises :class:`BackendError` if that fails.
+        """
+        return self._job_model is not None
+
+    @property
+    def polling_strategy(self) -> Optional[RiquPollingStrategy]:
+        """The default polling strategy of the job."""
+        return self._polling_strategy
+
+    @property
+    def poll_intervals(self) -> list[float]:
+        """Intervals in seconds slept between queries while waiting for the
+        job, in the order they were chosen."""
+        return list(self._poll_intervals)
+
+    def refresh(self, fields: Optional[Sequence[str]] = None) -> None:
+        """Retrieves the latest job information from riqu server.
+
+        If the job is found in the job cache, riqu server is not queried. The
+        request is conditional on the job retrieved last time, so the job is
+        kept as is without transferring it if it has not been modified.
+
+        Args:
+            fields: The fields of the job to retrieve, e.g.
+                :data:`JOB_STATUS_FIELDS`. ``id`` and ``status`` are always
+                retrieved, and the other fields keep the values retrieved
+                before. All the fields are retrieved when the job is not loaded
+                yet and, once, when the job reaches a final status. If riqu
+                server does not support retrieving some of the fields, all the
+                fields are retrieved at every call. If ``None``, all the fields
+                are retrieved.
+        """
         try:
-            self._job = self._job_api.get_job(self._job.id)
+            cached = _get_cached_job(self._job_cache, self.id)
+            if cached is not None:
+                self._job = cached
+                return
+            if self._job_model is None:
+                # a lazy job retrieves all the fields once to be loaded
+                fields = None
+            job, partial = _get_job(self._job_api, self.id, fields)
+            if job == self._job_model:
+                # e.g. riqu server answered that the job has not been modified
+                return
+            if partial:
+                if job.status not in JOB_FINAL_STATUS:
+                    self._job = _merge_job(self._job_model, job)
+                    return
+                # the job does not change any more, so its programs and result
+                # are retrieved only once
+                job = self._job_api.get_job(self.id)
+            self._job = job
+            _put_cached_job(self._job_cache, self._job)
         except Exception as e:
             raise BackendError("To refresh job is failed.") from e
 
     def wait_for_completion(
-        self, timeout: Optional[float] = None, wait: float = 10.0
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Optional[Job]:
         """Waits until the job progress to the end such as ``success`` or
         ``failure``, ``cancelled``.
 
+        The intervals slept between queries are appended to
+        :attr:`poll_intervals`.
+
         Args:
             timeout: The number of seconds to wait for job.
-            wait: Time in seconds between queries.
+            wait: Time in seconds between queries. Ignored if
+                ``polling_strategy`` is given.
+            polling_strategy: The :class:`RiquPollingStrategy` to decide time
+                between queries. If neither this nor ``wait`` is given, the
+                default strategy of the job is used, or 10 seconds if the job
+                has none.
+            fields: The fields of the job to retrieve while it is not finished
+                (see :meth:`refresh`).
         """
+        schedule = _select_polling_strategy(
+            polling_strategy, wait, self._polling_strategy
+        ).schedule()
         start_time = time.time()
-        self.refresh()
+        self.refresh(fields)
         while self._job.status not in JOB_FINAL_STATUS:
             # check timeout
             elapsed_time = time.time() - start_time
@@ -320,32 +859,42 @@ class RiquSamplingJob(SamplingJob):
                 return None
 
             # sleep and get job
-            time.sleep(wait)
-            self.refresh()
+            interval = schedule.next_interval(self._job.status)
+            if timeout is not None:
+                interval = min(interval, timeout - elapsed_time)
+            self._poll_intervals.append(interval)
+            time.sleep(interval)
+            self.refresh(fields)
 
         return self._job
 
     def result(
-        self, timeout: Optional[float] = None, wait: Optional[float] = 10.0
-    ) -> SamplingResult:
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+    ) -> RiquSamplingResult:
         """Waits until the job progress to the end and returns the result of
         the job.
 
         If the status of job is not ``success``, ``failure``, or ``cancelled``,
-        the job is retrieved from riqu server at intervals of ``wait`` seconds.
+        the job is retrieved from riqu server at intervals of ``wait`` seconds,
+        or at intervals decided by ``polling_strategy``.
         If the job does not progress to the end after ``timeout`` seconds,
         raise :class:`BackendError`.
 
         Args:
             timeout: The number of seconds to wait for job.
             wait: Time in seconds between queries.
+            polling_strategy: The :class:`RiquPollingStrategy` to decide time
+                between queries. See :meth:`wait_for_completion`.
 
         Raises:
             BackendError: If job cannot be found or if an authentication error occurred
                 or timeout occurs, etc.
         """
-        if self._job.status not in JOB_FINAL_STATUS:
-            job = self.wait_for_completion(timeout, wait)
+        if not self.loaded or self._job.status not in JOB_FINAL_STATUS:
+            job = self.wait_for_completion(timeout, wait, polling_strategy)
             if job is None:
                 raise BackendError(f"Timeout occurred after {timeout} seconds.")
             elif job.status in ["failure", "cancelled"]:
@@ -353,27 +902,7 @@ class RiquSamplingJob(SamplingJob):
             else:
                 self._job = job
 
-        # edit json for RiquSamplingResult
-        result = json.loads(self._job.result)
-        result["counts"] = Counter(
-            {int(bits, 2): count for bits, count in result["counts"].items()}
-        )
-        result["properties"] = {
-            int(qubit_index): value
-            for qubit_index, value in result["properties"].items()
-        }
-        if "divided_result" in result and result["divided_result"] is not None:
-            result["divided_result"]: SamplingCounts = [
-                dict(
-                    {
-                        int(bits, 2): count
-                        for bits, count in result["divided_result"][one_result].items()
-                    }
-                )
-                for one_result in result["divided_result"]
-            ]
-
-        return RiquSamplingResult(result)
+        return self._sampling_result()
 
     def cancel(self) -> None:
         """Cancels the job.
@@ -386,27 +915,255 @@ class RiquSamplingJob(SamplingJob):
                 or if job cannot be cancelled, etc.
         """
         try:
-            self._job_api.put_jobs_job_id_cancel(self._job.id)
+            self._job_api.put_jobs_job_id_cancel(self.id)
             self.refresh()
         except Exception as e:
             raise BackendError("To cancel job is failed.") from e
 
     def __repr__(self) -> str:
+        if not self.loaded:
+            return Job(id=self.id).to_str()
         return self._job.to_str()
 
 
+#: A callback invoked with a finished sub-job of a
+#: :class:`RiquCompositeSamplingJob`, the number of finished sub-jobs and the
+#: number of all the sub-jobs.
+ProgressCallback = Callable[[RiquSamplingJob, int, int], None]
+
+
+class RiquCompositeSamplingJob(SamplingJob):
+    """A sampling job split into several riqu jobs, whose result is the sum of
+    the results of the jobs.
+
+    Args:
+        jobs: The riqu jobs sampling the same circuit.
+        progress_callback: A function called each time one of ``jobs`` is found
+            to have reached a final status while waiting for the jobs.
+
+    Raises:
+        ValueError: If ``jobs`` is empty.
+    """
+
+    def __init__(
+        self,
+        jobs: Sequence[RiquSamplingJob],
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        super().__init__()
+
+        if not jobs:
+            raise ValueError("jobs should not be empty.")
+        self._jobs = list(jobs)
+        self._progress_callback = progress_callback
+        self._finished: set[int] = set()
+        self._result: Optional[RiquSamplingResult] = None
+
+    @property
+    def jobs(self) -> list[RiquSamplingJob]:
+        """The riqu jobs the sampling is split into."""
+        return list(self._jobs)
+
+    @property
+    def n_finished(self) -> int:
+        """The number of jobs known to have reached a final status."""
+        return len(self._finished)
+
+    def wait_for_completion(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+    ) -> bool:
+        """Waits until all the jobs progress to the end such as ``success`` or
+        ``failure``, ``cancelled``.
+
+        The jobs which have not finished yet are refreshed together at each
+        interval. See :meth:`RiquSamplingJob.wait_for_completion` for the
+        arguments.
+
+        Returns:
+            ``True`` if all the jobs have finished, ``False`` on timeout.
+        """
+        schedule = _select_polling_strategy(
+            polling_strategy, wait, self._jobs[0].polling_strategy
+        ).schedule()
+        start_time = time.time()
+        while True:
+            for i, job in enumerate(self._jobs):
+                if i in self._finished:
+                    continue
+                job.refresh()
+                if job.status in JOB_FINAL_STATUS:
+                    self._finished.add(i)
+                    if self._progress_callback is not None:
+                        self._progress_callback(
+                            job, len(self._finished), len(self._jobs)
+                        )
+            if len(self._finished) == len(self._jobs):
+                return True
+
+            # check timeout
+            elapsed_time = time.time() - start_time
+            if timeout is not None and elapsed_time >= timeout:
+                return False
+
+            # sleep until the next round of queries
+            interval = schedule.next_interval(None)
+            if timeout is not None:
+                interval = min(interval, timeout - elapsed_time)
+            time.sleep(interval)
+
+    def result(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+    ) -> RiquSamplingResult:
+        """Waits until all the jobs progress to the end and returns the merged
+        result.
+
+        ``counts`` and each counts of ``divided_result`` are summed over the
+        jobs, and the other fields are taken from the first job.
+
+        Raises:
+            BackendError: If any job cannot be found or if an authentication error
+                occurred or timeout occurs, or if any job did not succeed, etc.
+        """
+        if self._result is not None:
+            return self._result
+        if not self.wait_for_completion(timeout, wait, polling_strategy):
+            raise BackendError(f"Timeout occurred after {timeout} seconds.")
+        for job in self._jobs:
+            if job.status != "success":
+                raise BackendError(f"Job {job.id} ended with status {job.status}.")
+
+        self._result = _merge_results([job._sampling_result() for job in self._jobs])
+        return self._result
+
+    def cancel(self) -> None:
+        """Cancels the jobs which have not finished yet.
+
+        Raises:
+            BackendError: If a job cannot be found or if an authentication error
+                occurred or if a job cannot be cancelled, etc.
+        """
+        for i, job in enumerate(self._jobs):
+            if i not in self._finished:
+                job.cancel()
+
+    def __repr__(self) -> str:
+        return f"RiquCompositeSamplingJob({[job.id for job in self._jobs]})"
+
+
+def _merge_results(results: Sequence[RiquSamplingResult]) -> RiquSamplingResult:
+    first = results[0]
+    for result in results[1:]:
+        # the jobs are transpiled separately, so the bits of their counts may
+        # be measured on different qubits
+        if result.properties != first.properties:
+            raise BackendError(
+                "The split jobs have different properties, so their results "
+                "cannot be merged."
+            )
+
+    counts: Counter[int] = Counter()
+    for result in results:
+        counts.update(result.counts)
+
+    merged: dict[str, Any] = {
+        "counts": counts,
+        "properties": first.properties,
+        "transpiler_info": first.transpiler_info,
+        "message": first.message,
+    }
+    if first.divided_result is not None:
+        divided_result = [Counter(c) for c in first.divided_result]
+        for result in results[1:]:
+            divided_counts = list(result.iter_divided_results())
+            if len(divided_counts) != len(divided_result):
+                raise BackendError(
+                    "The split jobs have different numbers of divided results."
+                )
+            for merged_counts, c in zip(divided_result, divided_counts):
+                merged_counts.update(c)
+        merged["divided_result"] = divided_result
+    return RiquSamplingResult(merged)
+
+
+def _split_shots(n_shots: int, max_shots_per_job: int) -> list[int]:
+    n_jobs, remainder = divmod(n_shots, max_shots_per_job)
+    return [max_shots_per_job] * n_jobs + ([remainder] if remainder else [])
+
+
 class RiquConfig:
     """A configuration information class for using riqu backend.
 
+    The connection settings and rate limits are applied by the api client,
+    which is shared by all the backends and SSE jobs with the same
+    configuration (see :class:`RiquClientRegistry`).
+
     Args:
         url: Base URL for riqu server.
         api_token: API token for riqu server.
+        proxy: Proxy URL to access riqu server.
+        cache_dir: A directory to keep finished jobs in (see
+            :class:`RiquJobCache`). If ``None``, jobs are not cached.
+        pool_size: The number of connection pools, one per host, kept by the
+            api client. If ``None``, the default of the api client is used.
+        pool_maxsize: The maximum number of connections kept open to a host.
+            Sizing it to the number of concurrent submissions lets each of
+            them reuse a connection. If ``None``, the default of the api client
+            (five times the number of CPUs) is used.
+        pool_block: If ``True``, a request waits for a free connection when
+            ``pool_maxsize`` connections to the host are in use. Otherwise an
+            extra connection is opened and discarded after the request.
+        connect_timeout: The timeout in seconds to connect to riqu server. If
+            ``None``, there is no timeout.
+        read_timeout: The timeout in seconds to read a response from riqu
+            server. If ``None``, there is no timeout.
+        retries: The maximum number of retries of a request which failed
+            transiently, e.g. with status 502 or 503. Failed submissions are
+            retried only if they did not reach riqu server. ``0`` disables
+            retries. If ``None``, the default of the api client (3) is used.
+        retry_backoff_factor: The factor in seconds of the exponential backoff
+            between retries, unless riqu server asks for a delay with a
+            ``Retry-After`` header. If ``None``, the default of the api client
+            (0.5) is used.
+        submit_rate: The maximum number of job submissions per second. If
+            ``None``, submissions are not rate limited.
+        submit_concurrency: The maximum number of job submissions in flight.
+            If ``None``, the number is not limited.
+        poll_rate: The maximum number of job retrievals per second, e.g. while
+            waiting for jobs. If ``None``, retrievals are not rate limited.
+        poll_concurrency: The maximum number of job retrievals in flight. If
+            ``None``, the number is not limited.
 
     Raises:
-        ValueError: If ``url`` or ``api_token`` is None.
+        ValueError: If ``url`` or ``api_token`` is None, if ``pool_size`` or
+            ``pool_maxsize`` is not a positive integer, if a timeout is not
+            positive, if ``retries`` or ``retry_backoff_factor`` is negative,
+            or if a rate limit is not positive.
     """
 
-    def __init__(self, url: str, api_token: str, proxy: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        url: str,
+        api_token: str,
+        proxy: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        retry_backoff_factor: Optional[float] = None,
+        submit_rate: Optional[float] = None,
+        submit_concurrency: Optional[int] = None,
+        poll_rate: Optional[float] = None,
+        poll_concurrency: Optional[int] = None,
+    ) -> None:
         super().__init__()
 
         if url is None:
@@ -417,7 +1174,40 @@ class RiquConfig:
             raise ValueError("api_token should not be None.")
         self._api_token: str = api_token
 
+        if pool_size is not None and not pool_size >= 1:
+            raise ValueError("pool_size should be a positive integer.")
+        if pool_maxsize is not None and not pool_maxsize >= 1:
+            raise ValueError("pool_maxsize should be a positive integer.")
+        if connect_timeout is not None and not connect_timeout > 0:
+            raise ValueError("connect_timeout should be positive.")
+        if read_timeout is not None and not read_timeout > 0:
+            raise ValueError("read_timeout should be positive.")
+        if retries is not None and retries < 0:
+            raise ValueError("retries should not be negative.")
+        if retry_backoff_factor is not None and retry_backoff_factor < 0:
+            raise ValueError("retry_backoff_factor should not be negative.")
+        for name, value in [
+            ("submit_rate", submit_rate),
+            ("submit_concurrency", submit_concurrency),
+            ("poll_rate", poll_rate),
+            ("poll_concurrency", poll_concurrency),
+        ]:
+            if value is not None and not value > 0:
+                raise ValueError(f"{name} should be positive.")
+
         self._proxy: str = proxy
+        self._cache_dir = cache_dir
+        self._pool_size = pool_size
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._retries = retries
+        self._retry_backoff_factor = retry_backoff_factor
+        self._submit_rate = submit_rate
+        self._submit_concurrency = submit_concurrency
+        self._poll_rate = poll_rate
+        self._poll_concurrency = poll_concurrency
 
     @property
     def url(self) -> str:
@@ -431,6 +1221,54 @@ class RiquConfig:
     def proxy(self) -> Optional[str]:
         return self._proxy
 
+    @property
+    def cache_dir(self) -> Optional[str]:
+        return self._cache_dir
+
+    @property
+    def pool_size(self) -> Optional[int]:
+        return self._pool_size
+
+    @property
+    def pool_maxsize(self) -> Optional[int]:
+        return self._pool_maxsize
+
+    @property
+    def pool_block(self) -> bool:
+        return self._pool_block
+
+    @property
+    def connect_timeout(self) -> Optional[float]:
+        return self._connect_timeout
+
+    @property
+    def read_timeout(self) -> Optional[float]:
+        return self._read_timeout
+
+    @property
+    def retries(self) -> Optional[int]:
+        return self._retries
+
+    @property
+    def retry_backoff_factor(self) -> Optional[float]:
+        return self._retry_backoff_factor
+
+    @property
+    def submit_rate(self) -> Optional[float]:
+        return self._submit_rate
+
+    @property
+    def submit_concurrency(self) -> Optional[int]:
+        return self._submit_concurrency
+
+    @property
+    def poll_rate(self) -> Optional[float]:
+        return self._poll_rate
+
+    @property
+    def poll_concurrency(self) -> Optional[int]:
+        return self._poll_concurrency
+
     @staticmethod
     def from_file(
         section: Optional[str] = "default", path: Optional[str] = "~/.riqu"
@@ -465,6 +1303,14 @@ class RiquConfig:
                 url=<base URL>
                 api_token=<API token>
                 proxy=http://<proxy>:<port>
+                cache_dir=~/.cache/riqu
+                pool_maxsize=16
+                pool_block=true
+                connect_timeout=5
+                read_timeout=30
+                retries=5
+                submit_rate=2
+                submit_concurrency=4
 
             If ``sectionA`` settings are to be used, initialize ``RiquSamplingBackend`` as follows
 
@@ -480,10 +1326,143 @@ class RiquConfig:
             url=parser[section]["url"],
             api_token=parser[section]["api_token"],
             proxy=parser[section].get("proxy", None),
+            cache_dir=parser[section].get("cache_dir", None),
+            pool_size=parser[section].getint("pool_size", None),
+            pool_maxsize=parser[section].getint("pool_maxsize", None),
+            pool_block=parser[section].getboolean("pool_block", False),
+            connect_timeout=parser[section].getfloat("connect_timeout", None),
+            read_timeout=parser[section].getfloat("read_timeout", None),
+            retries=parser[section].getint("retries", None),
+            retry_backoff_factor=parser[section].getfloat("retry_backoff_factor", None),
+            submit_rate=parser[section].getfloat("submit_rate", None),
+            submit_concurrency=parser[section].getint("submit_concurrency", None),
+            poll_rate=parser[section].getfloat("poll_rate", None),
+            poll_concurrency=parser[section].getint("poll_concurrency", None),
         )
         return config
 
 
+def _resolve_config(config: Optional[RiquConfig]) -> RiquConfig:
+    """Returns ``config`` itself, or a :class:`RiquConfig` read from the
+    environment variables or ``~/.riqu`` if ``config`` is ``None``."""
+    if config is not None:
+        return config
+
+    # if environment variables are set, use their values
+    url = os.getenv("RIQU_URL")
+    api_token = os.getenv("RIQU_API_TOKEN")
+    proxy = os.getenv("RIQU_PROXY")
+    cache_dir = os.getenv("RIQU_CACHE_DIR")
+    if url is not None and api_token is not None:
+        return RiquConfig(
+            url=url,
+            api_token=api_token,
+            proxy=proxy,
+            cache_dir=cache_dir,
+        )
+    # load config from file
+    return RiquConfig.from_file()
+
+
+def _create_job_cache(config: RiquConfig) -> Optional[RiquJobCache]:
+    if config.cache_dir is None:
+        return None
+    return RiquJobCache.from_cache_dir(config.cache_dir)
+
+
+def _get_cached_job(job_cache: Optional[RiquJobCache], job_id: str) -> Optional[Job]:
+    if job_cache is None:
+        return None
+    return job_cache.get(job_id)
+
+
+def _put_cached_job(job_cache: Optional[RiquJobCache], job: Job) -> None:
+    if job_cache is not None and job.status in JOB_FINAL_STATUS:
+        job_cache.put(job)
+
+
+# hosts of riqu servers which rejected a request for some of the fields of a job
+_field_selection_unsupported: set[str] = set()
+
+
+def _get_job(
+    job_api: JobApi, job_id: str, fields: Optional[Sequence[str]]
+) -> tuple[Job, bool]:
+    """Retrieves a job with only ``fields`` (and ``id`` and ``status``) if they
+    are given and riqu server supports it. Returns the job and whether only
+    ``fields`` were requested."""
+    if fields is None:
+        return job_api.get_job(job_id), False
+
+    host = job_api.api_client.configuration.host
+    if host not in _field_selection_unsupported:
+        fields = list(dict.fromkeys(["id", "status", *fields]))
+        try:
+            job = job_api.get_job(job_id, fields=fields)
+        except ApiException as e:
+            if e.status not in (400, 422):
+                raise
+            _field_selection_unsupported.add(host)
+        else:
+            # riqu server may ignore the fields and send the whole job
+            partial = all(
+                getattr(job, attr) is None
+                for attr in Job.swagger_types
+                if attr not in fields
+            )
+            return job, partial
+    return job_api.get_job(job_id), False
+
+
+def _merge_job(job: Optional[Job], partial: Job) -> Job:
+    """Returns ``job`` updated with the fields retrieved in ``partial``."""
+    if job is None:
+        return partial
+    merged = copy.copy(job)
+    for attr in Job.swagger_types:
+        value = getattr(partial, attr)
+        if value is not None:
+            setattr(merged, attr, value)
+    return merged
+
+
+def _submission_key(config: RiquConfig, body: JobsBody) -> str:
+    """Returns the key identifying submissions of the same program with the
+    same settings to the same riqu server by the same user, since a job cache
+    directory may be shared by configurations of different servers."""
+    data = json.dumps(
+        [
+            config.url,
+            config.api_token,
+            body.qasm,
+            body.shots,
+            body.transpiler,
+            body.job_type,
+        ]
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _create_job_api(config: RiquConfig) -> JobApi:
+    """Constructs a :class:`JobApi` connected to the riqu server described by
+    ``config``, on the api client shared through the default
+    :class:`RiquClientRegistry`."""
+    api_client = default_client_registry.get(config)
+    return JobApi(api_client=api_client)
+
+
+def _circuit_to_qasm(
+    circuit: Union[NonParametricQuantumCircuit, list[NonParametricQuantumCircuit]],
+    qasm_cache: RiquQasmCache,
+) -> tuple[str, str]:
+    """Converts a circuit or a list of circuits to the ``qasm`` string sent
+    to riqu server, together with the corresponding ``job_type``."""
+    if isinstance(circuit, list):
+        qasms_dict = {"qasm": [qasm_cache.convert(c) for c in circuit]}
+        return json.dumps(qasms_dict), "multi_manual"
+    return qasm_cache.convert(circuit), "normal"
+
+
 class RiquSamplingBackend(SamplingBackend):
     """A riqu backend for a sampling measurement.
 
@@ -495,41 +1474,75 @@ class RiquSamplingBackend(SamplingBackend):
 
             If this parameter is ``None`` and the environment variables do not exist,
             the ``default`` section in the ``~/.riqu`` file is read.
+
+            If ``cache_dir`` of the configuration is set, finished jobs are kept
+            in a :class:`RiquJobCache` there, and :meth:`retrieve_job` and the
+            jobs created by this backend look jobs up in it before querying riqu
+            server.
+        polling_strategy: The default :class:`RiquPollingStrategy` of the jobs
+            created by this backend.
+        lazy_jobs: If ``True``, :meth:`sample` and :meth:`sample_qasm` return a
+            lazy job (see :meth:`RiquSamplingJob.from_job_id`) right after the
+            job is posted, instead of retrieving the job from riqu server first.
+        qasm_cache: A :class:`RiquQasmCache` to reuse OpenQASM 3.0 programs of
+            circuits already submitted. If ``None``, a cache with the default
+            bounds is created for this backend.
+        dedup_ttl: If not ``None``, a submission of the same OpenQASM 3.0 program
+            with the same ``n_shots``, ``transpiler`` and ``job_type`` as a job
+            submitted within ``dedup_ttl`` seconds returns that job instead of
+            posting a new one, provided the job has succeeded and is in the job
+            cache. If ``cache_dir`` is not configured, an in-memory job cache is
+            used.
+
+    Raises:
+        ValueError: If ``dedup_ttl`` is negative.
     """
 
     def __init__(
         self,
         config: Optional[RiquConfig] = None,
+        polling_strategy: Optional[RiquPollingStrategy] = None,
+        lazy_jobs: bool = False,
+        qasm_cache: Optional[RiquQasmCache] = None,
+        dedup_ttl: Optional[float] = None,
     ):
         super().__init__()
 
-        # set config
-        if config is None:
-            # if environment variables are set, use their values
-            url = os.getenv("RIQU_URL")
-            api_token = os.getenv("RIQU_API_TOKEN")
-            proxy = os.getenv("RIQU_PROXY")
-            if url is not None and api_token is not None:
-                config = RiquConfig(
-                    url=url,
-                    api_token=api_token,
-                    proxy=proxy,
-                )
-            # load config from file
-            else:
-                config = RiquConfig.from_file()
-
-        # construct JobApi
-        rest_config = Configuration()
-        rest_config.host = config.url
-        if config.proxy:
-            rest_config.proxy = config.proxy
-        api_client = ApiClient(
-            configuration=rest_config,
-            header_name="q-api-token",
-            header_value=config.api_token,
-        )
-        self._job_api: JobApi = JobApi(api_client=api_client)
+        if dedup_ttl is not None and dedup_ttl < 0:
+            raise ValueError("dedup_ttl should not be negative.")
+
+        config = _resolve_config(config)
+        self._config = config
+        self._job_api: JobApi = _create_job_api(config)
+        self._polling_strategy = polling_strategy
+        self._lazy_jobs = lazy_jobs
+        self._qasm_cache = RiquQasmCache() if qasm_cache is None else qasm_cache
+        self._job_cache = _create_job_cache(config)
+        if dedup_ttl is not None and self._job_cache is None:
+            self._job_cache = RiquJobCache(":memory:")
+        self._dedup_ttl = dedup_ttl
+
+    @property
+    def polling_strategy(self) -> Optional[RiquPollingStrategy]:
+        """The default polling strategy of the jobs created by this backend."""
+        return self._polling_strategy
+
+    @property
+    def qasm_cache(self) -> RiquQasmCache:
+        """The cache of circuits converted to OpenQASM 3.0 by this backend."""
+        return self._qasm_cache
+
+    @property
+    def job_cache(self) -> Optional[RiquJobCache]:
+        """The cache of finished jobs, or ``None`` if neither ``cache_dir`` nor
+        ``dedup_ttl`` is configured."""
+        return self._job_cache
+
+    @property
+    def dedup_ttl(self) -> Optional[float]:
+        """Time in seconds within which identical submissions reuse a job, or
+        ``None`` if submissions are not deduplicated."""
+        return self._dedup_ttl
 
     def sample(
         self,
@@ -537,6 +1550,10 @@ class RiquSamplingBackend(SamplingBackend):
         n_shots: int,
         transpiler: Optional[str] = "normal",
         remark: Optional[str] = None,
+        bypass_dedup: bool = False,
+        max_shots_per_job: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        concurrency: int = 4,
     ) -> SamplingJob:
         """Perform a sampling measurement of a circuit.
 
@@ -549,23 +1566,32 @@ class RiquSamplingBackend(SamplingBackend):
             n_shots: Number of repetitions of each circuit, for sampling.
             transpiler: The transpiler setting.
             remark: The remark to be assigned to the job.
+            bypass_dedup: If ``True``, a new job is posted even if an identical
+                job can be reused (see ``dedup_ttl``).
+            max_shots_per_job: See :meth:`sample_qasm`.
+            progress_callback: See :meth:`sample_qasm`.
+            concurrency: See :meth:`sample_qasm`.
 
         Returns:
             The job to be executed.
 
         Raises:
-            ValueError: If ``n_shots`` is not a positive integer.
+            ValueError: If ``n_shots``, ``max_shots_per_job`` or ``concurrency`` is
+                not a positive integer.
             BackendError: If job is wrong or if an authentication error occurred, etc.
         """
-        if isinstance(circuit, list):
-            qasms_dict = {"qasm": [convert_to_qasm_str(c) for c in circuit]}
-            qasm_str = json.dumps(qasms_dict)
-            job_type = "multi_manual"
-        else:
-            qasm_str = convert_to_qasm_str(circuit)
-            job_type = "normal"
-
-        job = self.sample_qasm(qasm_str, n_shots, transpiler, remark, job_type)
+        qasm_str, job_type = _circuit_to_qasm(circuit, self._qasm_cache)
+        job = self.sample_qasm(
+            qasm_str,
+            n_shots,
+            transpiler,
+            remark,
+            job_type,
+            bypass_dedup,
+            max_shots_per_job,
+            progress_callback,
+            concurrency,
+        )
 
         return job
 
@@ -576,6 +1602,10 @@ class RiquSamplingBackend(SamplingBackend):
         transpiler: Optional[str] = "normal",
         remark: Optional[str] = None,
         job_type: Optional[str] = None,
+        bypass_dedup: bool = False,
+        max_shots_per_job: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        concurrency: int = 4,
     ) -> SamplingJob:
         """Perform a sampling measurement of a OpenQASM 3.0 program.
 
@@ -587,16 +1617,53 @@ class RiquSamplingBackend(SamplingBackend):
             n_shots: Number of repetitions of each circuit, for sampling.
             transpiler: The transpiler setting.
             remark: The remark to be assigned to the job.
+            job_type: The type of the job.
+            bypass_dedup: If ``True``, a new job is posted even if an identical
+                job can be reused (see ``dedup_ttl``).
+            max_shots_per_job: If ``n_shots`` exceeds this, the sampling is split
+                into jobs of at most ``max_shots_per_job`` shots, which are
+                submitted concurrently, and a :class:`RiquCompositeSamplingJob`
+                merging their results is returned.
+                The split jobs are always posted as new jobs, regardless of
+                ``dedup_ttl``.
+            progress_callback: A function called each time one of the split jobs
+                finishes while waiting for the :class:`RiquCompositeSamplingJob`.
+            concurrency: The maximum number of split jobs posted at the same time.
 
         Returns:
             The job to be executed.
 
         Raises:
-            ValueError: If ``n_shots`` is not a positive integer.
+            ValueError: If ``n_shots``, ``max_shots_per_job`` or ``concurrency`` is
+                not a positive integer.
             BackendError: If job is wrong or if an authentication error occurred, etc.
+            RiquBatchSubmissionError: If some of the split jobs could not be
+                posted. The split jobs which were posted are cancelled, and are
+                given with the errors by its ``results``.
         """
         if not n_shots >= 1:
             raise ValueError("n_shots should be a positive integer.")
+        if max_shots_per_job is not None and not max_shots_per_job >= 1:
+            raise ValueError("max_shots_per_job should be a positive integer.")
+        if max_shots_per_job is not None and n_shots > max_shots_per_job:
+            bodies = [
+                JobsBody(
+                    qasm=qasm,
+                    shots=shots,
+                    transpiler=transpiler,
+                    remark=remark,
+                    job_type=job_type,
+                )
+                for shots in _split_shots(n_shots, max_shots_per_job)
+            ]
+            results = self._submit_many(
+                bodies, n_shots, concurrency, return_exceptions=True, dedup=False
+            )
+            jobs = [r for r in results if isinstance(r, RiquSamplingJob)]
+            if len(jobs) < len(results):
+                self._cancel_quietly(jobs)
+                raise RiquBatchSubmissionError(results)
+            return RiquCompositeSamplingJob(jobs, progress_callback)
 
         try:
             body = JobsBody(
@@ -606,17 +1673,303 @@ class RiquSamplingBackend(SamplingBackend):
                 remark=remark,
                 job_type=job_type,
             )
+            if not bypass_dedup:
+                reused = self._find_submitted(body)
+                if reused is not None:
+                    return reused
             response_post_job = self._job_api.post_job(body=body)
+            self._record_submission(body, response_post_job.job_id)
+            if self._lazy_jobs:
+                return RiquSamplingJob.from_job_id(
+                    response_post_job.job_id,
+                    self._job_api,
+                    self._polling_strategy,
+                    self._job_cache,
+                )
             response = self._job_api.get_job(response_post_job.job_id)
+            _put_cached_job(self._job_cache, response)
         except Exception as e:
             raise BackendError("To perform sampling on riqu server is failed.") from e
 
-        job = RiquSamplingJob(response, self._job_api)
+        job = RiquSamplingJob(
+            response, self._job_api, self._polling_strategy, self._job_cache
+        )
         return job
 
+    def sample_many(
+        self,
+        circuits: Sequence[
+            Union[NonParametricQuantumCircuit, list[NonParametricQuantumCircuit]]
+        ],
+        n_shots: int,
+        transpiler: Optional[str] = "normal",
+        remark: Optional[str] = None,
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[Union[RiquSamplingJob, BackendError]]:
+        """Perform sampling measurements of many circuits.
+
+        Each element of ``circuits`` is converted and submitted as one job in the
+        same way as :meth:`sample`. See :meth:`sample_qasm_many` for how the jobs
+        are submitted.
+
+        Args:
+            circuits: The circuits to be sampled. An element may be a list of
+                circuits, which is submitted as one ``multi_manual`` job.
+            n_shots: Number of repetitions of each circuit, for sampling.
+            transpiler: The transpiler setting.
+            remark: The remark to be assigned to the jobs.
+            concurrency: The maximum number of submissions in flight.
+            return_exceptions: If ``True``, a failed submission is reported as the
+                :class:`BackendError` in place of its job instead of raising.
+
+        Returns:
+            The jobs to be executed, in the order of ``circuits``.
+
+        Raises:
+            ValueError: If ``n_shots`` or ``concurrency`` is not a positive integer.
+            RiquBatchSubmissionError: If ``return_exceptions`` is ``False`` and any
+                of the submissions failed.
+        """
+        bodies = []
+        for circuit in circuits:
+            qasm_str, job_type = _circuit_to_qasm(circuit, self._qasm_cache)
+            bodies.append(
+                JobsBody(
+                    qasm=qasm_str,
+                    shots=n_shots,
+                    transpiler=transpiler,
+                    remark=remark,
+                    job_type=job_type,
+                )
+            )
+        return self._submit_many(bodies, n_shots, concurrency, return_exceptions)
+
+    def sample_qasm_many(
+        self,
+        qasms: Sequence[str],
+        n_shots: int,
+        transpiler: Optional[str] = "normal",
+        remark: Optional[str] = None,
+        job_type: Optional[str] = None,
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[Union[RiquSamplingJob, BackendError]]:
+        """Perform sampling measurements of many OpenQASM 3.0 programs.
+
+        Up to ``concurrency`` jobs are posted to riqu server at the same time over
+        the connection pool of this backend. Unlike :meth:`sample_qasm`, the jobs
+        are not retrieved from riqu server after submission: lazy jobs (see
+        :meth:`RiquSamplingJob.from_job_id`) are returned.
+
+        Args:
+            qasms: The OpenQASM 3.0 programs to be sampled.
+            n_shots: Number of repetitions of each circuit, for sampling.
+            transpiler: The transpiler setting.
+            remark: The remark to be assigned to the jobs.
+            job_type: The type of the jobs.
+            concurrency: The maximum number of submissions in flight.
+            return_exceptions: If ``True``, a failed submission is reported as the
+                :class:`BackendError` in place of its job instead of raising.
+
+        Returns:
+            The jobs to be executed, in the order of ``qasms``.
+
+        Raises:
+            ValueError: If ``n_shots`` or ``concurrency`` is not a positive integer.
+            RiquBatchSubmissionError: If ``return_exceptions`` is ``False`` and any
+                of the submissions failed.
+        """
+        bodies = [
+            JobsBody(
+                qasm=qasm,
+                shots=n_shots,
+                transpiler=transpiler,
+                remark=remark,
+                job_type=job_type,
+            )
+            for qasm in qasms
+        ]
+        return self._submit_many(bodies, n_shots, concurrency, return_exceptions)
+
+    def sample_parametric(
+        self,
+        circuit: UnboundParametricQuantumCircuitProtocol,
+        params_list: Sequence[Sequence[float]],
+        n_shots: int,
+        transpiler: Optional[str] = "normal",
+        remark: Optional[str] = None,
+    ) -> SamplingJob:
+        """Perform a sampling measurement of a parametric circuit bound to each
+        of ``params_list``, as one ``multi_manual`` job.
+
+        The OpenQASM 3.0 program of ``circuit`` is generated once (see
+        :class:`RiquQasmTemplate`) and only the angles are substituted for each
+        parameter vector. The results of the bound circuits are given by
+        :attr:`RiquSamplingResult.divided_result` in the order of
+        ``params_list``.
+
+        Args:
+            circuit: The parametric circuit to be sampled.
+            params_list: The parameter vectors to bind to ``circuit``.
+            n_shots: Number of repetitions of each circuit, for sampling.
+            transpiler: The transpiler setting.
+            remark: The remark to be assigned to the job.
+
+        Returns:
+            The job to be executed.
+
+        Raises:
+            ValueError: If ``n_shots`` is not a positive integer, if
+                ``params_list`` is empty or if the length of a parameter vector
+                does not match the parameter count of ``circuit``.
+            BackendError: If job is wrong or if an authentication error occurred, etc.
+        """
+        if not params_list:
+            raise ValueError("params_list should not be empty.")
+        template = self._qasm_cache.template(circuit)
+        qasms_dict = {"qasm": [template.bind(params) for params in params_list]}
+        return self.sample_qasm(
+            json.dumps(qasms_dict), n_shots, transpiler, remark, "multi_manual"
+        )
+
+    def sample_parametric_many(
+        self,
+        circuit: UnboundParametricQuantumCircuitProtocol,
+        params_list: Sequence[Sequence[float]],
+        n_shots: int,
+        transpiler: Optional[str] = "normal",
+        remark: Optional[str] = None,
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[Union[RiquSamplingJob, BackendError]]:
+        """Perform sampling measurements of a parametric circuit bound to each
+        of ``params_list``, as one job per parameter vector.
+
+        The OpenQASM 3.0 program of ``circuit`` is generated once in the same way
+        as :meth:`sample_parametric`, and the jobs are submitted in the same way
+        as :meth:`sample_qasm_many`.
+
+        Args:
+            circuit: The parametric circuit to be sampled.
+            params_list: The parameter vectors to bind to ``circuit``.
+            n_shots: Number of repetitions of each circuit, for sampling.
+            transpiler: The transpiler setting.
+            remark: The remark to be assigned to the jobs.
+            concurrency: The maximum number of submissions in flight.
+            return_exceptions: If ``True``, a failed submission is reported as the
+                :class:`BackendError` in place of its job instead of raising.
+
+        Returns:
+            The jobs to be executed, in the order of ``params_list``.
+
+        Raises:
+            ValueError: If ``n_shots`` or ``concurrency`` is not a positive integer
+                or if the length of a parameter vector does not match the
+                parameter count of ``circuit``.
+            RiquBatchSubmissionError: If ``return_exceptions`` is ``False`` and any
+                of the submissions failed.
+        """
+        template = self._qasm_cache.template(circuit)
+        qasms = [template.bind(params) for params in params_list]
+        return self.sample_qasm_many(
+            qasms,
+            n_shots,
+            transpiler,
+            remark,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    def _submit_many(
+        self,
+        bodies: list[JobsBody],
+        n_shots: int,
+        concurrency: int,
+        return_exceptions: bool,
+        dedup: bool = True,
+    ) -> list[Union[RiquSamplingJob, BackendError]]:
+        if not n_shots >= 1:
+            raise ValueError("n_shots should be a positive integer.")
+        if not concurrency >= 1:
+            raise ValueError("concurrency should be a positive integer.")
+        if not bodies:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(bodies)),
+            thread_name_prefix="riqu-submit",
+        ) as executor:
+            futures = [executor.submit(self._submit, body, dedup) for body in bodies]
+            results: list[Union[RiquSamplingJob, BackendError]] = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except BackendError as e:
+                    results.append(e)
+
+        if not return_exceptions and any(isinstance(r, BackendError) for r in results):
+            raise RiquBatchSubmissionError(results)
+        return results
+
+    def _submit(self, body: JobsBody, dedup: bool = True) -> RiquSamplingJob:
+        """Posts a job and returns a lazy job without retrieving it. If
+        ``dedup`` is ``False``, the job is neither reused nor recorded for
+        reuse."""
+        if dedup:
+            reused = self._find_submitted(body)
+            if reused is not None:
+                return reused
+        try:
+            response_post_job = self._job_api.post_job(body=body)
+        except Exception as e:
+            raise BackendError("To perform sampling on riqu server is failed.") from e
+        if dedup:
+            self._record_submission(body, response_post_job.job_id)
+
+        return RiquSamplingJob.from_job_id(
+            response_post_job.job_id,
+            self._job_api,
+            self._polling_strategy,
+            self._job_cache,
+        )
+
+    def _cancel_quietly(self, jobs: Sequence[RiquSamplingJob]) -> None:
+        """Cancels ``jobs``, logging the jobs which could not be cancelled."""
+        for job in jobs:
+            try:
+                self._job_api.put_jobs_job_id_cancel(job.id)
+            except Exception:
+                logger.warning("Failed to cancel job %s.", job.id, exc_info=True)
+
+    def _find_submitted(self, body: JobsBody) -> Optional[RiquSamplingJob]:
+        """Returns the succeeded job submitted with the same ``body`` within
+        ``dedup_ttl`` seconds, if it is in the job cache."""
+        if self._dedup_ttl is None or self._job_cache is None:
+            return None
+        job_id = self._job_cache.get_submission(
+            _submission_key(self._config, body), self._dedup_ttl
+        )
+        if job_id is None:
+            return None
+        cached = self._job_cache.get(job_id)
+        if cached is None or cached.status != "success":
+            return None
+        return RiquSamplingJob(
+            cached, self._job_api, self._polling_strategy, self._job_cache
+        )
+
+    def _record_submission(self, body: JobsBody, job_id: str) -> None:
+        if self._dedup_ttl is not None and self._job_cache is not None:
+            self._job_cache.put_submission(
+                _submission_key(self._config, body), job_id, self._dedup_ttl
+            )
+
     def retrieve_job(self, job_id: str) -> RiquSamplingJob:
         """Retrieves the job with the given id from riqu server.
 
+        If the job is found in the job cache, riqu server is not queried.
+
         Args:
             job_id: The id of the job to retrieve.
 
@@ -627,10 +1980,15 @@ class RiquSamplingBackend(SamplingBackend):
             BackendError: If job cannot be found or if an authentication error occurred,
                 etc.
         """
-        try:
-            response = self._job_api.get_job(job_id)
-        except Exception as e:
-            raise BackendError("To retrieve_job from riqu server is failed.") from e
-
-        job = RiquSamplingJob(response, self._job_api)
+        response = _get_cached_job(self._job_cache, job_id)
+        if response is None:
+            try:
+                response = self._job_api.get_job(job_id)
+            except Exception as e:
+                raise BackendError("To retrieve_job from riqu server is failed.") from e
+            _put_cached_job(self._job_cache, response)
+
+        job = RiquSamplingJob(
+            response, self._job_api, self._polling_strategy, self._job_cache
+        )
         return job
@@ -14,8 +14,8 @@ from typing import Optional
 
 from quri_parts.backend import BackendError
 
-from ..rest import ApiClient, Configuration, JobApi
-from .sampling import RiquConfig, RiquSamplingBackend, RiquSamplingJob
+from ..rest import JobApi
+from .sampling import RiquConfig, RiquSamplingBackend, RiquSamplingJob, _create_job_api
 
 
 class RiquSseJob:
@@ -27,19 +27,17 @@ class RiquSseJob:
         else:
             self.config = config
 
-        # construct JobApi
-        rest_config = Configuration()
-        rest_config.host = self.config.url
-        if self.config.proxy:
-            rest_config.proxy = self.config.proxy
-        api_client = ApiClient(
-            configuration=rest_config,
-            header_name="q-api-token",
-            header_value=self.config.api_token,
-        )
-        self._job_api: JobApi = JobApi(api_client=api_client)
+        # construct JobApi on the api client shared with the backends
+        self._job_api: JobApi = _create_job_api(self.config)
+        self._backend: Optional[RiquSamplingBackend] = None
         self.job = None
 
+    def _get_backend(self) -> RiquSamplingBackend:
+        # the backend is created once and connects through the same api client
+        if self._backend is None:
+            self._backend = RiquSamplingBackend(config=self.config)
+        return self._backend
+
     def run_sse(self, file_path: str, remark: Optional[str] = "") -> RiquSamplingJob:
         # if file_path is not set, raise ValueError
         if file_path is None:
@@ -72,9 +70,7 @@ class RiquSseJob:
 
             job_id = response["job_id"]
 
-            # make an instance of RiquSamplingBackend
-            riqu_sampling_backend = RiquSamplingBackend(config=self.config)
-            self.job = riqu_sampling_backend.retrieve_job(job_id=job_id)
+            self.job = self._get_backend().retrieve_job(job_id=job_id)
         except Exception as e:
             raise BackendError("To perform sse on riqu server is failed.") from e
 
@@ -13,6 +13,7 @@ Generated by: https://github.com/swagger-api/swagger-codegen.git
 from __future__ import absolute_import
 
 # import apis into sdk package
+from quri_parts.riqu.rest.api.async_job_api import AsyncJobApi
 from quri_parts.riqu.rest.api.job_api import JobApi
 
 # import ApiClient
@@ -25,3 +26,4 @@ from quri_parts.riqu.rest.models.inline_response400 import InlineResponse400
 from quri_parts.riqu.rest.models.job import Job
 from quri_parts.riqu.rest.models.jobs_body import JobsBody
 from quri_parts.riqu.rest.models.ssejobs_body import SsejobsBody
+from quri_parts.riqu.rest.throttle import RateLimit, ThrottleMetrics
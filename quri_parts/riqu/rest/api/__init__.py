@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 
 # import apis into api package
+from quri_parts.riqu.rest.api.async_job_api import AsyncJobApi
 from quri_parts.riqu.rest.api.job_api import JobApi
 
 # flake8: noqa
@@ -0,0 +1,120 @@
+# coding: utf-8
+"""Riqu (Rest Interface for QUantum computing)
+
+the cloud server with riqu interface.  # noqa: E501
+
+OpenAPI spec version: 1.1
+"""
+
+from __future__ import absolute_import
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from quri_parts.riqu.rest.api.job_api import JobApi
+
+
+class AsyncJobApi(object):
+    """Awaitable counterpart of :class:`JobApi`.
+
+    Each endpoint of :class:`JobApi` is exposed as a coroutine. The HTTP
+    request itself is carried out by the urllib3 connection pool of the
+    wrapped :class:`JobApi` on a bounded executor, so the event loop is
+    never blocked and the number of worker threads is bounded by
+    ``max_workers`` instead of growing with the number of jobs.
+
+    :param job_api: The :class:`JobApi` to wrap.
+    :param executor: An executor to perform HTTP requests on. If omitted,
+        a :class:`ThreadPoolExecutor` is created on first use.
+    :param max_workers: The number of worker threads of the executor
+        created by this class. Defaults to the connection pool size of
+        the api client.
+    """
+
+    def __init__(self, job_api=None, executor=None, max_workers=None):
+        if job_api is None:
+            job_api = JobApi()
+        self.job_api = job_api
+        self._executor = executor
+        self._owns_executor = executor is None
+        if max_workers is None:
+            max_workers = job_api.api_client.configuration.connection_pool_maxsize
+        self._max_workers = max_workers
+
+    @property
+    def api_client(self):
+        """The api client of the wrapped :class:`JobApi`."""
+        return self.job_api.api_client
+
+    @property
+    def executor(self):
+        """The executor HTTP requests are performed on."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="riqu-async-job-api",
+            )
+        return self._executor
+
+    def close(self):
+        """Shuts down the executor if it was created by this instance."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def delete_job(self, job_id, **kwargs):  # noqa: E501
+        """Delete Job.
+
+        :param str job_id: Job ID (required)
+        :return: None
+        """
+        return await self._run(self.job_api.delete_job, job_id, **kwargs)
+
+    async def download_file(self, job_id, **kwargs):  # noqa: E501
+        """Download file.
+
+        :param str job_id: Job ID (required)
+        :return: object
+        """
+        return await self._run(self.job_api.download_file, job_id, **kwargs)
+
+    async def get_job(self, job_id, **kwargs):  # noqa: E501
+        """Get Job.
+
+        :param str job_id: Job ID (required)
+        :return: Job
+        """
+        return await self._run(self.job_api.get_job, job_id, **kwargs)
+
+    async def post_job(self, **kwargs):  # noqa: E501
+        """Post Job.
+
+        :param JobsBody body:
+        :return: InlineResponse201
+        """
+        return await self._run(self.job_api.post_job, **kwargs)
+
+    async def post_ssejob(self, **kwargs):  # noqa: E501
+        """Post SSE Job.
+
+        :param str up_file:
+        :param str remark:
+        :param str job_type:
+        :return: object
+        """
+        return await self._run(self.job_api.post_ssejob, **kwargs)
+
+    async def put_jobs_job_id_cancel(self, job_id, **kwargs):  # noqa: E501
+        """Cancel Job.
+
+        :param str job_id: (required)
+        :return: None
+        """
+        return await self._run(self.job_api.put_jobs_job_id_cancel, job_id, **kwargs)
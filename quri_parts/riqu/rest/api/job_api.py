@@ -16,6 +16,7 @@ import re  # noqa: F401
 import six
 
 from quri_parts.riqu.rest.api_client import ApiClient
+from quri_parts.riqu.rest.rest import IDEMPOTENCY_KEY_HEADER
 
 
 class JobApi(object):
@@ -234,6 +235,8 @@ class JobApi(object):
 
         :param async_req bool
         :param str job_id: Job ID (required)
+        :param list[str] fields: The fields of the job to retrieve. If
+            omitted, all the fields are retrieved.
         :return: Job
                  If the method is called asynchronously,
                  returns the request thread.
@@ -256,12 +259,14 @@ class JobApi(object):
 
         :param async_req bool
         :param str job_id: Job ID (required)
+        :param list[str] fields: The fields of the job to retrieve. If
+            omitted, all the fields are retrieved.
         :return: Job
                  If the method is called asynchronously,
                  returns the request thread.
         """
 
-        all_params = ["job_id"]  # noqa: E501
+        all_params = ["job_id", "fields"]  # noqa: E501
         all_params.append("async_req")
         all_params.append("_return_http_data_only")
         all_params.append("_preload_content")
@@ -288,6 +293,9 @@ class JobApi(object):
             path_params["job_id"] = params["job_id"]  # noqa: E501
 
         query_params = []
+        if params.get("fields") is not None:
+            query_params.append(("fields", params["fields"]))  # noqa: E501
+            collection_formats["fields"] = "csv"  # noqa: E501
 
         header_params = {}
 
@@ -332,6 +340,9 @@ class JobApi(object):
 
         :param async_req bool
         :param JobsBody body:
+        :param str idempotency_key: A key unique to the submission. If
+            given, it is sent as the Idempotency-Key header and the request
+            may be retried on transient failures.
         :return: InlineResponse201
                  If the method is called asynchronously,
                  returns the request thread.
@@ -354,12 +365,15 @@ class JobApi(object):
 
         :param async_req bool
         :param JobsBody body:
+        :param str idempotency_key: A key unique to the submission. If
+            given, it is sent as the Idempotency-Key header and the request
+            may be retried on transient failures.
         :return: InlineResponse201
                  If the method is called asynchronously,
                  returns the request thread.
         """
 
-        all_params = ["body"]  # noqa: E501
+        all_params = ["body", "idempotency_key"]  # noqa: E501
         all_params.append("async_req")
         all_params.append("_return_http_data_only")
         all_params.append("_preload_content")
@@ -382,6 +396,10 @@ class JobApi(object):
         query_params = []
 
         header_params = {}
+        if params.get("idempotency_key") is not None:
+            header_params[IDEMPOTENCY_KEY_HEADER] = params[
+                "idempotency_key"
+            ]  # noqa: E501
 
         form_params = []
         local_var_files = {}
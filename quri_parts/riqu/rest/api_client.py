@@ -15,6 +15,8 @@ import mimetypes
 import os
 import re
 import tempfile
+import threading
+from collections import OrderedDict
 from multiprocessing.pool import ThreadPool
 
 # python 2 and python 3 compatibility library
@@ -24,6 +26,8 @@ from six.moves.urllib.parse import quote
 import quri_parts.riqu.rest.models
 from quri_parts.riqu.rest import rest
 from quri_parts.riqu.rest.configuration import Configuration
+from quri_parts.riqu.rest.decoders import MODEL_DECODERS
+from quri_parts.riqu.rest.throttle import RequestThrottler
 
 
 class ApiClient(object):
@@ -44,6 +48,14 @@ class ApiClient(object):
         the API.
     :param cookie: a cookie to include in the header when making calls
         to the API
+    :param pool: a ThreadPool to run `async_req` calls on. It may be shared
+        with other clients and is not closed by this client. If None, a pool
+        owned by this client is created on the first `async_req` call.
+    :param pool_threads: the number of threads of the pool created by this
+        client. If None, one thread per CPU is used.
+    :param fast_decoders: if True, the models having a decoder in
+        `decoders.MODEL_DECODERS` are decoded by it instead of the generic
+        deserialization. Set `model_decoders` to customize them.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
@@ -59,14 +71,31 @@ class ApiClient(object):
     }
 
     def __init__(
-        self, configuration=None, header_name=None, header_value=None, cookie=None
+        self,
+        configuration=None,
+        header_name=None,
+        header_value=None,
+        cookie=None,
+        pool=None,
+        pool_threads=None,
+        fast_decoders=True,
     ):
         if configuration is None:
             configuration = Configuration()
         self.configuration = configuration
 
-        self.pool = ThreadPool()
+        self._pool = pool
+        self._owns_pool = pool is None
+        self.pool_threads = pool_threads
+        self._pool_lock = threading.Lock()
         self.rest_client = rest.RESTClientObject(configuration)
+        self.throttler = RequestThrottler(configuration.rate_limits)
+        self.model_decoders = dict(MODEL_DECODERS) if fast_decoders else {}
+        # url -> (ETag, Last-Modified, deserialized object, body size) of GET
+        # responses
+        self._validators = OrderedDict()
+        self._validators_nbytes = 0
+        self._validators_lock = threading.Lock()
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -75,8 +104,24 @@ class ApiClient(object):
         self.user_agent = "Swagger-Codegen/1.0.0/python"
 
     def __del__(self):
-        self.pool.close()
-        self.pool.join()
+        self.close()
+
+    @property
+    def pool(self):
+        """ThreadPool for `async_req` calls, created on first access."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPool(self.pool_threads)
+        return self._pool
+
+    def close(self):
+        """Closes the pool if it was created by this client."""
+        pool = getattr(self, "_pool", None)
+        if pool is not None and self._owns_pool:
+            self._pool = None
+            pool.close()
+            pool.join()
 
     @property
     def user_agent(self):
@@ -90,6 +135,14 @@ class ApiClient(object):
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
+    def throttle_metrics(self):
+        """Returns the time spent throttled per endpoint.
+
+        :return: A dict from the throttled endpoints to their
+            :class:`ThrottleMetrics`.
+        """
+        return self.throttler.metrics()
+
     def __call_api(
         self,
         resource_path,
@@ -109,6 +162,7 @@ class ApiClient(object):
     ):
 
         config = self.configuration
+        throttle = self.throttler.throttle(method, resource_path)
 
         # header parameters
         header_params = header_params or {}
@@ -152,33 +206,85 @@ class ApiClient(object):
         # request url
         url = self.configuration.host + resource_path
 
+        # conditional request
+        validator_key = None
+        validator = None
+        if method == "GET" and _preload_content and self.configuration.conditional_get:
+            validator_key = (url, tuple(query_params or ()))
+            validator = self.__get_validator(validator_key)
+            if validator is not None:
+                etag, last_modified, _, _ = validator
+                if etag is not None:
+                    header_params["If-None-Match"] = etag
+                if last_modified is not None:
+                    header_params["If-Modified-Since"] = last_modified
+
         # perform request and return response
-        response_data = self.request(
-            method,
-            url,
-            query_params=query_params,
-            headers=header_params,
-            post_params=post_params,
-            body=body,
-            _preload_content=_preload_content,
-            _request_timeout=_request_timeout,
-        )
+        if throttle is not None:
+            throttle.acquire()
+        try:
+            response_data = self.request(
+                method,
+                url,
+                query_params=query_params,
+                headers=header_params,
+                post_params=post_params,
+                body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout,
+            )
+        finally:
+            if throttle is not None:
+                throttle.release()
 
         self.last_response = response_data
 
         return_data = response_data
-        if _preload_content:
+        if validator is not None and response_data.status == 304:
+            # not modified, so the body is neither sent nor deserialized
+            return_data = validator[2]
+        elif _preload_content:
             # deserialize response data
             if response_type:
                 return_data = self.deserialize(response_data, response_type)
             else:
                 return_data = None
+            if validator_key is not None:
+                self.__put_validator(validator_key, response_data, return_data)
 
         if _return_http_data_only:
             return return_data
         else:
             return (return_data, response_data.status, response_data.getheaders())
 
+    def __get_validator(self, key):
+        with self._validators_lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+            return validator
+
+    def __put_validator(self, key, response, data):
+        etag = response.getheader("ETag")
+        last_modified = response.getheader("Last-Modified")
+        size = len(response.data or b"")
+        max_bytes = self.configuration.conditional_get_max_bytes
+        remember = (etag is not None or last_modified is not None) and size <= max_bytes
+        with self._validators_lock:
+            removed = self._validators.pop(key, None)
+            if removed is not None:
+                self._validators_nbytes -= removed[3]
+            if not remember:
+                return
+            self._validators[key] = (etag, last_modified, data, size)
+            self._validators_nbytes += size
+            while (
+                len(self._validators) > self.configuration.conditional_get_maxsize
+                or self._validators_nbytes > max_bytes
+            ):
+                _, evicted = self._validators.popitem(last=False)
+                self._validators_nbytes -= evicted[3]
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -253,6 +359,10 @@ class ApiClient(object):
             return None
 
         if type(klass) == str:
+            decoder = self.model_decoders.get(klass)
+            if decoder is not None and isinstance(data, dict):
+                return decoder(data)
+
             if klass.startswith("list["):
                 sub_kls = re.match(r"list\[(.*)\]", klass).group(1)
                 return [self.__deserialize(sub_data, sub_kls) for sub_data in data]
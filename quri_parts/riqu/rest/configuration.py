@@ -93,6 +93,45 @@ class Configuration(six.with_metaclass(TypeWithDefault, object)):
         # requests to the same host, which is often the case here.
         # cpu_count * 5 is used as default value to increase performance.
         self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
+        # urllib3 pool manager's number of connection pools, one per host.
+        self.connection_pool_size = 4
+        # Set this to True to wait for a free connection instead of opening
+        # a connection which is discarded afterwards when all the
+        # connection_pool_maxsize connections of a pool are in use.
+        self.connection_pool_block = False
+        # Default timeouts in seconds to connect to the server and to read a
+        # response. None means no timeout.
+        self.connect_timeout = None
+        self.read_timeout = None
+
+        # Maximum number of retries of a request which failed to connect, or
+        # which got one of retry_status_codes in response. Other failures are
+        # retried only for idempotent methods, or for POST requests with an
+        # Idempotency-Key header. 0 disables retries.
+        self.retries = 3
+        # Backoff factor in seconds of the exponential backoff between
+        # retries. A Retry-After header in the response takes precedence.
+        self.retry_backoff_factor = 0.5
+        # HTTP status codes of the responses to retry on.
+        self.retry_status_codes = (429, 502, 503, 504)
+
+        # Client-side limits of the requests per endpoint, as a dict from
+        # endpoint keys such as "POST /jobs" or "GET /jobs/{job_id}" to
+        # quri_parts.riqu.rest.throttle.RateLimit. The limits are shared by
+        # all the users of an ApiClient.
+        self.rate_limits = {}
+
+        # Set this to True to remember the ETag and Last-Modified headers of
+        # GET responses and to make the next GET of the same url conditional.
+        # A 304 Not Modified response is then answered with the object
+        # deserialized before, which is shared by all the callers and must not
+        # be modified.
+        self.conditional_get = True
+        # Maximum number of urls whose validators and objects are remembered.
+        self.conditional_get_maxsize = 1024
+        # Maximum total size in bytes of the response bodies whose objects are
+        # remembered. Larger responses are not remembered at all.
+        self.conditional_get_max_bytes = 16 * 1024 * 1024
 
         # Proxy URL
         self.proxy = None
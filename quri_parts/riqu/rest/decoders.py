@@ -0,0 +1,119 @@
+# coding: utf-8
+"""Riqu (Rest Interface for QUantum computing)
+
+the cloud server with riqu interface.  # noqa: E501
+
+OpenAPI spec version: 1.1
+"""
+
+from __future__ import absolute_import
+
+import datetime
+
+from quri_parts.riqu.rest.models.inline_response201 import InlineResponse201
+from quri_parts.riqu.rest.models.inline_response400 import InlineResponse400
+from quri_parts.riqu.rest.models.job import Job
+from quri_parts.riqu.rest.rest import ApiException
+
+
+def _str(value):
+    if value is None or type(value) is str:
+        return value
+    return str(value)
+
+
+def _int(value):
+    if value is None or type(value) is int:
+        return value
+    try:
+        return int(value)
+    except TypeError:
+        return value
+
+
+def _datetime(value):
+    """Parses an ISO 8601 datetime, trying :meth:`datetime.fromisoformat`
+    before dateutil."""
+    if value is None or value == "":
+        return None
+    try:
+        if value.endswith("Z"):
+            return datetime.datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        from dateutil.parser import parse
+
+        return parse(value)
+    except ImportError:
+        return value
+    except ValueError:
+        raise ApiException(
+            status=0,
+            reason=("Failed to parse `{0}` as datetime object".format(value)),
+        )
+
+
+def decode_job(data):
+    """Decodes a :class:`Job` from a dict parsed from JSON.
+
+    :param data: dict.
+    :return: Job.
+    """
+    job = Job.__new__(Job)
+    get = data.get
+    job._id = _str(get("id"))
+    job._qasm = _str(get("qasm"))
+    job._transpiled_qasm = _str(get("transpiled_qasm"))
+    job._transpiler = _str(get("transpiler"))
+    job._shots = _int(get("shots"))
+    job._job_type = _str(get("job_type"))
+    job._status = None
+    status = _str(get("status"))
+    if status is not None:
+        # validated against the allowed values as by the constructor
+        job.status = status
+    job._result = _str(get("result"))
+    job._created = _datetime(get("created"))
+    job._in_queue = _datetime(get("in_queue"))
+    job._out_queue = _datetime(get("out_queue"))
+    job._ended = _datetime(get("ended"))
+    job._remark = _str(get("remark"))
+    job.discriminator = None
+    return job
+
+
+def decode_inline_response201(data):
+    """Decodes an :class:`InlineResponse201` from a dict parsed from JSON.
+
+    :param data: dict.
+    :return: InlineResponse201.
+    """
+    response = InlineResponse201.__new__(InlineResponse201)
+    response._job_id = _str(data.get("job_id"))
+    response.discriminator = None
+    return response
+
+
+def decode_inline_response400(data):
+    """Decodes an :class:`InlineResponse400` from a dict parsed from JSON.
+
+    :param data: dict.
+    :return: InlineResponse400.
+    """
+    response = InlineResponse400.__new__(InlineResponse400)
+    response._reason = _str(data.get("reason"))
+    response.discriminator = None
+    return response
+
+
+#: Decoders of models from dicts parsed from JSON, keyed by the model name.
+#: They give the same models as the generic deserialization of
+#: :class:`ApiClient`, and raise the same :class:`ValueError` for an invalid
+#: ``status``, without reflecting on ``swagger_types``.
+MODEL_DECODERS = {
+    "Job": decode_job,
+    "InlineResponse201": decode_inline_response201,
+    "InlineResponse400": decode_inline_response400,
+}
@@ -31,6 +31,11 @@ class InlineResponse201(object):
 
     attribute_map = {"job_id": "job_id"}
 
+    __slots__ = (
+        "_job_id",
+        "discriminator",
+    )
+
     def __init__(self, job_id=None):  # noqa: E501
         """InlineResponse201 - a model defined in Swagger"""  # noqa: E501
         self._job_id = None
@@ -102,7 +107,9 @@ class InlineResponse201(object):
         if not isinstance(other, InlineResponse201):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal."""
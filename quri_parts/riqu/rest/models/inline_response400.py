@@ -31,6 +31,11 @@ class InlineResponse400(object):
 
     attribute_map = {"reason": "reason"}
 
+    __slots__ = (
+        "_reason",
+        "discriminator",
+    )
+
     def __init__(self, reason=None):  # noqa: E501
         """InlineResponse400 - a model defined in Swagger"""  # noqa: E501
         self._reason = None
@@ -102,7 +107,9 @@ class InlineResponse400(object):
         if not isinstance(other, InlineResponse400):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal."""
@@ -59,6 +59,23 @@ class Job(object):
         "remark": "remark",
     }
 
+    __slots__ = (
+        "_id",
+        "_qasm",
+        "_transpiled_qasm",
+        "_transpiler",
+        "_shots",
+        "_job_type",
+        "_status",
+        "_result",
+        "_created",
+        "_in_queue",
+        "_out_queue",
+        "_ended",
+        "_remark",
+        "discriminator",
+    )
+
     def __init__(
         self,
         id=None,
@@ -424,7 +441,9 @@ class Job(object):
         if not isinstance(other, Job):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal."""
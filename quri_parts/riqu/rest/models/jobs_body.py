@@ -43,6 +43,15 @@ class JobsBody(object):
         "job_type": "job_type",
     }
 
+    __slots__ = (
+        "_qasm",
+        "_transpiler",
+        "_shots",
+        "_remark",
+        "_job_type",
+        "discriminator",
+    )
+
     def __init__(
         self, qasm=None, transpiler=None, shots=None, remark=None, job_type=None
     ):  # noqa: E501
@@ -214,7 +223,9 @@ class JobsBody(object):
         if not isinstance(other, JobsBody):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal."""
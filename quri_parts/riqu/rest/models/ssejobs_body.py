@@ -31,6 +31,13 @@ class SsejobsBody(object):
 
     attribute_map = {"up_file": "up_file", "remark": "remark", "job_type": "job_type"}
 
+    __slots__ = (
+        "_up_file",
+        "_remark",
+        "_job_type",
+        "discriminator",
+    )
+
     def __init__(self, up_file=None, remark=None, job_type=None):  # noqa: E501
         """SsejobsBody - a model defined in Swagger"""  # noqa: E501
         self._up_file = None
@@ -157,7 +164,9 @@ class SsejobsBody(object):
         if not isinstance(other, SsejobsBody):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal."""
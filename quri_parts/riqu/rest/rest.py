@@ -30,6 +30,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+#: The header by which a client marks a POST request as safe to retry.
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
 
 class RESTResponse(io.IOBase):
 
@@ -50,7 +53,7 @@ class RESTResponse(io.IOBase):
 
 class RESTClientObject(object):
 
-    def __init__(self, configuration, pools_size=4, maxsize=None):
+    def __init__(self, configuration, pools_size=None, maxsize=None):
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
@@ -82,11 +85,41 @@ class RESTClientObject(object):
             else:
                 maxsize = 4
 
+        if pools_size is None:
+            if configuration.connection_pool_size is not None:
+                pools_size = configuration.connection_pool_size
+            else:
+                pools_size = 4
+
+        # timeout of the requests made without _request_timeout
+        self.default_timeout = None
+        if (
+            configuration.connect_timeout is not None
+            or configuration.read_timeout is not None
+        ):
+            self.default_timeout = urllib3.Timeout(
+                connect=configuration.connect_timeout,
+                read=configuration.read_timeout,
+            )
+
+        # retry policy of the requests. POST is not in allowed_methods, so a
+        # POST request is only retried when it failed to connect unless it
+        # has an Idempotency-Key header (see request())
+        self.retries = urllib3.Retry(
+            total=configuration.retries,
+            backoff_factor=configuration.retry_backoff_factor,
+            status_forcelist=configuration.retry_status_codes,
+            allowed_methods=urllib3.Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
         # https pool manager
         if configuration.proxy:
             self.pool_manager = urllib3.ProxyManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
+                block=configuration.connection_pool_block,
                 cert_reqs=cert_reqs,
                 ca_certs=ca_certs,
                 cert_file=configuration.cert_file,
@@ -98,6 +131,7 @@ class RESTClientObject(object):
             self.pool_manager = urllib3.PoolManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
+                block=configuration.connection_pool_block,
                 cert_reqs=cert_reqs,
                 ca_certs=ca_certs,
                 cert_file=configuration.cert_file,
@@ -143,7 +177,7 @@ class RESTClientObject(object):
         post_params = post_params or {}
         headers = headers or {}
 
-        timeout = None
+        timeout = self.default_timeout
         if _request_timeout:
             if isinstance(
                 _request_timeout, (int,) if six.PY3 else (int, long)
@@ -157,6 +191,12 @@ class RESTClientObject(object):
         if "Content-Type" not in headers:
             headers["Content-Type"] = "application/json"
 
+        retries = self.retries
+        if method == "POST" and IDEMPOTENCY_KEY_HEADER in headers:
+            retries = retries.new(
+                allowed_methods=frozenset(retries.allowed_methods) | {"POST"}
+            )
+
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
@@ -172,6 +212,7 @@ class RESTClientObject(object):
                         body=request_body,
                         preload_content=_preload_content,
                         timeout=timeout,
+                        retries=retries,
                         headers=headers,
                     )
                 elif (
@@ -184,6 +225,7 @@ class RESTClientObject(object):
                         encode_multipart=False,
                         preload_content=_preload_content,
                         timeout=timeout,
+                        retries=retries,
                         headers=headers,
                     )
                 elif headers["Content-Type"] == "multipart/form-data":
@@ -198,6 +240,7 @@ class RESTClientObject(object):
                         encode_multipart=True,
                         preload_content=_preload_content,
                         timeout=timeout,
+                        retries=retries,
                         headers=headers,
                     )
                 # Pass a `string` parameter directly in the body to support
@@ -211,6 +254,7 @@ class RESTClientObject(object):
                         body=request_body,
                         preload_content=_preload_content,
                         timeout=timeout,
+                        retries=retries,
                         headers=headers,
                     )
                 else:
@@ -227,6 +271,7 @@ class RESTClientObject(object):
                     fields=query_params,
                     preload_content=_preload_content,
                     timeout=timeout,
+                    retries=retries,
                     headers=headers,
                 )
         except urllib3.exceptions.SSLError as e:
@@ -239,7 +284,9 @@ class RESTClientObject(object):
             # log response body
             logger.debug("response body: %s", r.data)
 
-        if not 200 <= r.status <= 299:
+        # 304 is only returned to a conditional request, whose caller
+        # handles it
+        if not 200 <= r.status <= 299 and r.status != 304:
             raise ApiException(http_resp=r)
 
         return r
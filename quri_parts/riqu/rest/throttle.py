@@ -0,0 +1,167 @@
+# coding: utf-8
+"""Riqu (Rest Interface for QUantum computing)
+
+the cloud server with riqu interface.  # noqa: E501
+
+OpenAPI spec version: 1.1
+"""
+
+from __future__ import absolute_import
+
+import threading
+import time
+from collections import namedtuple
+
+#: The endpoint to submit jobs.
+SUBMIT_ENDPOINT = "POST /jobs"
+#: The endpoint to retrieve a job.
+GET_JOB_ENDPOINT = "GET /jobs/{job_id}"
+
+
+def endpoint_key(method, resource_path):
+    """Returns the key of an endpoint, e.g. ``"GET /jobs/{job_id}"``.
+
+    :param method: The HTTP method.
+    :param resource_path: The path of the endpoint before the path
+        parameters are substituted.
+    """
+    return "%s %s" % (method.upper(), resource_path)
+
+
+class RateLimit(object):
+    """Limits of the requests to an endpoint.
+
+    :param rate: The number of requests allowed per second on average.
+        If None, the rate is not limited.
+    :param burst: The number of requests allowed at once after an idle
+        period. Defaults to ``max(1, rate)``.
+    :param max_in_flight: The maximum number of requests in flight at the
+        same time. If None, the number is not limited.
+    """
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        if rate is not None and not rate > 0:
+            raise ValueError("rate should be positive.")
+        if burst is not None and not burst >= 1:
+            raise ValueError("burst should be a positive integer.")
+        if max_in_flight is not None and not max_in_flight >= 1:
+            raise ValueError("max_in_flight should be a positive integer.")
+        self.rate = rate
+        if burst is None and rate is not None:
+            burst = max(1, rate)
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+
+    def __repr__(self):
+        return "RateLimit(rate=%r, burst=%r, max_in_flight=%r)" % (
+            self.rate,
+            self.burst,
+            self.max_in_flight,
+        )
+
+
+#: Counters of a :class:`Throttle`. ``requests`` is the number of requests
+#: made, ``throttled`` the number of them which were delayed and
+#: ``throttled_seconds`` the total time they were delayed for.
+ThrottleMetrics = namedtuple(
+    "ThrottleMetrics", ["requests", "throttled", "throttled_seconds"]
+)
+
+
+class Throttle(object):
+    """A token bucket and a semaphore which delay the requests to an
+    endpoint to keep them within a :class:`RateLimit`.
+
+    Use it as a context manager around each request.
+
+    :param limit: The :class:`RateLimit` to enforce.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._tokens = limit.burst
+        self._updated = time.monotonic()
+        self._semaphore = None
+        if limit.max_in_flight is not None:
+            self._semaphore = threading.BoundedSemaphore(limit.max_in_flight)
+        self._requests = 0
+        self._throttled = 0
+        self._throttled_seconds = 0.0
+
+    @property
+    def metrics(self):
+        """The :class:`ThrottleMetrics` of this throttle."""
+        with self._lock:
+            return ThrottleMetrics(
+                self._requests, self._throttled, self._throttled_seconds
+            )
+
+    def acquire(self):
+        """Waits until a request is allowed and returns the time waited."""
+        start = time.monotonic()
+        if self.limit.rate is not None:
+            # take a token, possibly in advance, and sleep until it is due
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.limit.burst,
+                    self._tokens + (now - self._updated) * self.limit.rate,
+                )
+                self._updated = now
+                self._tokens -= 1
+                delay = -self._tokens / self.limit.rate if self._tokens < 0 else 0
+            if delay > 0:
+                time.sleep(delay)
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+
+        waited = time.monotonic() - start
+        with self._lock:
+            self._requests += 1
+            if waited > 0.001:
+                self._throttled += 1
+                self._throttled_seconds += waited
+        return waited
+
+    def release(self):
+        """Marks a request allowed by :meth:`acquire` as finished."""
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+class RequestThrottler(object):
+    """Throttles the requests of an api client per endpoint.
+
+    :param rate_limits: A dict from endpoint keys (see
+        :func:`endpoint_key`) to :class:`RateLimit`. Requests to the
+        other endpoints are not throttled.
+    """
+
+    def __init__(self, rate_limits=None):
+        self._throttles = dict(
+            (endpoint, Throttle(limit))
+            for endpoint, limit in (rate_limits or {}).items()
+        )
+
+    def throttle(self, method, resource_path):
+        """Returns the :class:`Throttle` of an endpoint, or None if the
+        endpoint is not throttled."""
+        if not self._throttles:
+            return None
+        return self._throttles.get(endpoint_key(method, resource_path))
+
+    def metrics(self):
+        """Returns a dict from the throttled endpoints to their
+        :class:`ThrottleMetrics`."""
+        return dict(
+            (endpoint, throttle.metrics)
+            for endpoint, throttle in self._throttles.items()
+        )
@@ -1,12 +1,20 @@
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Optional, TypeVar
+import json
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import wait
+from typing import TYPE_CHECKING, Optional, TypeVar, cast
 
+from quri_parts.backend import BackendError
 from quri_parts.circuit import ImmutableQuantumCircuit
 from quri_parts.core.sampling import ConcurrentSampler, MeasurementCounts
-from quri_parts.core.utils.concurrent import execute_concurrently
-from quri_parts.openqasm.circuit import convert_to_qasm_str
 
-from quri_parts.riqu.backend import RiquSamplingBackend
+from quri_parts.riqu.backend import (
+    RiquConfig,
+    RiquJobPoller,
+    RiquPollingStrategy,
+    RiquSamplingBackend,
+    RiquSamplingJob,
+)
 
 T_common = TypeVar("T_common")
 T_individual = TypeVar("T_individual")
@@ -18,39 +26,210 @@ if TYPE_CHECKING:
 # RiquProperty = {"qubit_index":int, "measurement_window_index":int}
 # RiquResult = {"counts":MeasurementCounts,"divided_result":None,
 # "properties":Mapping[int,RiquProperty],"transpiler_info":dict,"message":str}
-backend = RiquSamplingBackend()
 
+# the default backend is created on first use so that importing this module does
+# not read the configuration nor open connections
+_default_backend: Optional[RiquSamplingBackend] = None
+_default_backend_lock = threading.Lock()
 
-# MeasurementCountsとSamplingCountsは等価
-def _sample(circuit: ImmutableQuantumCircuit, shots: int) -> MeasurementCounts:
-    qasm = convert_to_qasm_str(circuit)
-    job = backend.sample_qasm(qasm, n_shots=shots)
-    result = job.result().counts
-    return result
 
+def _get_default_backend() -> RiquSamplingBackend:
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            _default_backend = RiquSamplingBackend()
+        return _default_backend
 
-def _sample_sequentially(
-    _: Any, circuit_shots_tuples: Iterable[tuple[ImmutableQuantumCircuit, int]]
-) -> Iterable[MeasurementCounts]:
-    return [_sample(circuit, shots) for circuit, shots in circuit_shots_tuples]
+
+def __getattr__(name: str) -> object:
+    # keeps ``samplar.backend`` working for code written against the former
+    # module-level backend
+    if name == "backend":
+        return _get_default_backend()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+#: A submitted job and the index of the circuit in its ``divided_result``, or
+#: ``None`` if the circuit is submitted alone.
+_Submission = tuple[RiquSamplingJob, Optional[int]]
+
+# length of '{"qasm": []}' and of the separator ", " in a multi_manual payload
+_PAYLOAD_OVERHEAD = 12
+_PAYLOAD_SEPARATOR = 2
+
+
+def _pack(
+    qasms: Sequence[str], max_circuits_per_job: int, max_payload_bytes: Optional[int]
+) -> list[list[int]]:
+    """Splits the indices of ``qasms`` into consecutive groups each of which
+    fits in a multi_manual job. A program larger than ``max_payload_bytes`` is
+    put in a group alone."""
+    packs: list[list[int]] = []
+    pack: list[int] = []
+    size = _PAYLOAD_OVERHEAD
+    for i, qasm in enumerate(qasms):
+        qasm_size = len(json.dumps(qasm).encode("utf-8")) + _PAYLOAD_SEPARATOR
+        if pack and (
+            len(pack) >= max_circuits_per_job
+            or (max_payload_bytes is not None and size + qasm_size > max_payload_bytes)
+        ):
+            packs.append(pack)
+            pack, size = [], _PAYLOAD_OVERHEAD
+        pack.append(i)
+        size += qasm_size
+    if pack:
+        packs.append(pack)
+    return packs
+
+
+def _submit_all(
+    backend: RiquSamplingBackend,
+    circuit_shots_tuples: Sequence[tuple[ImmutableQuantumCircuit, int]],
+    concurrency: int,
+    pack: bool = False,
+    max_circuits_per_job: int = 100,
+    max_payload_bytes: Optional[int] = None,
+) -> list[_Submission]:
+    # jobs take one n_shots, so circuits are submitted per shot count
+    indices_by_shots: dict[int, list[int]] = {}
+    for i, (_, shots) in enumerate(circuit_shots_tuples):
+        indices_by_shots.setdefault(shots, []).append(i)
+
+    submissions: dict[int, _Submission] = {}
+    for shots, indices in indices_by_shots.items():
+        if not pack:
+            # without return_exceptions, all the elements are jobs
+            submitted = cast(
+                list[RiquSamplingJob],
+                backend.sample_many(
+                    [circuit_shots_tuples[i][0] for i in indices],
+                    n_shots=shots,
+                    concurrency=concurrency,
+                ),
+            )
+            submissions.update((i, (job, None)) for i, job in zip(indices, submitted))
+            continue
+
+        qasms = [
+            backend.qasm_cache.convert(circuit_shots_tuples[i][0]) for i in indices
+        ]
+        packs = _pack(qasms, max_circuits_per_job, max_payload_bytes)
+        submitted = cast(
+            list[RiquSamplingJob],
+            backend.sample_qasm_many(
+                [json.dumps({"qasm": [qasms[k] for k in p]}) for p in packs],
+                n_shots=shots,
+                job_type="multi_manual",
+                concurrency=concurrency,
+            ),
+        )
+        for p, job in zip(packs, submitted):
+            for position, k in enumerate(p):
+                submissions[indices[k]] = (job, position)
+    return [submissions[i] for i in range(len(circuit_shots_tuples))]
 
 
 def _sample_concurrently(
+    backend: RiquSamplingBackend,
     circuit_shots_tuples: Iterable[tuple[ImmutableQuantumCircuit, int]],
     executor: Optional["Executor"],
     concurrency: int = 1,
+    pack: bool = False,
+    max_circuits_per_job: int = 100,
+    max_payload_bytes: Optional[int] = None,
 ) -> Iterable[MeasurementCounts]:
-    return execute_concurrently(
-        _sample_sequentially, None, circuit_shots_tuples, executor, concurrency
+    # submit all the circuits first, then wait for all the jobs together
+    submissions = _submit_all(
+        backend,
+        list(circuit_shots_tuples),
+        concurrency,
+        pack,
+        max_circuits_per_job,
+        max_payload_bytes,
     )
+    if not submissions:
+        return []
+
+    jobs = list({id(job): job for job, _ in submissions}.values())
+    polling_strategy = backend.polling_strategy or RiquPollingStrategy()
+    with RiquJobPoller(polling_strategy=polling_strategy) as poller:
+        futures = [poller.watch(job) for job in jobs]
+        wait(futures)
+    for future in futures:
+        job = future.result()
+        if job.status != "success":
+            raise BackendError(f"Job ended with status {job.status}.")
+    # MeasurementCountsとSamplingCountsは等価
+    return [
+        (
+            job.result().counts
+            if position is None
+            else job.result().divided_result_at(position)
+        )
+        for job, position in submissions
+    ]
 
 
 def create_riqu_concurrent_sampler(
-    executor: Optional["Executor"] = None, concurrency: int = 1
+    executor: Optional["Executor"] = None,
+    concurrency: int = 1,
+    backend: Optional[RiquSamplingBackend] = None,
+    config: Optional[RiquConfig] = None,
+    pack: bool = False,
+    max_circuits_per_job: int = 100,
+    max_payload_bytes: Optional[int] = 1024 * 1024,
 ) -> ConcurrentSampler:
+    """Creates a :class:`ConcurrentSampler` which samples on riqu server.
+
+    All the circuits passed to the sampler are submitted first, with up to
+    ``concurrency`` submissions in flight, and the jobs are then waited for
+    together by a single :class:`RiquJobPoller`. ``executor`` is not used and
+    is kept for compatibility.
+
+    The sampler uses ``backend`` if given. Otherwise a backend is created on
+    the first call of the sampler, from ``config`` if given, or else a backend
+    shared by the samplers of this module is created in the same way as
+    :class:`RiquSamplingBackend` reads its default configuration.
+
+    If ``pack`` is ``True``, circuits with the same number of shots are packed
+    into ``multi_manual`` jobs of up to ``max_circuits_per_job`` circuits and
+    ``max_payload_bytes`` bytes of programs, and the counts of each circuit
+    are taken from the ``divided_result`` of its job.
+
+    Raises:
+        ValueError: If both ``backend`` and ``config`` are given, or if
+            ``max_circuits_per_job`` or ``max_payload_bytes`` is not positive.
+    """
+    if backend is not None and config is not None:
+        raise ValueError("Only one of backend and config should be given.")
+    if not max_circuits_per_job >= 1:
+        raise ValueError("max_circuits_per_job should be a positive integer.")
+    if max_payload_bytes is not None and not max_payload_bytes >= 1:
+        raise ValueError("max_payload_bytes should be a positive integer.")
+
+    sampler_backend = backend
+    lock = threading.Lock()
+
+    def get_backend() -> RiquSamplingBackend:
+        nonlocal sampler_backend
+        if config is None and sampler_backend is None:
+            return _get_default_backend()
+        with lock:
+            if sampler_backend is None:
+                sampler_backend = RiquSamplingBackend(config)
+            return sampler_backend
+
     def sampler(
         circuit_shots_tuples: Iterable[tuple[ImmutableQuantumCircuit, int]]
     ) -> Iterable[MeasurementCounts]:
-        return _sample_concurrently(circuit_shots_tuples, executor, concurrency)
+        return _sample_concurrently(
+            get_backend(),
+            circuit_shots_tuples,
+            executor,
+            concurrency,
+            pack,
+            max_circuits_per_job,
+            max_payload_bytes,
+        )
 
     return sampler
@@ -0,0 +1,290 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from typing import Optional
+
+import pytest
+from quri_parts.backend import BackendError
+from quri_parts.circuit import QuantumCircuit
+
+from quri_parts.riqu.backend import (
+    AsyncRiquSamplingBackend,
+    AsyncRiquSamplingJob,
+    RiquConfig,
+)
+from quri_parts.riqu.rest import AsyncJobApi, Job, JobApi, JobsBody
+from quri_parts.riqu.rest.models import InlineResponse201
+
+qasm_data = """OPENQASM 3;
+include "stdgates.inc";
+qubit[2] q;
+
+h q[0];
+cx q[0], q[1];"""
+
+
+def get_dummy_job(status: str = "success") -> Job:
+    job = Job(
+        id="dummy_id",
+        qasm="dummy_qasm",
+        transpiled_qasm="dummy_transpiled_qasm",
+        transpiler="normal",
+        shots=10000,
+        job_type="normal",
+        status=status,
+        result=(
+            '{"counts": {"00": 6000, "10": 4000}, "properties": {'
+            ' "0": {"qubit_index": 0, "measurement_window_index": 0},'
+            ' "1": {"qubit_index": 1, "measurement_window_index": 0}}}'
+        ),
+        created="dummy_created",
+        in_queue="dummy_in_queue",
+        out_queue="dummy_out_queue",
+        ended="dummy_ended",
+        remark="dummy_remark",
+    )
+    return job
+
+
+def get_dummy_jobs_body(
+    qasm: Optional[str] = qasm_data,
+    job_type: Optional[str] = None,
+) -> JobsBody:
+    return JobsBody(
+        qasm=qasm,
+        transpiler="normal",
+        shots=10000,
+        remark=None,
+        job_type=job_type,
+    )
+
+
+def get_dummy_config() -> RiquConfig:
+    return RiquConfig("dummpy_url", "dummy_api_token")
+
+
+class TestAsyncRiquSamplingJob:
+    def test_init_error(self):
+        # case: job is None
+        with pytest.raises(ValueError):
+            AsyncRiquSamplingJob(job=None, job_api="dummy")
+
+        # case: job_api is None
+        with pytest.raises(ValueError):
+            AsyncRiquSamplingJob(job=Job(), job_api=None)
+
+    def test_properties(self):
+        # Arrange
+        job = AsyncRiquSamplingJob(job=get_dummy_job(), job_api="dummy")
+
+        # Act & Assert
+        assert job.id == "dummy_id"
+        assert job.qasm == "dummy_qasm"
+        assert job.status == "success"
+        assert job.remark == "dummy_remark"
+        result = asyncio.run(job.result())
+        assert result.counts == {0: 6000, 2: 4000}
+
+    def test_result(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            side_effect=[get_dummy_job("processing"), get_dummy_job("success")],
+        )
+        job = AsyncRiquSamplingJob(
+            job=get_dummy_job("processing"), job_api=AsyncJobApi(JobApi())
+        )
+
+        # Act
+        actual = asyncio.run(job.result(wait=0.01))
+
+        # Assert
+        assert job.status == "success"
+        assert actual.counts == {0: 6000, 2: 4000}
+
+    def test_result__failure(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            return_value=get_dummy_job("failure"),
+        )
+        job = AsyncRiquSamplingJob(
+            job=get_dummy_job("processing"), job_api=AsyncJobApi(JobApi())
+        )
+
+        # Act & Assert
+        with pytest.raises(BackendError):
+            asyncio.run(job.result(wait=0.01))
+
+    def test_result__timeout(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            return_value=get_dummy_job("processing"),
+        )
+        job = AsyncRiquSamplingJob(
+            job=get_dummy_job("processing"), job_api=AsyncJobApi(JobApi())
+        )
+
+        # Act & Assert
+        with pytest.raises(BackendError):
+            asyncio.run(job.result(timeout=0.05, wait=0.01))
+
+    def test_cancel(self, mocker):
+        # Arrange
+        mock_obj = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.put_jobs_job_id_cancel",
+            return_value=None,
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            return_value=get_dummy_job("cancelled"),
+        )
+        job = AsyncRiquSamplingJob(
+            job=get_dummy_job("processing"), job_api=AsyncJobApi(JobApi())
+        )
+
+        # Act
+        asyncio.run(job.cancel())
+
+        # Assert
+        mock_obj.assert_called_once_with("dummy_id")
+        assert job.status == "cancelled"
+
+
+class TestAsyncRiquSamplingBackend:
+    def test_sample(self, mocker):
+        # Arrange
+        mock_obj = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            return_value=InlineResponse201("dummy_id"),
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        backend = AsyncRiquSamplingBackend(get_dummy_config())
+
+        circuit = QuantumCircuit(2)
+        circuit.add_H_gate(0)
+        circuit.add_CNOT_gate(0, 1)
+
+        # Act
+        job = asyncio.run(backend.sample(circuit, n_shots=10000))
+
+        # Assert
+        assert type(job) is AsyncRiquSamplingJob
+        assert job.id == "dummy_id"
+        mock_obj.assert_called_once_with(body=get_dummy_jobs_body(job_type="normal"))
+
+    def test_sample_qasm__concurrent(self, mocker):
+        # Arrange
+        mock_obj = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            return_value=InlineResponse201("dummy_id"),
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        backend = AsyncRiquSamplingBackend(get_dummy_config())
+
+        async def run():
+            jobs = await asyncio.gather(
+                *[backend.sample_qasm(qasm_data, n_shots=10000) for _ in range(20)]
+            )
+            return await asyncio.gather(*[job.result() for job in jobs])
+
+        # Act
+        results = asyncio.run(run())
+
+        # Assert
+        assert len(results) == 20
+        assert mock_obj.call_count == 20
+        assert all(result.counts == {0: 6000, 2: 4000} for result in results)
+
+    def test_sample_qasm__invalid_shots(self):
+        backend = AsyncRiquSamplingBackend(get_dummy_config())
+        with pytest.raises(ValueError):
+            asyncio.run(backend.sample_qasm(qasm_data, n_shots=0))
+
+    def test_retrieve_job(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        backend = AsyncRiquSamplingBackend(get_dummy_config())
+
+        # Act
+        job = asyncio.run(backend.retrieve_job("job_id"))
+
+        # Assert
+        assert type(job) is AsyncRiquSamplingJob
+        assert job.id == "dummy_id"
+        assert job.status == "success"
+
+    def test_retrieve_job__error(self, mocker):
+        # Arrange
+        mocker.patch("quri_parts.riqu.rest.JobApi.get_job", side_effect=Exception())
+        backend = AsyncRiquSamplingBackend(get_dummy_config())
+
+        # Act & Assert
+        with pytest.raises(BackendError):
+            asyncio.run(backend.retrieve_job("job_id"))
+
+    def test_retrieve_job__cache(self, mocker, tmp_path):
+        # Arrange
+        mock_get = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        config = RiquConfig("dummy_url", "dummy_api_token", cache_dir=str(tmp_path))
+        backend = AsyncRiquSamplingBackend(config)
+        cache_threads = []
+        get = backend._job_cache.get
+
+        def spy_get(job_id):
+            cache_threads.append(threading.current_thread())
+            return get(job_id)
+
+        mocker.patch.object(backend._job_cache, "get", side_effect=spy_get)
+
+        async def run():
+            first = await backend.retrieve_job("dummy_id")
+            second = await backend.retrieve_job("dummy_id")
+            await second.refresh()
+            return first, second
+
+        # Act
+        first, second = asyncio.run(run())
+        backend.close()
+
+        # Assert: the job cache is accessed off the event loop thread
+        assert mock_get.call_count == 1
+        assert second.status == "success"
+        assert len(cache_threads) == 3
+        assert threading.main_thread() not in cache_threads
+
+    def test_close(self):
+        # Arrange
+        backend = AsyncRiquSamplingBackend(get_dummy_config())
+
+        async def run():
+            async with backend as entered:
+                assert entered is backend
+                executor = backend._job_api.executor
+            return executor
+
+        # Act
+        executor = asyncio.run(run())
+
+        # Assert
+        assert backend._job_api._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
@@ -0,0 +1,132 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import os
+import time
+
+import pytest
+
+from quri_parts.riqu.backend import RiquJobCache
+from quri_parts.riqu.rest import Job
+
+
+def get_dummy_job(job_id: str = "dummy_id") -> Job:
+    return Job(
+        id=job_id,
+        qasm="dummy_qasm",
+        shots=10000,
+        status="success",
+        result='{"counts": {"00": 6000, "10": 4000}, "properties": {}}',
+        created=datetime.datetime(2023, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        ended="dummy_ended",
+    )
+
+
+class TestRiquJobCache:
+    def test_init_error(self):
+        with pytest.raises(ValueError):
+            RiquJobCache(":memory:", max_bytes=-1)
+
+    def test_put_get(self, tmp_path):
+        # Arrange
+        cache = RiquJobCache.from_cache_dir(str(tmp_path / "riqu"))
+
+        # Act
+        cache.put(get_dummy_job())
+        cache.close()
+        actual = RiquJobCache.from_cache_dir(str(tmp_path / "riqu")).get("dummy_id")
+
+        # Assert
+        assert os.path.exists(tmp_path / "riqu" / "jobs.sqlite3")
+        assert actual == get_dummy_job()
+
+    def test_get__not_cached(self):
+        cache = RiquJobCache(":memory:")
+        assert cache.get("dummy_id") is None
+        assert "dummy_id" not in cache
+
+    def test_put__replace(self):
+        # Arrange
+        cache = RiquJobCache(":memory:")
+        job = get_dummy_job()
+        cache.put(job)
+
+        # Act
+        job.remark = "dummy_remark"
+        cache.put(job)
+
+        # Assert
+        assert len(cache) == 1
+        assert cache.get("dummy_id").remark == "dummy_remark"
+
+    def test_put__evict(self):
+        # Arrange
+        cache = RiquJobCache(":memory:")
+        cache.put(get_dummy_job("id0"))
+        size = cache.nbytes
+        cache = RiquJobCache(":memory:", max_bytes=2 * size)
+
+        # Act
+        cache.put(get_dummy_job("id0"))
+        cache.put(get_dummy_job("id1"))
+        cache.get("id0")  # id1 becomes least recently used
+        cache.put(get_dummy_job("id2"))
+
+        # Assert
+        assert len(cache) == 2
+        assert "id0" in cache
+        assert "id1" not in cache
+        assert "id2" in cache
+        assert cache.nbytes <= 2 * size
+
+    def test_remove_clear(self):
+        # Arrange
+        cache = RiquJobCache(":memory:")
+        cache.put(get_dummy_job("id0"))
+        cache.put(get_dummy_job("id1"))
+
+        # Act & Assert
+        cache.remove("id0")
+        assert "id0" not in cache
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+    def test_submission(self, mocker):
+        # Arrange
+        cache = RiquJobCache(":memory:")
+
+        # Act
+        cache.put_submission("key", "dummy_id")
+
+        # Assert
+        assert cache.get_submission("key") == "dummy_id"
+        assert cache.get_submission("key", max_age=60.0) == "dummy_id"
+        assert cache.get_submission("other") is None
+        mocker.patch("time.time", return_value=time.time() + 120.0)
+        assert cache.get_submission("key", max_age=60.0) is None
+
+    def test_put_submission__prune(self, mocker):
+        # Arrange
+        cache = RiquJobCache(":memory:")
+        cache.put_submission("old", "id0")
+        mocker.patch("time.time", return_value=time.time() + 120.0)
+
+        # Act
+        cache.put_submission("new", "id1", max_age=60.0)
+
+        # Assert: the expired submission is removed from the database
+        assert cache.get_submission("old") is None
+        assert cache.get_submission("new") == "id1"
+        (count,) = cache._connection.execute(
+            "SELECT COUNT(*) FROM submissions"
+        ).fetchone()
+        assert count == 1
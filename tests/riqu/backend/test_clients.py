@@ -0,0 +1,120 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from quri_parts.riqu.backend import (
+    RiquClientRegistry,
+    RiquConfig,
+    RiquSamplingBackend,
+    RiquSseJob,
+)
+from quri_parts.riqu.rest import Configuration
+
+
+class TestRiquClientRegistry:
+    def test_get(self):
+        # Arrange
+        registry = RiquClientRegistry()
+        config = RiquConfig("dummy_url", "dummy_token", "https://dummy:1234")
+
+        # Act
+        client = registry.get(config)
+        same = registry.get(
+            RiquConfig("dummy_url", "dummy_token", "https://dummy:1234")
+        )
+        other_token = registry.get(
+            RiquConfig("dummy_url", "other_token", "https://dummy:1234")
+        )
+        other_proxy = registry.get(RiquConfig("dummy_url", "dummy_token"))
+        other_pool = registry.get(
+            RiquConfig("dummy_url", "dummy_token", "https://dummy:1234", pool_maxsize=2)
+        )
+
+        # Assert
+        assert client is same
+        assert client is not other_token
+        assert client is not other_proxy
+        assert client is not other_pool
+        assert len(registry) == 4
+        assert client.configuration.host == "dummy_url"
+        assert client.configuration.proxy == "https://dummy:1234"
+        assert client.default_headers["q-api-token"] == "dummy_token"
+        assert other_proxy.configuration.proxy is None
+        assert other_pool.configuration.connection_pool_maxsize == 2
+
+    def test_get__rate_limits(self):
+        # Arrange
+        registry = RiquClientRegistry()
+        config = RiquConfig(
+            "dummy_url",
+            "dummy_token",
+            submit_rate=2,
+            submit_concurrency=4,
+            poll_concurrency=8,
+        )
+
+        # Act
+        client = registry.get(config)
+
+        # Assert
+        rate_limits = client.configuration.rate_limits
+        assert rate_limits.keys() == {"POST /jobs", "GET /jobs/{job_id}"}
+        assert rate_limits["POST /jobs"].rate == 2
+        assert rate_limits["POST /jobs"].max_in_flight == 4
+        assert rate_limits["GET /jobs/{job_id}"].rate is None
+        assert rate_limits["GET /jobs/{job_id}"].max_in_flight == 8
+        assert client.throttle_metrics().keys() == rate_limits.keys()
+
+    def test_get__rate_limits_not_shared(self):
+        # Arrange
+        registry = RiquClientRegistry()
+
+        # Act
+        limited = registry.get(
+            RiquConfig("https://a.example", "dummy_token", submit_rate=1.0)
+        )
+        unlimited = registry.get(RiquConfig("https://b.example", "other_token"))
+
+        # Assert
+        assert limited.throttle_metrics().keys() == {"POST /jobs"}
+        assert unlimited.configuration.rate_limits == {}
+        assert unlimited.throttler.throttle("POST", "/jobs") is None
+        assert unlimited.throttle_metrics() == {}
+        assert Configuration().rate_limits == {}
+
+    def test_clear(self):
+        # Arrange
+        registry = RiquClientRegistry()
+        config = RiquConfig("dummy_url", "dummy_token")
+        client = registry.get(config)
+
+        # Act
+        registry.clear()
+
+        # Assert
+        assert len(registry) == 0
+        assert registry.get(config) is not client
+
+    def test_shared_by_backends_and_sse_jobs(self):
+        # Arrange
+        config = RiquConfig("shared_url", "shared_token")
+
+        # Act
+        backend = RiquSamplingBackend(config)
+        other_backend = RiquSamplingBackend(config)
+        sse_job = RiquSseJob(config)
+        other_config_backend = RiquSamplingBackend(
+            RiquConfig("shared_url", "other_token")
+        )
+
+        # Assert
+        client = backend._job_api.api_client
+        assert other_backend._job_api.api_client is client
+        assert sse_job._job_api.api_client is client
+        assert other_config_backend._job_api.api_client is not client
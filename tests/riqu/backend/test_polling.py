@@ -0,0 +1,210 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import wait
+
+import pytest
+from quri_parts.backend import BackendError
+
+from quri_parts.riqu.backend import RiquJobPoller, RiquSamplingJob
+from quri_parts.riqu.rest import Job
+
+
+def get_dummy_job(job_id: str = "dummy_id", status: str = "success") -> Job:
+    return Job(
+        id=job_id,
+        status=status,
+        result='{"counts": {"00": 6000, "10": 4000}, "properties": {}}',
+    )
+
+
+class MockJobApi:
+    """Returns ``processing`` for each job id until it has been queried
+    ``n_processing`` times."""
+
+    def __init__(self, n_processing: int = 1, final_status: str = "success"):
+        self.n_processing = n_processing
+        self.final_status = final_status
+        self.calls: list[tuple[str, float]] = []
+
+    def get_job(self, job_id):
+        self.calls.append((job_id, time.monotonic()))
+        n_calls = sum(1 for called_id, _ in self.calls if called_id == job_id)
+        if n_calls <= self.n_processing:
+            return get_dummy_job(job_id, "processing")
+        return get_dummy_job(job_id, self.final_status)
+
+
+class TestRiquJobPoller:
+    def test_init_error(self):
+        with pytest.raises(ValueError):
+            RiquJobPoller(interval=-1.0)
+        with pytest.raises(ValueError):
+            RiquJobPoller(max_requests_per_second=0)
+
+    def test_watch__already_final(self):
+        # Arrange
+        job = RiquSamplingJob(get_dummy_job(), MockJobApi())
+        called = []
+
+        # Act
+        with RiquJobPoller() as poller:
+            future = poller.watch(job, callback=called.append)
+
+            # Assert
+            assert future.done()
+            assert future.result() is job
+            assert called == [job]
+            assert poller.pending == 0
+
+    def test_watch(self):
+        # Arrange
+        job_api = MockJobApi(n_processing=2, final_status="failure")
+        jobs = [
+            RiquSamplingJob(get_dummy_job(f"id{i}", "queued"), job_api)
+            for i in range(5)
+        ]
+        called = []
+
+        # Act
+        with RiquJobPoller(interval=0.01, max_requests_per_second=None) as poller:
+            futures = [poller.watch(job, callback=called.append) for job in jobs]
+            done, not_done = wait(futures, timeout=5.0)
+
+        # Assert
+        assert not not_done
+        assert [future.result() for future in futures] == jobs
+        assert all(job.status == "failure" for job in jobs)
+        assert sorted(job.id for job in called) == [f"id{i}" for i in range(5)]
+        assert len(job_api.calls) == 15
+
+    def test_watch__lazy(self):
+        # Arrange
+        job_api = MockJobApi(n_processing=1)
+        jobs = [RiquSamplingJob.from_job_id(f"id{i}", job_api) for i in range(3)]
+
+        # Act
+        with RiquJobPoller(interval=60.0, max_requests_per_second=None) as poller:
+            futures = [poller.watch(job) for job in jobs]
+            calls_at_watch = len(job_api.calls)
+            poller.close()
+
+        # Assert: the jobs are not retrieved on the caller's thread
+        assert calls_at_watch == 0
+        assert all(future.cancelled() for future in futures)
+        assert not any(job.loaded for job in jobs)
+
+    def test_watch__lazy_polled(self):
+        # Arrange
+        job_api = MockJobApi(n_processing=1)
+        jobs = [RiquSamplingJob.from_job_id(f"id{i}", job_api) for i in range(3)]
+
+        # Act
+        with RiquJobPoller(interval=0.01, max_requests_per_second=None) as poller:
+            futures = [poller.watch(job) for job in jobs]
+            done, not_done = wait(futures, timeout=5.0)
+
+        # Assert
+        assert not not_done
+        assert all(future.result().status == "success" for future in futures)
+        assert len(job_api.calls) == 6
+
+    def test_watch__rate_limit(self):
+        # Arrange
+        job_api = MockJobApi(n_processing=0)
+        jobs = [
+            RiquSamplingJob(get_dummy_job(f"id{i}", "queued"), job_api)
+            for i in range(5)
+        ]
+
+        # Act
+        with RiquJobPoller(interval=0.0, max_requests_per_second=50.0) as poller:
+            wait([poller.watch(job) for job in jobs], timeout=5.0)
+
+        # Assert
+        times = [called_at for _, called_at in job_api.calls]
+        assert len(times) == 5
+        assert times[-1] - times[0] >= 4 * 0.02 * 0.9
+
+    def test_watch__error(self):
+        # Arrange
+        class ErrorJobApi:
+            def get_job(self, job_id):
+                raise Exception("dummy error")
+
+        job = RiquSamplingJob(get_dummy_job(status="queued"), ErrorJobApi())
+
+        # Act
+        with RiquJobPoller(interval=0.0) as poller:
+            future = poller.watch(job)
+            wait([future], timeout=5.0)
+
+        # Assert
+        with pytest.raises(BackendError):
+            future.result()
+
+    def test_close(self):
+        # Arrange
+        job = RiquSamplingJob(get_dummy_job(status="queued"), MockJobApi())
+        poller = RiquJobPoller(interval=60.0)
+        future = poller.watch(job)
+        assert poller.pending == 1
+
+        # Act
+        poller.close()
+
+        # Assert
+        assert future.cancelled()
+        assert poller.pending == 0
+        with pytest.raises(RuntimeError):
+            poller.watch(job)
+
+    def test_close__in_flight(self):
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+
+        class BlockingJobApi:
+            def get_job(self, job_id):
+                started.set()
+                release.wait(5.0)
+                return get_dummy_job(job_id, "processing")
+
+        job = RiquSamplingJob(get_dummy_job(status="queued"), BlockingJobApi())
+        poller = RiquJobPoller(interval=0.0)
+        future = poller.watch(job)
+        assert started.wait(5.0)
+
+        # Act
+        closer = threading.Thread(target=poller.close)
+        closer.start()
+        while not poller._closed:
+            time.sleep(0.001)
+        release.set()
+        closer.join(5.0)
+
+        # Assert: the job refreshed while closing is cancelled as well
+        assert not closer.is_alive()
+        assert future.cancelled()
+
+    def test_close__not_cancel_pending(self):
+        # Arrange
+        job = RiquSamplingJob(get_dummy_job(status="queued"), MockJobApi())
+        poller = RiquJobPoller(interval=60.0)
+        future = poller.watch(job)
+
+        # Act
+        pending = poller.close(cancel_pending=False)
+
+        # Assert
+        assert pending == [job]
+        assert not future.done()
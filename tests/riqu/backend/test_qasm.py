@@ -0,0 +1,198 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from quri_parts.circuit import (
+    LinearMappedUnboundParametricQuantumCircuit,
+    QuantumCircuit,
+    UnboundParametricQuantumCircuit,
+)
+from quri_parts.openqasm.circuit import convert_to_qasm_str
+
+from quri_parts.riqu.backend import RiquQasmCache, RiquQasmTemplate
+
+
+def get_circuit(angle: float = 0.1) -> QuantumCircuit:
+    circuit = QuantumCircuit(3)
+    circuit.add_H_gate(0)
+    circuit.add_CNOT_gate(0, 1)
+    circuit.add_RY_gate(2, angle)
+    return circuit
+
+
+class TestRiquQasmCache:
+    def test_init_error(self):
+        with pytest.raises(ValueError):
+            RiquQasmCache(max_entries=-1)
+        with pytest.raises(ValueError):
+            RiquQasmCache(max_bytes=-1)
+
+    def test_convert(self, mocker):
+        # Arrange
+        cache = RiquQasmCache()
+        spy = mocker.patch(
+            "quri_parts.riqu.backend.qasm.convert_to_qasm_str",
+            wraps=convert_to_qasm_str,
+        )
+
+        # Act
+        first = cache.convert(get_circuit())
+        second = cache.convert(get_circuit().freeze())
+        other = cache.convert(get_circuit(0.2))
+
+        # Assert
+        assert first == second == convert_to_qasm_str(get_circuit())
+        assert other == convert_to_qasm_str(get_circuit(0.2))
+        assert spy.call_count == 2
+        assert cache.hits == 1
+        assert cache.misses == 2
+        assert len(cache) == 2
+        assert cache.nbytes == len(first) + len(other)
+
+    def test_convert__max_entries(self):
+        # Arrange
+        cache = RiquQasmCache(max_entries=2)
+
+        # Act
+        cache.convert(get_circuit(0.1))
+        cache.convert(get_circuit(0.2))
+        cache.convert(get_circuit(0.1))  # 0.2 becomes least recently used
+        cache.convert(get_circuit(0.3))
+        cache.convert(get_circuit(0.1))
+        cache.convert(get_circuit(0.2))
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.hits == 2
+        assert cache.misses == 4
+
+    def test_convert__max_bytes(self):
+        # Arrange
+        size = len(convert_to_qasm_str(get_circuit(0.1)))
+        cache = RiquQasmCache(max_bytes=size + 1)
+
+        # Act
+        cache.convert(get_circuit(0.1))
+        cache.convert(get_circuit(0.2))
+
+        # Assert
+        assert len(cache) == 1
+        assert cache.nbytes <= size + 1
+
+    def test_convert__disabled(self):
+        # Arrange
+        cache = RiquQasmCache(max_entries=0)
+
+        # Act
+        cache.convert(get_circuit())
+        cache.convert(get_circuit())
+
+        # Assert
+        assert len(cache) == 0
+        assert cache.hits == 0
+        assert cache.misses == 2
+
+    def test_clear(self):
+        # Arrange
+        cache = RiquQasmCache()
+        cache.convert(get_circuit())
+        cache.convert(get_circuit())
+
+        # Act
+        cache.clear()
+
+        # Assert
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+        assert cache.hits == 0
+        assert cache.misses == 0
+
+
+def get_parametric_circuit() -> UnboundParametricQuantumCircuit:
+    circuit = UnboundParametricQuantumCircuit(3)
+    circuit.add_H_gate(0)
+    circuit.add_ParametricRX_gate(0)
+    circuit.add_CNOT_gate(0, 1)
+    circuit.add_ParametricRY_gate(1)
+    circuit.add_RZ_gate(2, 0.5)
+    circuit.add_ParametricRZ_gate(2)
+    return circuit
+
+
+class TestRiquQasmTemplate:
+    def test_bind(self):
+        # Arrange
+        circuit = get_parametric_circuit()
+        template = RiquQasmTemplate(circuit)
+
+        # Act & Assert
+        assert template.parameter_count == 3
+        for params in [[0.1, 0.2, 0.3], [1, -2.5, 1e-20]]:
+            expected = convert_to_qasm_str(circuit.bind_parameters(params))
+            assert template.bind(params) == expected
+
+    def test_bind__linear_mapped(self):
+        # Arrange
+        circuit = LinearMappedUnboundParametricQuantumCircuit(2)
+        theta = circuit.add_parameter("theta")
+        circuit.add_H_gate(0)
+        circuit.add_ParametricRX_gate(1, {theta: 2.0})
+        template = RiquQasmTemplate(circuit)
+
+        # Act
+        qasm = template.bind([0.25])
+
+        # Assert
+        assert qasm == convert_to_qasm_str(circuit.bind_parameters([0.25]))
+
+    def test_bind__invalid_params(self):
+        template = RiquQasmTemplate(get_parametric_circuit())
+        with pytest.raises(ValueError):
+            template.bind([0.1, 0.2])
+
+    def test_init__unsupported_gate(self):
+        circuit = UnboundParametricQuantumCircuit(2)
+        circuit.add_ParametricPauliRotation_gate([0, 1], [1, 2])
+        with pytest.raises(ValueError):
+            RiquQasmTemplate(circuit)
+
+    def test_cache_template(self):
+        # Arrange
+        cache = RiquQasmCache()
+
+        # Act
+        first = cache.template(get_parametric_circuit())
+        second = cache.template(get_parametric_circuit())
+
+        # Assert
+        assert first is second
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.nbytes == first.nbytes
+
+    def test_cache_template__linear_mapped(self):
+        # Arrange
+        cache = RiquQasmCache()
+        circuits = []
+        for coeff in [1.0, 2.0]:
+            circuit = LinearMappedUnboundParametricQuantumCircuit(1)
+            theta = circuit.add_parameter("theta")
+            circuit.add_ParametricRX_gate(0, {theta: coeff})
+            circuits.append(circuit)
+
+        # Act
+        first = cache.template(circuits[0]).bind([0.5])
+        second = cache.template(circuits[1]).bind([0.5])
+
+        # Assert: circuits with equal gates but different mappings are not mixed
+        assert first == convert_to_qasm_str(circuits[0].bind_parameters([0.5]))
+        assert second == convert_to_qasm_str(circuits[1].bind_parameters([0.5]))
+        assert first != second
+        assert len(cache) == 0
@@ -9,19 +9,32 @@
 # limitations under the License.
 
 import json
+import sqlite3
+import threading
 import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Dict, Optional
 from unittest.mock import mock_open
+from urllib.parse import parse_qs, urlparse
 
+import numpy as np
 import pytest
 from quri_parts.backend import BackendError
-from quri_parts.circuit import QuantumCircuit
+from quri_parts.circuit import QuantumCircuit, UnboundParametricQuantumCircuit
+from quri_parts.openqasm.circuit import convert_to_qasm_str
 
 from quri_parts.riqu.backend.sampling import (
+    JOB_STATUS_FIELDS,
+    RiquBatchSubmissionError,
+    RiquCompositeSamplingJob,
     RiquConfig,
+    RiquPollingStrategy,
     RiquSamplingBackend,
     RiquSamplingJob,
     RiquSamplingResult,
+    _create_job_api,
+    _to_sampling_result,
 )
 from quri_parts.riqu.rest import Job, JobApi, JobsBody
 from quri_parts.riqu.rest.models import InlineResponse201
@@ -38,6 +51,22 @@ api_token=test_api_token
 url=test_url
 api_token=test_api_token
 proxy=https://testproxy:port
+cache_dir=~/riqu_cache
+
+[pool]
+url=test_url
+api_token=test_api_token
+pool_size=2
+pool_maxsize=16
+pool_block=true
+connect_timeout=5
+read_timeout=30.5
+retries=5
+retry_backoff_factor=0.1
+submit_rate=2.5
+submit_concurrency=4
+poll_rate=10
+poll_concurrency=8
 
 [wrong]
 url=test_url
@@ -310,6 +339,308 @@ class TestRiquSamplingResult:
         expected = str(result_dict)
         assert actual == expected
 
+    def test_outcomes(self):
+        # Arrange
+        result = RiquSamplingResult({"counts": {0: 6000, 2: 4000}, "properties": {}})
+
+        # Act & Assert
+        assert result.outcomes.dtype == np.uint64
+        assert result.outcomes.tolist() == [0, 2]
+        assert result.counts_array.dtype == np.int64
+        assert result.counts_array.tolist() == [6000, 4000]
+
+    def test_to_sampling_result(self):
+        # Arrange
+        bit_strings = [format(i * 7919, "040b") for i in range(1000)]
+        job = get_dummy_job()
+        job.result = json.dumps(
+            {"counts": {bits: 3 for bits in bit_strings}, "properties": {}}
+        )
+
+        # Act
+        result = _to_sampling_result(job)
+
+        # Assert
+        assert result.outcomes.dtype == np.uint64
+        assert result.outcomes.tolist() == [i * 7919 for i in range(1000)]
+        assert result.counts_array.tolist() == [3] * 1000
+        assert "counts" not in result._result
+        assert result.counts == Counter({i * 7919: 3 for i in range(1000)})
+        assert "counts" in repr(result)
+
+    def test_to_sampling_result__lazy(self):
+        # Arrange
+        job = get_dummy_job()
+        job.result = json.dumps(
+            {
+                "counts": {"01": 10},
+                "properties": {"0": {"qubit_index": 0}},
+                "divided_result": {"0": {"01": 4}, "1": {"10": 6}},
+                "message": "SUCCESS!",
+            }
+        )
+
+        # Act
+        result = _to_sampling_result(job)
+
+        # Assert
+        assert result._raw is None
+        assert result.message == "SUCCESS!"
+        assert result._result == {"message": "SUCCESS!"}
+        assert result.divided_result == [{1: 4}, {2: 6}]
+        assert result.divided_result is result.divided_result
+        assert result.transpiler_info is None
+        assert "counts" not in result._result
+        assert repr(result) == str(
+            {
+                "counts": Counter({1: 10}),
+                "properties": {0: {"qubit_index": 0}},
+                "divided_result": [{1: 4}, {2: 6}],
+                "message": "SUCCESS!",
+            }
+        )
+
+    def test_iter_divided_results(self):
+        # Arrange
+        job = get_dummy_job()
+        job.result = json.dumps(
+            {
+                "counts": {"01": 10},
+                "properties": {},
+                "divided_result": {str(i): {format(i, "08b"): i} for i in range(300)},
+            }
+        )
+        result = _to_sampling_result(job)
+
+        # Act
+        actual = list(result.iter_divided_results())
+
+        # Assert
+        assert actual == [{i: i} for i in range(300)]
+        assert "divided_result" not in result._result
+        assert result.divided_result_at(7) == {7: 7}
+        assert result.divided_result_at(-1) == {299: 299}
+        with pytest.raises(IndexError):
+            result.divided_result_at(300)
+        assert list(result.iter_divided_results()) == result.divided_result
+
+    def test_iter_divided_results__none(self):
+        # Arrange
+        job = get_dummy_job()
+        result = _to_sampling_result(job)
+        dict_result = RiquSamplingResult(
+            {"counts": {}, "properties": {}, "divided_result": [{0: 1}, {1: 2}]}
+        )
+
+        # Act & Assert
+        assert list(result.iter_divided_results()) == []
+        with pytest.raises(ValueError):
+            result.divided_result_at(0)
+        assert list(dict_result.iter_divided_results()) == [{0: 1}, {1: 2}]
+        assert dict_result.divided_result_at(1) == {1: 2}
+
+    def test_to_sampling_result__error(self):
+        job = get_dummy_job()
+        job.result = '{"counts": {"01": 10}}'
+        result = _to_sampling_result(job)
+        with pytest.raises(ValueError):
+            result.properties
+
+    def test_to_sampling_result__wide(self):
+        # Arrange
+        job = get_dummy_job()
+        job.result = json.dumps(
+            {
+                "counts": {"1" + "0" * 64: 1, "1" * 64: 2, "11": 3},
+                "properties": {},
+            }
+        )
+
+        # Act
+        result = _to_sampling_result(job)
+
+        # Assert
+        assert result.outcomes.dtype == object
+        assert result.outcomes.tolist() == [2**64, 2**64 - 1, 3]
+        assert result.counts == {2**64: 1, 2**64 - 1: 2, 3: 3}
+
+
+class TestRiquCompositeSamplingJob:
+    def test_init_error(self):
+        with pytest.raises(ValueError):
+            RiquCompositeSamplingJob([])
+
+    def test_result__divided_result(self, mocker):
+        # Arrange
+        def get_job(counts):
+            job = get_dummy_job()
+            job.result = json.dumps(
+                {
+                    "counts": counts,
+                    "properties": {},
+                    "divided_result": {"0": counts, "1": {"11": 1}},
+                }
+            )
+            return job
+
+        jobs = [
+            RiquSamplingJob(get_job({"00": 1, "01": 2}), JobApi()),
+            RiquSamplingJob(get_job({"01": 3}), JobApi()),
+        ]
+        mocker.patch.object(RiquSamplingJob, "refresh")
+        composite = RiquCompositeSamplingJob(jobs)
+
+        # Act
+        result = composite.result()
+
+        # Assert
+        assert result.counts == {0: 1, 1: 5}
+        assert result.divided_result == [{0: 1, 1: 5}, {3: 2}]
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            {
+                "counts": {"01": 3},
+                "properties": {"0": {"qubit_index": 1}},
+                "divided_result": {"0": {"01": 3}, "1": {"11": 1}},
+            },
+            {
+                "counts": {"01": 3},
+                "properties": {"0": {"qubit_index": 0}},
+                "divided_result": {"0": {"01": 3}},
+            },
+        ],
+    )
+    def test_result__not_mergeable(self, mocker, other):
+        # Arrange
+        first = get_dummy_job()
+        first.result = json.dumps(
+            {
+                "counts": {"00": 1},
+                "properties": {"0": {"qubit_index": 0}},
+                "divided_result": {"0": {"00": 1}, "1": {"11": 1}},
+            }
+        )
+        second = get_dummy_job()
+        second.result = json.dumps(other)
+        jobs = [RiquSamplingJob(first, JobApi()), RiquSamplingJob(second, JobApi())]
+        mocker.patch.object(RiquSamplingJob, "refresh")
+        composite = RiquCompositeSamplingJob(jobs)
+
+        # Act & Assert
+        with pytest.raises(BackendError):
+            composite.result()
+
+    def test_wait_for_completion__timeout(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            return_value=get_dummy_job("processing"),
+        )
+        jobs = [RiquSamplingJob(get_dummy_job("processing"), JobApi())] * 2
+        composite = RiquCompositeSamplingJob(jobs)
+
+        # Act & Assert
+        assert not composite.wait_for_completion(timeout=0.05, wait=0.01)
+        assert composite.n_finished == 0
+        with pytest.raises(BackendError):
+            composite.result(timeout=0.05, wait=0.01)
+
+
+class TestRiquPollingStrategy:
+    def test_init_error(self):
+        with pytest.raises(ValueError):
+            RiquPollingStrategy(initial_interval=-1.0)
+        with pytest.raises(ValueError):
+            RiquPollingStrategy(growth_factor=0.5)
+        with pytest.raises(ValueError):
+            RiquPollingStrategy(initial_interval=10.0, max_interval=1.0)
+        with pytest.raises(ValueError):
+            RiquPollingStrategy(jitter=1.5)
+
+    def test_interval(self):
+        # Arrange
+        strategy = RiquPollingStrategy(
+            initial_interval=1.0, growth_factor=2.0, max_interval=5.0
+        )
+
+        # Act
+        actual = [strategy.interval(attempt) for attempt in range(5)]
+
+        # Assert
+        assert actual == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_interval__large_attempt(self):
+        # Arrange
+        strategy = RiquPollingStrategy(growth_factor=2.0, max_interval=30.0)
+        default = RiquPollingStrategy()
+
+        # Act & Assert: the interval stays at the cap instead of overflowing
+        assert strategy.interval(1024) == 30.0
+        assert strategy.interval(10**6) == 30.0
+        assert default.interval(1750) == 30.0
+
+    def test_interval__status(self):
+        # Arrange
+        strategy = RiquPollingStrategy(
+            initial_interval=1.0,
+            growth_factor=2.0,
+            max_interval=5.0,
+            status_intervals={"queued": 30.0, "processing": 0.5},
+        )
+
+        # Act & Assert
+        assert strategy.interval(3, "queued") == 30.0
+        assert strategy.interval(3, "processing") == 0.5
+        assert strategy.interval(3, "created") == 5.0
+
+    def test_interval__jitter(self):
+        # Arrange
+        strategy = RiquPollingStrategy(
+            initial_interval=10.0, max_interval=10.0, jitter=0.2
+        )
+
+        # Act
+        actual = [strategy.interval(0) for _ in range(100)]
+
+        # Assert
+        assert all(8.0 <= interval <= 12.0 for interval in actual)
+        assert len(set(actual)) > 1
+
+    def test_fixed(self):
+        strategy = RiquPollingStrategy.fixed(3.0)
+        assert [strategy.interval(attempt) for attempt in range(3)] == [3.0] * 3
+
+    def test_schedule(self):
+        # Arrange
+        schedule = RiquPollingStrategy(
+            initial_interval=1.0, growth_factor=2.0, max_interval=8.0
+        ).schedule()
+
+        # Act
+        actual = [
+            schedule.next_interval(status)
+            for status in ["queued", "queued", "queued", "processing", "processing"]
+        ]
+
+        # Assert: back-off restarts when the status changes
+        assert actual == [1.0, 2.0, 4.0, 1.0, 2.0]
+
+    def test_schedule__capped(self):
+        # Arrange
+        schedule = RiquPollingStrategy(
+            initial_interval=1.0, growth_factor=2.0, max_interval=8.0
+        ).schedule()
+
+        # Act
+        actual = [schedule.next_interval("queued") for _ in range(2000)]
+
+        # Assert: the attempt stops growing once the interval is capped
+        assert actual[:5] == [1.0, 2.0, 4.0, 8.0, 8.0]
+        assert set(actual[3:]) == {8.0}
+        assert schedule._attempt == 3
+
 
 class TestRiquSamplingJob:
     def test_init_error(self):
@@ -510,6 +841,34 @@ class TestRiquSamplingJob:
         # Assert
         assert actual is not None
 
+    def test_result__cached(self, mocker):
+        # Arrange
+        spy = mocker.patch(
+            "quri_parts.riqu.backend.sampling.json.loads", wraps=json.loads
+        )
+        job = RiquSamplingJob(job=get_dummy_job(), job_api=JobApi())
+
+        # Act
+        first = job.result()
+        second = job.result()
+
+        # Assert
+        assert first is second
+        spy.assert_not_called()
+        assert first.counts == {0: 6000, 2: 4000}
+        assert first.properties[1]["qubit_index"] == 1
+        spy.assert_called_once()
+
+        # a refreshed job is decoded again only if it has changed
+        mock_get = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        job.refresh()
+        assert job.result() is first
+        mock_get.return_value.remark = "other_remark"
+        job.refresh()
+        assert job.result() is not first
+
     def test_result__wait(self, mocker):
         # Arrange
         mocker.patch(
@@ -558,6 +917,100 @@ class TestRiquSamplingJob:
         with pytest.raises(BackendError):
             job.result(timeout=10.0, wait=3.0)
 
+    def test_wait_for_completion__polling_strategy(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            side_effect=[
+                get_dummy_job("queued"),
+                get_dummy_job("queued"),
+                get_dummy_job("processing"),
+                get_dummy_job("success"),
+            ],
+        )
+        mock_sleep = mocker.patch("quri_parts.riqu.backend.sampling.time.sleep")
+        strategy = RiquPollingStrategy(
+            initial_interval=1.0,
+            growth_factor=2.0,
+            max_interval=8.0,
+            status_intervals={"processing": 0.5},
+        )
+        job = RiquSamplingJob(
+            job=get_dummy_job("queued"), job_api=JobApi(), polling_strategy=strategy
+        )
+
+        # Act
+        actual = job.wait_for_completion()
+
+        # Assert
+        assert actual.status == "success"
+        assert job.poll_intervals == [1.0, 2.0, 0.5]
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 0.5]
+
+    def test_result__polling_strategy(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            side_effect=[get_dummy_job("processing"), get_dummy_job("success")],
+        )
+        mocker.patch("quri_parts.riqu.backend.sampling.time.sleep")
+        job = RiquSamplingJob(
+            job=get_dummy_job("processing"),
+            job_api=JobApi(),
+            polling_strategy=RiquPollingStrategy.fixed(100.0),
+        )
+
+        # Act
+        actual = job.result(polling_strategy=RiquPollingStrategy.fixed(0.25))
+
+        # Assert: the explicit strategy takes precedence over the job default
+        assert actual.counts == {0: 6000, 2: 4000}
+        assert job.poll_intervals == [0.25]
+
+    def test_from_job_id(self, mocker):
+        # Arrange
+        mock_get = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+
+        # Act
+        job = RiquSamplingJob.from_job_id("dummy_id", JobApi())
+
+        # Assert
+        assert job.id == "dummy_id"
+        assert not job.loaded
+        mock_get.assert_not_called()
+
+        assert job.qasm == "dummy_qasm"
+        assert job.loaded
+        assert job.status == "success"
+        mock_get.assert_called_once_with("dummy_id")
+
+    def test_from_job_id__error(self, mocker):
+        # Arrange
+        mocker.patch("quri_parts.riqu.rest.JobApi.get_job", side_effect=Exception())
+        job = RiquSamplingJob.from_job_id("dummy_id", JobApi())
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            RiquSamplingJob.from_job_id(None, JobApi())
+        with pytest.raises(BackendError):
+            job.status
+
+    def test_from_job_id__result(self, mocker):
+        # Arrange
+        mock_get = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        job = RiquSamplingJob.from_job_id("dummy_id", JobApi())
+
+        # Act
+        actual = job.result()
+
+        # Assert
+        assert actual.counts == {0: 6000, 2: 4000}
+        mock_get.assert_called_once_with("dummy_id")
+
     def test_cancel(self, mocker):
         # Arrange
         mock_obj = mocker.patch(
@@ -620,6 +1073,32 @@ class TestRiquConfig:
         assert actual.url == "test_url"
         assert actual.api_token == "test_api_token"
         assert actual.proxy == "https://testproxy:port"
+        assert actual.cache_dir == "~/riqu_cache"
+        assert actual.pool_size is None
+        assert actual.pool_maxsize is None
+        assert actual.pool_block is False
+        assert actual.connect_timeout is None
+        assert actual.read_timeout is None
+
+    def test_from_file__pool(self, mocker):
+        # Arrange
+        mocker.patch("builtins.open", mock_open(read_data=config_file_data))
+
+        # Act
+        actual = RiquConfig.from_file(section="pool")
+
+        # Assert
+        assert actual.pool_size == 2
+        assert actual.pool_maxsize == 16
+        assert actual.pool_block is True
+        assert actual.connect_timeout == 5.0
+        assert actual.read_timeout == 30.5
+        assert actual.retries == 5
+        assert actual.retry_backoff_factor == 0.1
+        assert actual.submit_rate == 2.5
+        assert actual.submit_concurrency == 4
+        assert actual.poll_rate == 10.0
+        assert actual.poll_concurrency == 8
 
     def test_from_file__wrong(self, mocker):
         # Arrange
@@ -644,8 +1123,58 @@ class TestRiquConfig:
         assert actual.api_token == "dummy_api_token"
         assert actual.proxy == "https://dummy:1234"
 
+    def test_init__invalid_pool(self):
+        with pytest.raises(ValueError):
+            RiquConfig("dummy_url", "dummy_api_token", pool_size=0)
+        with pytest.raises(ValueError):
+            RiquConfig("dummy_url", "dummy_api_token", pool_maxsize=0)
+        with pytest.raises(ValueError):
+            RiquConfig("dummy_url", "dummy_api_token", connect_timeout=0)
+        with pytest.raises(ValueError):
+            RiquConfig("dummy_url", "dummy_api_token", read_timeout=-1)
+        with pytest.raises(ValueError):
+            RiquConfig("dummy_url", "dummy_api_token", retries=-1)
+        with pytest.raises(ValueError):
+            RiquConfig("dummy_url", "dummy_api_token", retry_backoff_factor=-1)
+        with pytest.raises(ValueError):
+            RiquConfig("dummy_url", "dummy_api_token", submit_rate=0)
+        with pytest.raises(ValueError):
+            RiquConfig("dummy_url", "dummy_api_token", poll_concurrency=0)
+
 
 class TestRiquSamplingBackend:
+    def test_init__pool(self):
+        # Arrange
+        config = RiquConfig(
+            "pool_url",
+            "pool_token",
+            pool_size=2,
+            pool_maxsize=16,
+            pool_block=True,
+            connect_timeout=5,
+            read_timeout=30,
+            retries=5,
+            retry_backoff_factor=0.1,
+        )
+
+        # Act
+        backend = RiquSamplingBackend(config)
+        default_backend = RiquSamplingBackend(RiquConfig("pool_url", "pool_token"))
+
+        # Assert
+        rest_client = backend._job_api.api_client.rest_client
+        pool = rest_client.pool_manager.connection_from_url("https://pool_url")
+        assert rest_client.pool_manager.pools._maxsize == 2
+        assert pool.pool.maxsize == 16
+        assert pool.block is True
+        assert rest_client.default_timeout.connect_timeout == 5
+        assert rest_client.default_timeout.read_timeout == 30
+        assert rest_client.retries.total == 5
+        assert rest_client.retries.backoff_factor == 0.1
+        default_rest_client = default_backend._job_api.api_client.rest_client
+        assert default_rest_client is not rest_client
+        assert default_rest_client.default_timeout is None
+
     def test_init__use_env(self, mocker):
         # Arrange
         def mock_getenv(key, default=None):
@@ -717,6 +1246,29 @@ class TestRiquSamplingBackend:
         assert job.id == "dummy_id"
         mock_obj.assert_called_once_with(body=get_dummy_jobs_body(job_type="normal"))
 
+    def test_sample__qasm_cache(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            return_value=InlineResponse201("dummy_id"),
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        circuit = QuantumCircuit(2)
+        circuit.add_H_gate(0)
+        circuit.add_CNOT_gate(0, 1)
+
+        # Act
+        backend.sample(circuit, n_shots=10000)
+        backend.sample([circuit, circuit], n_shots=10000)
+
+        # Assert
+        assert backend.qasm_cache.misses == 1
+        assert backend.qasm_cache.hits == 2
+
     def test_sample_circuit_array(self, mocker):
         # Arrange
         mock_obj = mocker.patch(
@@ -812,6 +1364,45 @@ class TestRiquSamplingBackend:
         assert job.id == "dummy_id"
         mock_obj.assert_called_once_with(body=get_dummy_jobs_body())
 
+    def test_sample__polling_strategy(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            return_value=InlineResponse201("dummy_id"),
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        strategy = RiquPollingStrategy(initial_interval=0.5)
+        backend = RiquSamplingBackend(get_dummy_config(), polling_strategy=strategy)
+
+        # Act
+        job = backend.sample_qasm(qasm_data, n_shots=10000)
+
+        # Assert
+        assert backend.polling_strategy is strategy
+        assert job.polling_strategy is strategy
+
+    def test_sample_qasm__lazy_jobs(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            return_value=InlineResponse201("dummy_id"),
+        )
+        mock_get = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        backend = RiquSamplingBackend(get_dummy_config(), lazy_jobs=True)
+
+        # Act
+        job = backend.sample_qasm(qasm_data, n_shots=10000)
+
+        # Assert
+        assert job.id == "dummy_id"
+        mock_get.assert_not_called()
+        assert job.status == "success"
+        mock_get.assert_called_once_with("dummy_id")
+
     def test_sample_qasm__transpiler(self, mocker):
         # Arrange
         mock_obj = mocker.patch(
@@ -879,3 +1470,607 @@ class TestRiquSamplingBackend:
         assert job.out_queue == "dummy_out_queue"
         assert job.ended == "dummy_ended"
         assert job.remark == "dummy_remark"
+
+    def test_retrieve_job__cache(self, mocker, tmp_path):
+        # Arrange
+        mock_get = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            side_effect=[get_dummy_job("processing"), get_dummy_job()],
+        )
+        config = RiquConfig("dummy_url", "dummy_api_token", cache_dir=str(tmp_path))
+        backend = RiquSamplingBackend(config)
+
+        # Act
+        processing = backend.retrieve_job("dummy_id")
+        finished = backend.retrieve_job("dummy_id")
+        cached = RiquSamplingBackend(config).retrieve_job("dummy_id")
+        cached.refresh()
+
+        # Assert
+        assert mock_get.call_count == 2
+        assert processing.status == "processing"
+        assert finished.status == "success"
+        assert cached.status == "success"
+        assert cached.result().counts == {0: 6000, 2: 4000}
+        assert len(backend.job_cache) == 1
+
+    def test_refresh__cache_error(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        config = RiquConfig("dummy_url", "dummy_api_token", cache_dir=str(tmp_path))
+        backend = RiquSamplingBackend(config)
+        job = backend.retrieve_job("dummy_id")
+        mocker.patch.object(
+            backend.job_cache, "get", side_effect=sqlite3.OperationalError("locked")
+        )
+
+        # Act & Assert
+        with pytest.raises(BackendError):
+            job.refresh()
+
+    def test_sample_qasm__dedup(self, mocker):
+        # Arrange
+        mock_post = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            side_effect=[InlineResponse201("id0"), InlineResponse201("id1")],
+        )
+
+        def get_job(job_id):
+            job = get_dummy_job()
+            job.id = job_id
+            return job
+
+        mocker.patch("quri_parts.riqu.rest.JobApi.get_job", side_effect=get_job)
+        backend = RiquSamplingBackend(get_dummy_config(), dedup_ttl=60.0)
+
+        # Act
+        first = backend.sample_qasm(qasm_data, n_shots=10000)
+        second = backend.sample_qasm(qasm_data, n_shots=10000)
+        third = backend.sample_qasm(qasm_data, n_shots=10000, bypass_dedup=True)
+
+        # Assert
+        assert mock_post.call_count == 2
+        assert first.id == second.id == "id0"
+        assert second.result().counts == {0: 6000, 2: 4000}
+        assert third.id == "id1"
+        assert backend.job_cache is not None
+
+    def test_sample_qasm__dedup_shared_cache_dir(self, mocker, tmp_path):
+        # Arrange
+        job_ids = (f"id{i}" for i in range(100))
+        mock_post = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            side_effect=lambda body: InlineResponse201(next(job_ids)),
+        )
+
+        def get_job(job_id):
+            job = get_dummy_job()
+            job.id = job_id
+            return job
+
+        mocker.patch("quri_parts.riqu.rest.JobApi.get_job", side_effect=get_job)
+
+        def backend(url, api_token):
+            config = RiquConfig(url, api_token, cache_dir=str(tmp_path))
+            return RiquSamplingBackend(config, dedup_ttl=60.0)
+
+        # Act
+        first = backend("https://a.example", "token").sample_qasm(qasm_data, 100)
+        same = backend("https://a.example", "token").sample_qasm(qasm_data, 100)
+        other_url = backend("https://b.example", "token").sample_qasm(qasm_data, 100)
+        other_token = backend("https://a.example", "other").sample_qasm(qasm_data, 100)
+
+        # Assert: jobs are reused only for the same server and user
+        assert mock_post.call_count == 3
+        assert same.id == first.id == "id0"
+        assert other_url.id == "id1"
+        assert other_token.id == "id2"
+
+    def test_sample_qasm__dedup_not_reused(self, mocker):
+        # Arrange
+        mock_post = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            return_value=InlineResponse201("dummy_id"),
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            return_value=get_dummy_job("failure"),
+        )
+        backend = RiquSamplingBackend(get_dummy_config(), dedup_ttl=60.0)
+        no_dedup_backend = RiquSamplingBackend(get_dummy_config())
+
+        # Act
+        backend.sample_qasm(qasm_data, n_shots=10000)
+        backend.sample_qasm(qasm_data, n_shots=10000)  # failed job is not reused
+        backend.sample_qasm(qasm_data, n_shots=100)
+        no_dedup_backend.sample_qasm(qasm_data, n_shots=10000)
+        no_dedup_backend.sample_qasm(qasm_data, n_shots=10000)
+
+        # Assert
+        assert mock_post.call_count == 5
+        assert no_dedup_backend.job_cache is None
+        with pytest.raises(ValueError):
+            RiquSamplingBackend(get_dummy_config(), dedup_ttl=-1.0)
+
+    def test_sample__max_shots_per_job(self, mocker):
+        # Arrange
+        mock_post = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            side_effect=lambda body: InlineResponse201(f"id{body.shots}"),
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            side_effect=[
+                get_dummy_job("processing"),
+                get_dummy_job(),
+                get_dummy_job(),
+                get_dummy_job(),
+            ],
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+        progress = []
+
+        circuit = QuantumCircuit(2)
+        circuit.add_H_gate(0)
+        circuit.add_CNOT_gate(0, 1)
+
+        # Act
+        job = backend.sample(
+            circuit,
+            n_shots=25000,
+            max_shots_per_job=10000,
+            progress_callback=lambda job, done, total: progress.append((done, total)),
+        )
+        result = job.result(wait=0.01)
+
+        # Assert
+        assert type(job) is RiquCompositeSamplingJob
+        assert sorted(c.kwargs["body"].shots for c in mock_post.call_args_list) == [
+            5000,
+            10000,
+            10000,
+        ]
+        assert result.counts == {0: 18000, 2: 12000}
+        assert result.properties[0]["qubit_index"] == 0
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert job.result() is result
+
+    def test_sample__max_shots_per_job_not_split(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            return_value=InlineResponse201("dummy_id"),
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        # Act
+        job = backend.sample_qasm(qasm_data, n_shots=10000, max_shots_per_job=10000)
+
+        # Assert
+        assert type(job) is RiquSamplingJob
+        with pytest.raises(ValueError):
+            backend.sample_qasm(qasm_data, n_shots=10000, max_shots_per_job=0)
+
+    def test_sample__max_shots_per_job_failure(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            return_value=InlineResponse201("dummy_id"),
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job",
+            side_effect=[get_dummy_job(), get_dummy_job("failure")],
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+        job = backend.sample_qasm(qasm_data, n_shots=20000, max_shots_per_job=10000)
+
+        # Act & Assert
+        with pytest.raises(BackendError):
+            job.result()
+
+    def test_sample__max_shots_per_job_dedup(self, mocker):
+        # Arrange
+        job_ids = (f"id{i}" for i in range(100))
+        mock_post = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            side_effect=lambda body: InlineResponse201(next(job_ids)),
+        )
+
+        def get_job(job_id):
+            job = get_dummy_job()
+            job.id = job_id
+            return job
+
+        mocker.patch("quri_parts.riqu.rest.JobApi.get_job", side_effect=get_job)
+        backend = RiquSamplingBackend(get_dummy_config(), dedup_ttl=60.0)
+        backend.sample_qasm(qasm_data, n_shots=1000)
+
+        # Act
+        split = backend.sample_qasm(qasm_data, n_shots=3000, max_shots_per_job=1000)
+        bypassed = backend.sample_qasm(
+            qasm_data, n_shots=3000, max_shots_per_job=1000, bypass_dedup=True
+        )
+
+        # Assert: the split jobs are neither reused nor recorded for reuse
+        assert mock_post.call_count == 7
+        assert len({job.id for job in split.jobs + bypassed.jobs}) == 6
+        assert "id0" not in {job.id for job in split.jobs}
+        assert backend.sample_qasm(qasm_data, n_shots=1000).id == "id0"
+
+    def test_sample__max_shots_per_job_post_error(self, mocker):
+        # Arrange
+        def post_job(body):
+            if body.shots == 5000:
+                raise Exception("dummy error")
+            return InlineResponse201(f"id{body.shots}")
+
+        mocker.patch("quri_parts.riqu.rest.JobApi.post_job", side_effect=post_job)
+        mock_cancel = mocker.patch("quri_parts.riqu.rest.JobApi.put_jobs_job_id_cancel")
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        # Act
+        with pytest.raises(RiquBatchSubmissionError) as e:
+            backend.sample_qasm(
+                qasm_data, n_shots=25000, max_shots_per_job=10000, concurrency=1
+            )
+
+        # Assert: the jobs already posted are cancelled
+        assert [c.args[0] for c in mock_cancel.call_args_list] == [
+            "id10000",
+            "id10000",
+        ]
+        assert list(e.value.errors) == [2]
+        assert [r.id for r in e.value.results[:2]] == ["id10000", "id10000"]
+        with pytest.raises(ValueError):
+            backend.sample_qasm(
+                qasm_data, n_shots=25000, max_shots_per_job=10000, concurrency=0
+            )
+
+    def test_sample_many(self, mocker):
+        # Arrange
+        mock_post = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            side_effect=lambda body: InlineResponse201(f"id_{body.job_type}"),
+        )
+        mock_get = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        circuit = QuantumCircuit(2)
+        circuit.add_H_gate(0)
+        circuit.add_CNOT_gate(0, 1)
+
+        circuit2 = QuantumCircuit(3)
+        circuit2.add_H_gate(0)
+        circuit2.add_CNOT_gate(0, 1)
+        circuit2.add_RY_gate(2, 0.1)
+
+        # Act
+        jobs = backend.sample_many(
+            [circuit, [circuit, circuit2, circuit]], n_shots=10000, concurrency=2
+        )
+
+        # Assert
+        assert [job.id for job in jobs] == ["id_normal", "id_multi_manual"]
+        assert mock_post.call_count == 2
+        mock_post.assert_any_call(body=get_dummy_jobs_body(job_type="normal"))
+        mock_post.assert_any_call(
+            body=get_dummy_jobs_body(qasm=qasm_array_json, job_type="multi_manual")
+        )
+        mock_get.assert_not_called()
+        assert not jobs[0].loaded
+        assert jobs[0].status == "success"
+        mock_get.assert_called_once_with("id_normal")
+
+    def test_sample_qasm_many(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            side_effect=[InlineResponse201(f"id{i}") for i in range(10)],
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        # Act
+        jobs = backend.sample_qasm_many([qasm_data] * 10, n_shots=10000)
+
+        # Assert
+        assert sorted(job.id for job in jobs) == sorted(f"id{i}" for i in range(10))
+        assert all(type(job) is RiquSamplingJob for job in jobs)
+        assert jobs[0].result().counts == {0: 6000, 2: 4000}
+
+    def test_sample_qasm_many__order(self, mocker):
+        # Arrange
+        def post_job(body):
+            # reply in reverse order of submission
+            time.sleep(0.05 * (3 - int(body.qasm)))
+            return InlineResponse201(f"id{body.qasm}")
+
+        mocker.patch("quri_parts.riqu.rest.JobApi.post_job", side_effect=post_job)
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        # Act
+        jobs = backend.sample_qasm_many(["0", "1", "2"], n_shots=10, concurrency=3)
+
+        # Assert
+        assert [job.id for job in jobs] == ["id0", "id1", "id2"]
+
+    def test_sample_qasm_many__error(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            side_effect=[
+                InlineResponse201("id0"),
+                Exception(),
+                InlineResponse201("id2"),
+            ],
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        # Act & Assert
+        with pytest.raises(RiquBatchSubmissionError) as e:
+            backend.sample_qasm_many([qasm_data] * 3, n_shots=10000, concurrency=1)
+        assert list(e.value.errors) == [1]
+        assert [job.id if job else None for job in e.value.jobs] == [
+            "id0",
+            None,
+            "id2",
+        ]
+
+    def test_sample_qasm_many__return_exceptions(self, mocker):
+        # Arrange
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            side_effect=[Exception(), InlineResponse201("id1")],
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        # Act
+        results = backend.sample_qasm_many(
+            [qasm_data] * 2, n_shots=10000, concurrency=1, return_exceptions=True
+        )
+
+        # Assert
+        assert isinstance(results[0], BackendError)
+        assert results[1].id == "id1"
+
+    def test_sample_qasm_many__invalid_args(self):
+        backend = RiquSamplingBackend(get_dummy_config())
+        with pytest.raises(ValueError):
+            backend.sample_qasm_many([qasm_data], n_shots=0)
+        with pytest.raises(ValueError):
+            backend.sample_qasm_many([qasm_data], n_shots=10, concurrency=0)
+
+    def test_sample_parametric(self, mocker):
+        # Arrange
+        mock_post = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            return_value=InlineResponse201("dummy_id"),
+        )
+        mocker.patch(
+            "quri_parts.riqu.rest.JobApi.get_job", return_value=get_dummy_job()
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        circuit = UnboundParametricQuantumCircuit(2)
+        circuit.add_H_gate(0)
+        circuit.add_ParametricRY_gate(1)
+        params_list = [[0.1], [0.2]]
+
+        # Act
+        job = backend.sample_parametric(circuit, params_list, n_shots=10000)
+
+        # Assert
+        assert job.id == "dummy_id"
+        qasms = [
+            convert_to_qasm_str(circuit.bind_parameters(params))
+            for params in params_list
+        ]
+        mock_post.assert_called_once_with(
+            body=get_dummy_jobs_body(
+                qasm=json.dumps({"qasm": qasms}), job_type="multi_manual"
+            )
+        )
+        assert len(backend.qasm_cache) == 1
+
+    def test_sample_parametric__invalid_args(self):
+        backend = RiquSamplingBackend(get_dummy_config())
+        circuit = UnboundParametricQuantumCircuit(1)
+        circuit.add_ParametricRX_gate(0)
+        with pytest.raises(ValueError):
+            backend.sample_parametric(circuit, [], n_shots=10)
+        with pytest.raises(ValueError):
+            backend.sample_parametric(circuit, [[0.1, 0.2]], n_shots=10)
+
+    def test_sample_parametric_many(self, mocker):
+        # Arrange
+        mock_post = mocker.patch(
+            "quri_parts.riqu.rest.JobApi.post_job",
+            side_effect=lambda body: InlineResponse201(body.qasm[-13:]),
+        )
+        backend = RiquSamplingBackend(get_dummy_config())
+
+        circuit = UnboundParametricQuantumCircuit(1)
+        circuit.add_ParametricRZ_gate(0)
+
+        # Act
+        jobs = backend.sample_parametric_many(
+            circuit, [[0.1], [0.2], [0.3]], n_shots=10, concurrency=2
+        )
+
+        # Assert
+        assert [job.id for job in jobs] == [
+            "rz(0.1) q[0];",
+            "rz(0.2) q[0];",
+            "rz(0.3) q[0];",
+        ]
+        assert mock_post.call_count == 3
+
+
+@pytest.fixture
+def job_server(request):
+    """A local riqu server with one job which finishes at the third query.
+
+    Requests for some of the fields are rejected if the fixture is
+    parametrized with ``"reject"``, and answered with the whole job if it is
+    parametrized with ``"ignore"``. The status of the job is sent as its ETag, and
+    conditional requests are answered with 304 if the status is unchanged.
+    """
+    mode = getattr(request, "param", None)
+    job = {
+        "id": "id0",
+        "qasm": qasm_data,
+        "transpiled_qasm": qasm_data,
+        "transpiler": "normal",
+        "shots": 10,
+        "job_type": "normal",
+        "status": "processing",
+        "result": get_dummy_job().result,
+        "created": "2024-05-01T12:00:00Z",
+        "in_queue": "2024-05-01T12:00:01Z",
+        "remark": "",
+    }
+    queries = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            fields = parse_qs(url.query).get("fields")
+            if fields is not None and mode == "reject":
+                self.send_response(400)
+                body = b'{"reason": "unknown parameter"}'
+            else:
+                if len(queries) >= 2:
+                    job.update(status="success", ended="2024-05-01T12:00:09Z")
+                data = job
+                if fields is not None and mode != "ignore":
+                    data = {k: v for k, v in job.items() if k in fields[0].split(",")}
+                etag = '"%s"' % job["status"]
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    body = b""
+                else:
+                    self.send_response(200)
+                    body = json.dumps(data).encode("utf-8")
+                self.send_header("ETag", etag)
+            queries.append((url.path, fields, len(body)))
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    config = RiquConfig(f"http://127.0.0.1:{server.server_address[1]}", "token")
+    yield _create_job_api(config), queries
+    server.shutdown()
+    server.server_close()
+
+
+class TestRiquSamplingJobFields:
+    def test_wait_for_completion(self, job_server):
+        # Arrange
+        job_api, queries = job_server
+        job = RiquSamplingJob(Job(id="id0", status="queued"), job_api)
+
+        # Act
+        actual = job.wait_for_completion(wait=0, fields=JOB_STATUS_FIELDS)
+
+        # Assert
+        status_fields = [",".join(JOB_STATUS_FIELDS)]
+        assert [fields for _, fields, _ in queries] == [status_fields] * 3 + [None]
+        assert all(path == "/jobs/id0" for path, _, _ in queries)
+        assert queries[0][2] < queries[-1][2] - 2 * len(qasm_data)
+        assert actual.status == "success"
+        assert actual.qasm == qasm_data
+        assert job.result().counts == Counter({0: 6000, 2: 4000})
+
+    def test_refresh__lazy(self, job_server):
+        # Arrange
+        job_api, queries = job_server
+        job = RiquSamplingJob.from_job_id("id0", job_api)
+
+        # Act
+        job.refresh(fields=JOB_STATUS_FIELDS)
+
+        # Assert: the whole job is retrieved to load it
+        assert [fields for _, fields, _ in queries] == [None]
+        assert job.loaded
+        assert job.qasm == qasm_data
+        assert job.shots == 10
+
+    @pytest.mark.parametrize("job_server", ["ignore"], indirect=True)
+    def test_wait_for_completion__fields_ignored(self, job_server):
+        # Arrange
+        job_api, queries = job_server
+        job = RiquSamplingJob(Job(id="id0", status="queued"), job_api)
+
+        # Act
+        actual = job.wait_for_completion(wait=0, fields=JOB_STATUS_FIELDS)
+
+        # Assert: the whole job is not retrieved again at completion
+        status_fields = [",".join(JOB_STATUS_FIELDS)]
+        assert [fields for _, fields, _ in queries] == [status_fields] * 3
+        assert actual.status == "success"
+        assert actual.qasm == qasm_data
+
+    def test_refresh__merge(self, job_server):
+        # Arrange
+        job_api, queries = job_server
+        job = RiquSamplingJob.from_job_id("id0", job_api)
+        job.refresh()
+
+        # Act
+        job.refresh(fields=["in_queue"])
+
+        # Assert
+        assert queries[1][1] == ["id,status,in_queue"]
+        assert job.status == "processing"
+        assert job.qasm == qasm_data
+        assert job.created is not None
+
+    def test_refresh__not_modified(self, job_server):
+        # Arrange
+        job_api, queries = job_server
+        job = RiquSamplingJob.from_job_id("id0", job_api)
+        job.refresh()
+        before = job._job
+
+        # Act
+        job.refresh()
+
+        # Assert
+        assert [size > 0 for _, _, size in queries] == [True, False]
+        assert job._job == before
+        assert job.status == "processing"
+
+    @pytest.mark.parametrize("job_server", ["reject"], indirect=True)
+    def test_refresh__unsupported(self, job_server):
+        # Arrange
+        job_api, queries = job_server
+        job = RiquSamplingJob(Job(id="id0", status="queued"), job_api)
+
+        # Act
+        job.refresh(fields=JOB_STATUS_FIELDS)
+        job.refresh(fields=JOB_STATUS_FIELDS)
+
+        # Assert
+        # the server is asked for the fields only once
+        assert [fields for _, fields, _ in queries] == [
+            [",".join(JOB_STATUS_FIELDS)],
+            None,
+            None,
+        ]
+        assert job.qasm == qasm_data
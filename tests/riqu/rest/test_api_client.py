@@ -0,0 +1,309 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.pool import ThreadPool
+
+import pytest
+
+from quri_parts.riqu.rest import ApiClient, Configuration, JobApi
+from quri_parts.riqu.rest.rest import ApiException, RESTClientObject
+
+
+class TestApiClientPool:
+    def test_lazy_pool(self, mocker):
+        # Arrange
+        mock_pool = mocker.patch("quri_parts.riqu.rest.api_client.ThreadPool")
+
+        # Act
+        client = ApiClient(pool_threads=2)
+
+        # Assert
+        mock_pool.assert_not_called()
+        assert client.pool is client.pool
+        mock_pool.assert_called_once_with(2)
+
+    def test_async_req(self, mocker):
+        # Arrange
+        client = ApiClient(pool_threads=1)
+        mocker.patch.object(
+            client, "_ApiClient__call_api", return_value="dummy_response"
+        )
+
+        # Act
+        thread = client.call_api("/jobs", "GET", async_req=True)
+
+        # Assert
+        assert thread.get(timeout=5) == "dummy_response"
+        client.close()
+
+    def test_shared_pool(self):
+        # Arrange
+        pool = ThreadPool(1)
+        client1 = ApiClient(pool=pool)
+        client2 = ApiClient(pool=pool)
+
+        # Act
+        client1.close()
+        del client2
+
+        # Assert
+        assert client1.pool is pool
+        assert pool.apply_async(lambda: 1).get(timeout=5) == 1
+        pool.close()
+        pool.join()
+
+
+class TestRESTClientObjectTimeout:
+    def test_default_timeout(self, mocker):
+        # Arrange
+        configuration = Configuration()
+        configuration.connect_timeout = 5
+        configuration.read_timeout = 30
+        client = RESTClientObject(configuration)
+        mock_request = mocker.patch.object(client.pool_manager, "request")
+        mock_request.return_value.status = 200
+
+        # Act
+        client.request("GET", "https://dummy/jobs")
+        client.request("GET", "https://dummy/jobs", _request_timeout=(1, 2))
+
+        # Assert
+        default_timeout = mock_request.call_args_list[0].kwargs["timeout"]
+        assert default_timeout.connect_timeout == 5
+        assert default_timeout.read_timeout == 30
+        timeout = mock_request.call_args_list[1].kwargs["timeout"]
+        assert timeout.connect_timeout == 1
+        assert timeout.read_timeout == 2
+
+
+@pytest.fixture
+def flaky_server():
+    """A local server which answers each path with 503 and ``Retry-After: 0``
+    for the first request and with 200 afterwards."""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+            length = int(self.headers.get("Content-Length", 0))
+            self.rfile.read(length)
+            requests.append((self.command, self.path))
+            if len(requests) == 1:
+                self.send_response(503)
+                self.send_header("Retry-After", "0")
+                body = b""
+            else:
+                self.send_response(200)
+                body = b'{"job_id": "dummy_id"}'
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = _respond
+        do_POST = _respond
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", requests
+    server.shutdown()
+    server.server_close()
+
+
+def get_job_api(host: str, retries: int = 3) -> JobApi:
+    configuration = Configuration()
+    configuration.host = host
+    configuration.retries = retries
+    configuration.retry_backoff_factor = 0
+    return JobApi(api_client=ApiClient(configuration))
+
+
+class TestRESTClientObjectRetry:
+    def test_get(self, flaky_server):
+        # Arrange
+        host, requests = flaky_server
+        client = get_job_api(host).api_client.rest_client
+
+        # Act
+        response = client.request("GET", f"{host}/jobs/dummy_id")
+
+        # Assert
+        assert response.status == 200
+        assert requests == [("GET", "/jobs/dummy_id")] * 2
+
+    def test_get__disabled(self, flaky_server):
+        # Arrange
+        host, requests = flaky_server
+        client = get_job_api(host, retries=0).api_client.rest_client
+
+        # Act & Assert
+        with pytest.raises(ApiException) as e:
+            client.request("GET", f"{host}/jobs/dummy_id")
+        assert e.value.status == 503
+        assert len(requests) == 1
+
+    def test_post_job(self, flaky_server):
+        # Arrange
+        host, requests = flaky_server
+        job_api = get_job_api(host)
+
+        # Act & Assert
+        with pytest.raises(ApiException) as e:
+            job_api.post_job(body={"qasm": "dummy", "shots": 1})
+        assert e.value.status == 503
+        assert len(requests) == 1
+
+    def test_post_job__idempotency_key(self, flaky_server):
+        # Arrange
+        host, requests = flaky_server
+        job_api = get_job_api(host)
+
+        # Act
+        response = job_api.post_job(
+            body={"qasm": "dummy", "shots": 1}, idempotency_key="dummy_key"
+        )
+
+        # Assert
+        assert response.job_id == "dummy_id"
+        assert requests == [("POST", "/jobs")] * 2
+
+
+@pytest.fixture
+def versioned_server():
+    """A local server which answers GET /jobs/{job_id} with the current
+    version of the job, with the version as ETag and Last-Modified, and with
+    304 to conditional requests for the current version."""
+    state = {"version": 1}
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            etag = '"v%d"' % state["version"]
+            last_modified = "Wed, 01 May 2024 12:00:%02d GMT" % state["version"]
+            conditions = (
+                self.headers.get("If-None-Match"),
+                self.headers.get("If-Modified-Since"),
+            )
+            requests.append(conditions)
+            if etag in conditions or last_modified in conditions:
+                self.send_response(304)
+                body = b""
+            else:
+                self.send_response(200)
+                job_id = self.path.rsplit("/", 1)[-1]
+                body = json.dumps({"id": job_id, "status": "processing"}).encode()
+            if state.get("etag", True):
+                self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", state, requests
+    server.shutdown()
+    server.server_close()
+
+
+class TestApiClientConditionalGet:
+    def test_get_job(self, versioned_server):
+        # Arrange
+        host, state, requests = versioned_server
+        job_api = get_job_api(host)
+
+        # Act
+        first = job_api.get_job("id0")
+        not_modified = job_api.get_job("id0")
+        state["version"] = 2
+        modified = job_api.get_job("id0")
+        other = job_api.get_job("id1")
+
+        # Assert
+        assert not_modified is first
+        assert modified == first
+        assert other.id == "id1"
+        assert requests[0] == (None, None)
+        assert requests[1] == ('"v1"', "Wed, 01 May 2024 12:00:01 GMT")
+        assert requests[3] == (None, None)
+        assert job_api.api_client.last_response.status == 200
+
+    def test_get_job__last_modified(self, versioned_server):
+        # Arrange
+        host, state, requests = versioned_server
+        state["etag"] = False
+        job_api = get_job_api(host)
+
+        # Act
+        first = job_api.get_job("id0")
+        second = job_api.get_job("id0")
+
+        # Assert
+        assert second is first
+        assert requests[1] == (None, "Wed, 01 May 2024 12:00:01 GMT")
+
+    def test_get_job__disabled(self, versioned_server):
+        # Arrange
+        host, _, requests = versioned_server
+        job_api = get_job_api(host)
+        job_api.api_client.configuration.conditional_get = False
+
+        # Act
+        first = job_api.get_job("id0")
+        second = job_api.get_job("id0")
+
+        # Assert
+        assert second is not first
+        assert requests == [(None, None), (None, None)]
+
+    def test_get_job__maxsize(self, versioned_server):
+        # Arrange
+        host, _, requests = versioned_server
+        job_api = get_job_api(host)
+        job_api.api_client.configuration.conditional_get_maxsize = 1
+
+        # Act
+        job_api.get_job("id0")
+        job_api.get_job("id1")
+        job_api.get_job("id0")
+
+        # Assert
+        assert requests == [(None, None)] * 3
+
+    def test_get_job__max_bytes(self, versioned_server):
+        # Arrange
+        host, _, requests = versioned_server
+        job_api = get_job_api(host)
+        job_api.api_client.configuration.conditional_get_max_bytes = 60
+
+        # Act
+        job_api.get_job("id0")
+        job_api.get_job("id1")
+        job_api.get_job("id0")
+        job_api.get_job("id0")
+        job_api.api_client.configuration.conditional_get_max_bytes = 10
+        job_api.get_job("id1")
+        job_api.get_job("id1")
+
+        # Assert: each body is about 40 bytes, so only one is remembered
+        assert requests[2] == (None, None)
+        assert requests[3] == ('"v1"', "Wed, 01 May 2024 12:00:01 GMT")
+        assert requests[5] == (None, None)
@@ -0,0 +1,107 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+
+import pytest
+
+from quri_parts.riqu.rest import ApiClient, InlineResponse201, InlineResponse400, Job
+from quri_parts.riqu.rest.rest import ApiException
+
+
+class DummyResponse:
+    def __init__(self, data: object):
+        self.data = json.dumps(data)
+
+
+job_data = [
+    {
+        "id": "dummy_id",
+        "qasm": "OPENQASM 3;",
+        "transpiled_qasm": "OPENQASM 3;",
+        "transpiler": "normal",
+        "shots": 1000,
+        "job_type": "normal",
+        "status": "success",
+        "result": '{"counts": {"0": 1000}}',
+        "created": "2024-05-01T12:34:56.789012Z",
+        "in_queue": "2024-05-01T12:34:57+09:00",
+        "out_queue": "2024-05-01 12:34:58",
+        "ended": "",
+        "remark": "dummy_remark",
+    },
+    {"id": 1, "status": "queued", "shots": "10", "created": "May 1 2024 12:00"},
+    {},
+]
+
+
+def deserialize(data: object, response_type: str, fast_decoders: bool) -> object:
+    client = ApiClient(fast_decoders=fast_decoders)
+    return client.deserialize(DummyResponse(data), response_type)
+
+
+class TestModelDecoders:
+    @pytest.mark.parametrize("data", job_data)
+    def test_job(self, data):
+        # Act
+        expected = deserialize(data, "Job", fast_decoders=False)
+        actual = deserialize(data, "Job", fast_decoders=True)
+
+        # Assert
+        assert isinstance(actual, Job)
+        assert actual == expected
+        for attr in ["created", "in_queue", "out_queue", "ended"]:
+            assert getattr(actual, attr) == getattr(expected, attr)
+
+    def test_job__datetime(self):
+        # Act
+        job = deserialize(job_data[0], "Job", fast_decoders=True)
+
+        # Assert
+        assert job.created == datetime.datetime(
+            2024, 5, 1, 12, 34, 56, 789012, tzinfo=datetime.timezone.utc
+        )
+        assert job.in_queue.utcoffset() == datetime.timedelta(hours=9)
+        assert job.ended is None
+
+    def test_job__invalid_datetime(self):
+        with pytest.raises(ApiException):
+            deserialize({"created": "not a datetime"}, "Job", fast_decoders=True)
+
+    @pytest.mark.parametrize("fast_decoders", [False, True])
+    def test_job__invalid_status(self, fast_decoders):
+        with pytest.raises(ValueError):
+            deserialize({"status": "unknown"}, "Job", fast_decoders=fast_decoders)
+
+    def test_inline_responses(self):
+        # Act
+        response201 = deserialize({"job_id": "dummy_id"}, "InlineResponse201", True)
+        response400 = deserialize({"reason": "dummy"}, "InlineResponse400", True)
+
+        # Assert
+        assert response201 == InlineResponse201(job_id="dummy_id")
+        assert response400 == InlineResponse400(reason="dummy")
+
+    def test_not_a_dict(self):
+        # a body which is not an object is left to the generic deserialization
+        expected = deserialize("dummy", "Job", fast_decoders=False)
+        assert deserialize("dummy", "Job", fast_decoders=True) == expected
+
+    def test_disabled(self):
+        # Arrange
+        client = ApiClient(fast_decoders=False)
+
+        # Act
+        job = client.deserialize(DummyResponse(job_data[0]), "Job")
+
+        # Assert
+        assert client.model_decoders == {}
+        assert job.id == "dummy_id"
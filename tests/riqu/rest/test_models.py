@@ -0,0 +1,96 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import tracemalloc
+
+import pytest
+
+from quri_parts.riqu.rest import (
+    InlineResponse201,
+    InlineResponse400,
+    Job,
+    JobsBody,
+    SsejobsBody,
+)
+
+models = [
+    InlineResponse201(),
+    InlineResponse400(),
+    Job(),
+    JobsBody(qasm="dummy", shots=1),
+    SsejobsBody(),
+]
+
+
+class DictJob:
+    """Holds the same fields as :class:`Job` in a per-instance ``__dict__``,
+    as the models did before they were slotted."""
+
+    def __init__(self, **kwargs):
+        for attr in Job.swagger_types:
+            setattr(self, f"_{attr}", kwargs.get(attr))
+        self.discriminator = None
+
+
+def job_footprint(klass: type, n: int = 10000) -> float:
+    """Returns the average size in bytes of a job of ``klass``, excluding the
+    values shared by all the jobs."""
+    created = datetime.datetime(2024, 5, 1, 12, 34, 56)
+    kwargs = dict(
+        id="dummy_id",
+        qasm="OPENQASM 3;",
+        transpiler="normal",
+        shots=1000,
+        job_type="normal",
+        status="success",
+        result='{"counts": {"0": 1000}}',
+        created=created,
+        in_queue=created,
+        out_queue=created,
+        ended=created,
+        remark="dummy_remark",
+    )
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        jobs = [klass(**kwargs) for _ in range(n)]
+        size = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    assert len(jobs) == n
+    return size / n
+
+
+class TestModels:
+    @pytest.mark.parametrize("model", models)
+    def test_slots(self, model):
+        assert not hasattr(model, "__dict__")
+        assert set(model.to_dict()) == set(model.swagger_types)
+        with pytest.raises(AttributeError):
+            model.unknown = "dummy"
+
+    def test_eq(self):
+        assert Job(id="dummy_id", shots=10) == Job(id="dummy_id", shots=10)
+        assert Job(id="dummy_id", shots=10) != Job(id="dummy_id", shots=20)
+        assert Job(id="dummy_id") != InlineResponse201(job_id="dummy_id")
+        assert JobsBody(qasm="dummy", shots=1) == JobsBody(qasm="dummy", shots=1)
+
+    def test_memory_footprint(self):
+        # Act
+        slotted = job_footprint(Job)
+        with_dict = job_footprint(DictJob)
+
+        # Assert
+        # a slotted job takes a header and one pointer per field, i.e. about
+        # 150 bytes on 64-bit CPython, while a job with __dict__ also takes the
+        # dict (about 200 bytes in total on 3.11, and more on older versions)
+        assert slotted < 192
+        assert slotted < with_dict
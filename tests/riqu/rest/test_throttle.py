@@ -0,0 +1,119 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from quri_parts.riqu.rest import ApiClient, Configuration, RateLimit
+from quri_parts.riqu.rest.throttle import RequestThrottler, Throttle
+
+
+class TestRateLimit:
+    def test_init(self):
+        limit = RateLimit(rate=2.5)
+        assert limit.burst == 2.5
+        assert limit.max_in_flight is None
+        assert RateLimit(rate=0.5).burst == 1
+
+    def test_init_error(self):
+        with pytest.raises(ValueError):
+            RateLimit(rate=0)
+        with pytest.raises(ValueError):
+            RateLimit(rate=1, burst=0)
+        with pytest.raises(ValueError):
+            RateLimit(max_in_flight=0)
+
+
+class TestThrottle:
+    def test_rate(self):
+        # Arrange
+        throttle = Throttle(RateLimit(rate=50, burst=1))
+
+        # Act
+        start = time.monotonic()
+        for _ in range(6):
+            with throttle:
+                pass
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert elapsed >= 0.09
+        metrics = throttle.metrics
+        assert metrics.requests == 6
+        assert metrics.throttled == 5
+        assert metrics.throttled_seconds >= 0.09
+
+    def test_max_in_flight(self):
+        # Arrange
+        throttle = Throttle(RateLimit(max_in_flight=2))
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def request(_: int) -> None:
+            nonlocal in_flight, max_in_flight
+            with throttle:
+                with lock:
+                    in_flight += 1
+                    max_in_flight = max(max_in_flight, in_flight)
+                time.sleep(0.01)
+                with lock:
+                    in_flight -= 1
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(request, range(16)))
+
+        # Assert
+        assert max_in_flight == 2
+        assert throttle.metrics.requests == 16
+        assert throttle.metrics.throttled > 0
+
+
+class TestRequestThrottler:
+    def test_throttle(self):
+        # Arrange
+        throttler = RequestThrottler({"POST /jobs": RateLimit(rate=1)})
+
+        # Act & Assert
+        assert throttler.throttle("post", "/jobs") is not None
+        assert throttler.throttle("GET", "/jobs") is None
+        assert throttler.throttle("GET", "/jobs/{job_id}") is None
+        assert RequestThrottler().throttle("POST", "/jobs") is None
+
+    def test_call_api(self, mocker):
+        # Arrange
+        configuration = Configuration()
+        configuration.rate_limits = {
+            "GET /jobs/{job_id}": RateLimit(rate=50, burst=1, max_in_flight=1)
+        }
+        client = ApiClient(configuration)
+        mock_request = mocker.patch.object(client, "request")
+        mock_request.return_value.data = "{}"
+
+        # Act
+        for job_id in ["id0", "id1", "id2"]:
+            client.call_api(
+                "/jobs/{job_id}",
+                "GET",
+                path_params={"job_id": job_id},
+                _return_http_data_only=True,
+            )
+        client.call_api("/jobs", "POST", _return_http_data_only=True)
+
+        # Assert
+        assert mock_request.call_count == 4
+        metrics = client.throttle_metrics()
+        assert list(metrics) == ["GET /jobs/{job_id}"]
+        assert metrics["GET /jobs/{job_id}"].requests == 3
+        assert metrics["GET /jobs/{job_id}"].throttled == 2
@@ -0,0 +1,210 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import json
+import sys
+import time
+
+import pytest
+from quri_parts.backend import BackendError
+from quri_parts.circuit import QuantumCircuit
+from quri_parts.openqasm.circuit import convert_to_qasm_str
+
+from quri_parts.riqu import samplar
+from quri_parts.riqu.backend import RiquConfig, RiquPollingStrategy, RiquSamplingBackend
+from quri_parts.riqu.rest import Job
+from quri_parts.riqu.rest.models import InlineResponse201
+
+
+def get_circuit(n_qubits: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(n_qubits)
+    circuit.add_H_gate(0)
+    return circuit
+
+
+class MockJobApi:
+    """Counts ``n_qubits`` times ``shots`` on the first qubit of each job,
+    which finishes after ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.1, final_status: str = "success"):
+        self.delay = delay
+        self.final_status = final_status
+        self.posted: dict[str, tuple[float, list[int]]] = {}
+        self.bodies = []
+
+    def post_job(self, body):
+        job_id = f"id{len(self.posted)}"
+        if body.job_type == "multi_manual":
+            qasms = json.loads(body.qasm)["qasm"]
+        else:
+            qasms = [body.qasm]
+        counts = [
+            int(qasm.split("qubit[")[1].split("]")[0]) * body.shots for qasm in qasms
+        ]
+        self.posted[job_id] = (time.monotonic(), counts)
+        self.bodies.append(body)
+        return InlineResponse201(job_id)
+
+    def get_job(self, job_id):
+        posted, counts = self.posted[job_id]
+        if time.monotonic() - posted < self.delay:
+            return Job(id=job_id, status="processing")
+        result = {"counts": {"1": sum(counts)}, "properties": {}}
+        if self.bodies[int(job_id[2:])].job_type == "multi_manual":
+            result["divided_result"] = {
+                str(i): {"1": count} for i, count in enumerate(counts)
+            }
+        return Job(id=job_id, status=self.final_status, result=json.dumps(result))
+
+
+def get_backend(mocker, job_api: MockJobApi) -> RiquSamplingBackend:
+    mocker.patch("quri_parts.riqu.rest.JobApi.post_job", side_effect=job_api.post_job)
+    mocker.patch("quri_parts.riqu.rest.JobApi.get_job", side_effect=job_api.get_job)
+    return RiquSamplingBackend(
+        RiquConfig("dummy_url", "dummy_api_token"),
+        polling_strategy=RiquPollingStrategy.fixed(0.02),
+    )
+
+
+class TestCreateRiquConcurrentSampler:
+    def test_sampler(self, mocker):
+        # Arrange
+        job_api = MockJobApi(delay=0.2)
+        sampler = samplar.create_riqu_concurrent_sampler(
+            concurrency=4, backend=get_backend(mocker, job_api)
+        )
+        circuit_shots_tuples = [
+            (get_circuit(n_qubits), shots)
+            for n_qubits, shots in [(1, 100), (2, 200), (3, 100), (4, 300), (5, 200)]
+        ]
+
+        # Act
+        start = time.monotonic()
+        actual = list(sampler(circuit_shots_tuples))
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert actual == [{1: 100}, {1: 400}, {1: 300}, {1: 1200}, {1: 1000}]
+        assert len(job_api.posted) == 5
+        # the jobs are waited for together rather than one after another
+        assert elapsed < 5 * 0.2
+
+    def test_sampler__empty(self, mocker):
+        sampler = samplar.create_riqu_concurrent_sampler(
+            backend=get_backend(mocker, MockJobApi())
+        )
+        assert list(sampler([])) == []
+
+    def test_sampler__failure(self, mocker):
+        job_api = MockJobApi(delay=0.0, final_status="failure")
+        sampler = samplar.create_riqu_concurrent_sampler(
+            backend=get_backend(mocker, job_api)
+        )
+        with pytest.raises(BackendError):
+            sampler([(get_circuit(1), 100)])
+
+    def test_sampler__pack(self, mocker):
+        # Arrange
+        job_api = MockJobApi(delay=0.0)
+        sampler = samplar.create_riqu_concurrent_sampler(
+            concurrency=2,
+            backend=get_backend(mocker, job_api),
+            pack=True,
+            max_circuits_per_job=2,
+        )
+        circuit_shots_tuples = [
+            (get_circuit(n_qubits), shots)
+            for n_qubits, shots in [(1, 100), (2, 200), (3, 100), (4, 300), (5, 100)]
+        ]
+
+        # Act
+        actual = list(sampler(circuit_shots_tuples))
+
+        # Assert
+        assert actual == [{1: 100}, {1: 400}, {1: 300}, {1: 1200}, {1: 500}]
+        assert all(body.job_type == "multi_manual" for body in job_api.bodies)
+        assert sorted(
+            (body.shots, len(json.loads(body.qasm)["qasm"])) for body in job_api.bodies
+        ) == [(100, 1), (100, 2), (200, 1), (300, 1)]
+
+    def test_sampler__pack_payload(self, mocker):
+        # Arrange
+        job_api = MockJobApi(delay=0.0)
+        size = len(json.dumps({"qasm": [convert_to_qasm_str(get_circuit(1))]}))
+        sampler = samplar.create_riqu_concurrent_sampler(
+            backend=get_backend(mocker, job_api),
+            pack=True,
+            max_payload_bytes=size + 10,
+        )
+
+        # Act
+        actual = list(sampler([(get_circuit(1), 100), (get_circuit(2), 100)]))
+
+        # Assert
+        assert actual == [{1: 100}, {1: 200}]
+        assert len(job_api.bodies) == 2
+
+    def test_sampler__config(self, mocker):
+        # Arrange
+        job_api = MockJobApi(delay=0.0)
+        get_backend(mocker, job_api)
+        mock_backend = mocker.patch(
+            "quri_parts.riqu.samplar.RiquSamplingBackend", wraps=RiquSamplingBackend
+        )
+        config = RiquConfig("dummy_url", "dummy_api_token")
+
+        # Act
+        sampler = samplar.create_riqu_concurrent_sampler(config=config)
+        mock_backend.assert_not_called()
+        sampler([(get_circuit(1), 100)])
+        sampler([(get_circuit(2), 100)])
+
+        # Assert
+        mock_backend.assert_called_once_with(config)
+        assert len(job_api.posted) == 2
+
+    def test_init_error(self):
+        with pytest.raises(ValueError):
+            samplar.create_riqu_concurrent_sampler(
+                backend=RiquSamplingBackend(RiquConfig("url", "token")),
+                config=RiquConfig("url", "token"),
+            )
+        with pytest.raises(ValueError):
+            samplar.create_riqu_concurrent_sampler(pack=True, max_circuits_per_job=0)
+        with pytest.raises(ValueError):
+            samplar.create_riqu_concurrent_sampler(pack=True, max_payload_bytes=0)
+
+
+class TestDefaultBackend:
+    def test_import(self, monkeypatch, tmp_path):
+        # Arrange
+        monkeypatch.delenv("RIQU_URL", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.delitem(sys.modules, "quri_parts.riqu.samplar")
+
+        # Act
+        module = importlib.import_module("quri_parts.riqu.samplar")
+
+        # Assert
+        assert module._default_backend is None
+
+    def test_backend(self, monkeypatch, mocker):
+        # Arrange
+        monkeypatch.setenv("RIQU_URL", "dummy_url")
+        monkeypatch.setenv("RIQU_API_TOKEN", "dummy_api_token")
+        mocker.patch.object(samplar, "_default_backend", None)
+
+        # Act
+        backend = samplar.backend
+
+        # Assert
+        assert isinstance(backend, RiquSamplingBackend)
+        assert samplar.backend is backend